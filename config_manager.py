@@ -5,6 +5,7 @@ config.json 로드/저장 및 .env 환경변수 관리
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -14,6 +15,10 @@ def load_config(config_path: str = "./config.json") -> Dict[str, Any]:
     """
     config.json 로드, .env로 API 키 오버라이드
     
+    결과는 절대 경로 기준으로 캐시되어 같은 딕셔너리가 공유되므로, 수정할 때는 복사본을 사용한다.
+    ("./config.json"과 "config.json"은 같은 캐시 항목을 사용)
+    save_config() 또는 invalidate_config_cache() 호출 시 캐시가 초기화된다.
+    
     Args:
         config_path: config.json 파일 경로
     
@@ -24,6 +29,20 @@ def load_config(config_path: str = "./config.json") -> Dict[str, Any]:
         FileNotFoundError: config.json 파일이 없을 때
         json.JSONDecodeError: JSON 파싱 오류
     """
+    return _load_config(os.path.abspath(config_path))
+
+
+@lru_cache(maxsize=4)
+def _load_config(config_path: str) -> Dict[str, Any]:
+    """
+    load_config()의 캐시되는 본체
+    
+    Args:
+        config_path: 정규화된 config.json 절대 경로
+    
+    Returns:
+        설정 딕셔너리
+    """
     config_file = Path(config_path)
     
     # config.json이 없으면 기본 템플릿 생성
@@ -78,6 +97,7 @@ def save_config(config: Dict[str, Any], config_path: str = "./config.json") -> b
         with open(config_file, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
         
+        invalidate_config_cache()
         return True
     except Exception as e:
         print(f"설정 저장 실패: {e}")
@@ -98,7 +118,8 @@ def create_default_config(config_path: str = "./config.json") -> None:
             "api_base_url": "https://api.suno.ai",
             "model": "v3.5",
             "daily_limit": 60,
-            "timeout_seconds": 300
+            "timeout_seconds": 300,
+            "bitrate_kbps": 128
         },
         "image": {
             "provider": "openai",
@@ -150,19 +171,35 @@ def create_default_config(config_path: str = "./config.json") -> None:
     print(f"기본 설정 파일 생성: {config_path}")
 
 
+def invalidate_config_cache() -> None:
+    """
+    설정 캐시 초기화 (config.json을 외부에서 수정했거나 테스트에서 사용)
+    
+    기본 경로 캐시도 함께 비우므로, get_path()로 경로를 읽는 모듈은 다음 호출부터 새 값을 사용한다.
+    """
+    _load_config.cache_clear()
+    _get_default_path.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_default_path(key: str) -> str:
+    """기본 config.json 기준 경로 설정값 (캐시)"""
+    return load_config().get("paths", {}).get(key, "")
+
+
 def get_path(key: str, config: Optional[Dict[str, Any]] = None) -> str:
     """
     경로 설정값 반환
     
     Args:
         key: 경로 키 (예: 'music_folder')
-        config: 설정 딕셔너리 (None이면 자동 로드)
+        config: 설정 딕셔너리 (None이면 자동 로드, 결과 캐시)
     
     Returns:
         경로 문자열
     """
     if config is None:
-        config = load_config()
+        return _get_default_path(key)
     
     return config.get("paths", {}).get(key, "")
 
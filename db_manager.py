@@ -5,12 +5,38 @@ tracks.json, failed_tasks.json, checkpoint.json 관리
 
 import json
 import os
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, List, Optional, Any, Iterator
 from filelock import FileLock, Timeout
 
 
+@lru_cache(maxsize=None)
+def _track_id_pattern(prefix: str) -> "re.Pattern":
+    """"{prefix}_번호[_...]" 형식 트랙 ID 패턴 (접두사별 한 번만 컴파일)"""
+    return re.compile(rf"{re.escape(prefix)}_(\d+)(?:_|$)")
+
+
+# 통계 집계 대상 단계 / 상태
+_STAT_STAGES = ("music", "image", "video")
+_STAT_STATUSES = ("completed", "pending", "failed", "processing", "skipped")
+
+
+def _synchronized(method):
+    """인스턴스 잠금(self._lock)을 잡고 메서드 실행 (스레드 간 동시 변경 방지)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class TrackDB:
     """트랙 메타데이터 DB 관리 클래스"""
     
@@ -25,9 +51,40 @@ class TrackDB:
         self.lock_path = Path(str(db_path) + ".lock")
         self._data: Optional[Dict[str, Any]] = None
         
+        # 트랜잭션 상태 (중첩 깊이, 미저장 변경 여부)
+        self._tx_depth = 0
+        self._tx_dirty = False
+        
+        # 스레드 잠금 (create_batch 등 여러 스레드가 같은 인스턴스를 공유할 때)
+        self._lock = threading.RLock()
+        
         # DB 폴더 생성
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
     
+    @contextmanager
+    def transaction(self) -> Iterator["TrackDB"]:
+        """
+        여러 변경을 묶어 블록 종료 시 한 번만 저장
+        
+        블록 안에서 호출된 save()는 보류되고, 가장 바깥 블록이
+        끝날 때 변경 사항이 있으면 한 번 저장한다.
+        
+        블록이 끝날 때까지 잠금을 유지하므로 다른 스레드의 변경은 대기한다.
+        
+        Yields:
+            TrackDB 인스턴스 (self)
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self
+            finally:
+                self._tx_depth -= 1
+                if self._tx_depth == 0 and self._tx_dirty:
+                    self._tx_dirty = False
+                    self.save()
+    
+    @_synchronized
     def load(self) -> Dict[str, Any]:
         """
         DB 로드, 없으면 빈 구조 생성
@@ -72,6 +129,7 @@ class TrackDB:
         
         return self._data
     
+    @_synchronized
     def save(self) -> bool:
         """
         DB 저장 (자동 백업 포함)
@@ -82,6 +140,11 @@ class TrackDB:
         if self._data is None:
             self.load()
         
+        # 트랜잭션 중에는 저장을 보류
+        if self._tx_depth > 0:
+            self._tx_dirty = True
+            return True
+        
         try:
             # 백업 생성
             if self.db_path.exists():
@@ -101,6 +164,15 @@ class TrackDB:
             print(f"DB 저장 실패: {e}")
             return False
     
+    @_synchronized
+    def close(self) -> None:
+        """
+        메모리 캐시 해제 (다음 사용 시 파일에서 다시 로드)
+        
+        파일은 작업마다 열고 닫으므로 별도로 닫을 연결은 없다.
+        """
+        self._data = None
+    
     def _backup_file(self) -> None:
         """DB 파일 백업"""
         if not self.db_path.exists():
@@ -126,6 +198,28 @@ class TrackDB:
         data = self.load()
         return data.get("tracks", {}).get(track_id)
     
+    @_synchronized
+    def next_track_id(self, prefix: str = "track") -> str:
+        """
+        다음 트랙 ID 계산 (DB의 "{prefix}_번호" 최대값 + 1)
+        
+        Args:
+            prefix: 트랙 ID 접두사
+        
+        Returns:
+            트랙 ID (예: track_001)
+        """
+        data = self.load()
+        match = _track_id_pattern(prefix).match
+        
+        max_num = max(
+            (int(m.group(1)) for m in map(match, data.get("tracks", {})) if m),
+            default=0
+        )
+        
+        return f"{prefix}_{max_num + 1:03d}"
+    
+    @_synchronized
     def get_all_tracks(self) -> List[Dict[str, Any]]:
         """
         전체 트랙 목록
@@ -137,6 +231,7 @@ class TrackDB:
         tracks = data.get("tracks", {})
         return [track for track in tracks.values()]
     
+    @_synchronized
     def add_track(self, track_id: str, initial_data: Optional[Dict[str, Any]] = None) -> bool:
         """
         새 트랙 추가
@@ -195,6 +290,25 @@ class TrackDB:
         self._data = data
         return self.save()
     
+    @_synchronized
+    def add_tracks_bulk(self, tracks: Dict[str, Optional[Dict[str, Any]]]) -> int:
+        """
+        여러 트랙을 한 번에 추가 (저장은 한 번만 수행)
+        
+        Args:
+            tracks: {track_id: initial_data} 딕셔너리 (initial_data는 None 가능)
+        
+        Returns:
+            추가된 트랙 수 (이미 존재하는 트랙은 제외)
+        """
+        added = 0
+        with self.transaction():
+            for track_id, initial_data in tracks.items():
+                if self.add_track(track_id, initial_data):
+                    added += 1
+        return added
+    
+    @_synchronized
     def update_track(self, track_id: str, updates: Dict[str, Any]) -> bool:
         """
         트랙 정보 업데이트
@@ -224,6 +338,25 @@ class TrackDB:
         self._data = data
         return self.save()
     
+    @_synchronized
+    def bulk_update(self, updates_by_id: Dict[str, Dict[str, Any]]) -> int:
+        """
+        여러 트랙을 한 번에 업데이트 (저장은 한 번만 수행)
+        
+        Args:
+            updates_by_id: {track_id: updates} 딕셔너리
+        
+        Returns:
+            업데이트된 트랙 수 (존재하지 않는 트랙은 제외)
+        """
+        updated = 0
+        with self.transaction():
+            for track_id, updates in updates_by_id.items():
+                if self.update_track(track_id, updates):
+                    updated += 1
+        return updated
+    
+    @_synchronized
     def update_status(self, track_id: str, stage: str, status: str) -> bool:
         """
         상태만 빠르게 업데이트 (stage: music/image/video)
@@ -251,6 +384,7 @@ class TrackDB:
         self._data = data
         return self.save()
     
+    @_synchronized
     def delete_track(self, track_id: str) -> bool:
         """
         트랙 삭제
@@ -270,6 +404,7 @@ class TrackDB:
         self._data = data
         return self.save()
     
+    @_synchronized
     def get_tracks_by_status(self, stage: str, status: str) -> List[Dict[str, Any]]:
         """
         특정 상태의 트랙들 조회
@@ -287,6 +422,44 @@ class TrackDB:
             if track.get(stage, {}).get("status") == status
         ]
     
+    @_synchronized
+    def query(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 트랙 조회 (필터를 DB 계층에서 한 번의 순회로 처리)
+        
+        Args:
+            filters: {"단계.필드": 값} 딕셔너리 (모든 조건 AND)
+                     예: {"image.status": "completed", "video.status": ("pending", "failed")}
+                     값이 tuple/list/set이면 포함 여부, 그 외는 일치 여부로 비교
+        
+        Returns:
+            트랙 리스트 (DB 저장 순서)
+        """
+        data = self.load()
+        
+        # 조건을 미리 분해 (트랙마다 경로 문자열을 다시 파싱하지 않음)
+        conditions = []
+        for path, expected in filters.items():
+            stage, _, field = path.partition(".")
+            if isinstance(expected, (tuple, list, set, frozenset)):
+                conditions.append((stage, field, frozenset(expected), True))
+            else:
+                conditions.append((stage, field, expected, False))
+        
+        results = []
+        for track in data.get("tracks", {}).values():
+            for stage, field, expected, is_set in conditions:
+                value = track.get(stage)
+                if field:
+                    value = (value or {}).get(field)
+                if (value not in expected) if is_set else (value != expected):
+                    break
+            else:
+                results.append(track)
+        
+        return results
+    
+    @_synchronized
     def add_error_log(self, track_id: str, stage: str, error_message: str) -> bool:
         """
         에러 로그 추가
@@ -337,6 +510,7 @@ class TrackDB:
             return []
         return track.get("error_log", [])
     
+    @_synchronized
     def clear_error_log(self, track_id: str) -> bool:
         """
         에러 로그 초기화
@@ -349,6 +523,38 @@ class TrackDB:
         """
         return self.update_track(track_id, {"error_log": []})
     
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """
+        DB 메타데이터 값 조회 (스캔 워터마크 등)
+        
+        Args:
+            key: 메타데이터 키
+            default: 값이 없을 때 반환값
+        
+        Returns:
+            저장된 값 또는 default
+        """
+        data = self.load()
+        return data.get("metadata", {}).get(key, default)
+    
+    @_synchronized
+    def set_meta(self, key: str, value: Any) -> bool:
+        """
+        DB 메타데이터 값 저장
+        
+        Args:
+            key: 메타데이터 키
+            value: JSON 직렬화 가능한 값
+        
+        Returns:
+            성공 여부
+        """
+        data = self.load()
+        data.setdefault("metadata", {})[key] = value
+        self._data = data
+        return self.save()
+    
+    @_synchronized
     def get_statistics(self) -> Dict[str, Any]:
         """
         대시보드용 통계 데이터 제공
@@ -357,28 +563,29 @@ class TrackDB:
             통계 딕셔너리
         """
         all_tracks = self.get_all_tracks()
-        total_tracks = len(all_tracks)
-        
-        stats = {
-            "total_tracks": total_tracks,
-            "music": {"completed": 0, "pending": 0, "failed": 0, "processing": 0, "skipped": 0},
-            "image": {"completed": 0, "pending": 0, "failed": 0, "processing": 0, "skipped": 0},
-            "video": {"completed": 0, "pending": 0, "failed": 0, "processing": 0, "skipped": 0},
-            "fully_completed": 0
-        }
         
+        # (단계, 상태)별 카운트를 한 번의 순회로 집계
+        counts: Counter = Counter()
         for track in all_tracks:
-            # 각 단계별 상태 카운트
-            for stage in ["music", "image", "video"]:
-                status = track.get(stage, {}).get("status", "pending")
-                if status in stats[stage]:
-                    stats[stage][status] += 1
-            
-            # 완전히 완료된 트랙 카운트
-            if (track.get("music", {}).get("status") == "completed" and
-                track.get("image", {}).get("status") == "completed" and
-                track.get("video", {}).get("status") == "completed"):
-                stats["fully_completed"] += 1
+            statuses = tuple(track.get(stage, {}).get("status") for stage in _STAT_STAGES)
+            counts.update(zip(_STAT_STAGES, statuses))
+            if statuses == ("completed", "completed", "completed"):
+                counts["fully_completed"] += 1
+        
+        stats: Dict[str, Any] = {"total_tracks": len(all_tracks)}
+        for stage in _STAT_STAGES:
+            # 상태가 없는 항목은 대기로 집계
+            stage_counts = {status: counts[(stage, status)] for status in _STAT_STATUSES}
+            stage_counts["pending"] += counts[(stage, None)]
+            # 진행률 분모 (완료 + 대기)
+            stage_counts["target"] = stage_counts["completed"] + stage_counts["pending"]
+            stats[stage] = stage_counts
+        
+        stats["fully_completed"] = counts["fully_completed"]
+        
+        # UI에서 목록 없이 표시하는 작업 대상 수 (handle_get_track_list 필터와 동일 기준)
+        stats["need_image_count"] = counts[("image", "pending")]
+        stats["need_video_count"] = counts[("video", "pending")]
         
         return stats
 
@@ -442,6 +649,10 @@ class FailedTasksDB:
             print(f"Failed tasks DB 저장 실패: {e}")
             return False
     
+    def close(self) -> None:
+        """메모리 캐시 해제 (다음 사용 시 파일에서 다시 로드)"""
+        self._data = None
+    
     def add_failed_task(self, track_id: str, stage: str, error: str, retry_count: int = 0) -> bool:
         """
         실패 작업 추가
@@ -480,15 +691,69 @@ class FailedTasksDB:
         self._data = data
         return self.save()
     
-    def get_failed_tasks(self) -> List[Dict[str, Any]]:
+    def get_failed_tasks(
+        self,
+        stage: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         실패 작업 목록 조회
         
+        Args:
+            stage: 특정 단계만 조회, None이면 전체
+            limit: 최대 반환 개수, None이면 전체
+        
         Returns:
             실패 작업 리스트
         """
         data = self.load()
-        return data.get("failed_tasks", [])
+        failed_tasks = data.get("failed_tasks", [])
+        
+        if stage is None and limit is None:
+            return failed_tasks
+        
+        matched = (
+            task for task in failed_tasks
+            if stage is None or task.get("stage") == stage
+        )
+        return list(islice(matched, limit))
+    
+    def count_failed_tasks(self, stage: Optional[str] = None) -> int:
+        """
+        실패 작업 개수 조회 (목록 생성 없이 집계)
+        
+        Args:
+            stage: 특정 단계만 집계, None이면 전체
+        
+        Returns:
+            실패 작업 수
+        """
+        failed_tasks = self.load().get("failed_tasks", [])
+        if stage is None:
+            return len(failed_tasks)
+        return sum(1 for task in failed_tasks if task.get("stage") == stage)
+    
+    def update_failed_task(self, track_id: str, stage: str, **fields: Any) -> bool:
+        """
+        실패 작업 정보 갱신 (재시도 결과 기록)
+        
+        Args:
+            track_id: 트랙 ID
+            stage: 단계
+            **fields: 갱신할 필드 (error_message, retry_count, last_attempted_at 등)
+        
+        Returns:
+            성공 여부 (해당 작업이 없으면 False)
+        """
+        data = self.load()
+        
+        for task in data.get("failed_tasks", []):
+            if task.get("track_id") == track_id and task.get("stage") == stage:
+                task.update(fields)
+                self._data = data
+                return self.save()
+        
+        return False
     
     def remove_failed_task(self, track_id: str, stage: str) -> bool:
         """
@@ -286,11 +286,13 @@ class ImageGenerator:
                     image = image.convert("RGB")
                 
                 save_path_obj = save_path_obj.with_suffix('.jpg')
-                image.save(save_path_obj, "JPEG", quality=95)
+                save_format, save_kwargs = "JPEG", {"quality": 95}
             else:
                 # PNG 저장
                 save_path_obj = save_path_obj.with_suffix('.png')
-                image.save(save_path_obj, "PNG")
+                save_format, save_kwargs = "PNG", {}
+            
+            image.save(save_path_obj, save_format, **save_kwargs)
             
             self.logger.info(f"이미지 저장 완료: {save_path_obj}")
             return True
@@ -4,6 +4,7 @@
 """
 
 import os
+import threading
 import time
 import argparse
 from pathlib import Path
@@ -20,6 +21,21 @@ from metadata import update_all_metadata
 from logger import setup_logger
 
 
+# CLI 인자 중 파이프라인 옵션으로 전달할 키
+PIPELINE_OPTION_KEYS = frozenset({"style", "quality", "force", "limit", "metadata_executor"})
+
+# 실패 작업 최대 재시도 횟수 기본값 (config의 pipeline.auto_retry_count로 변경 가능)
+MAX_RETRIES = 3
+
+
+class PipelineCancelled(BaseException):
+    """
+    취소 이벤트로 파이프라인 중단
+    
+    배치 루프의 트랙별 except Exception에 잡히지 않도록 BaseException을 상속한다.
+    """
+
+
 class Pipeline:
     """전체 파이프라인 오케스트레이터"""
     
@@ -45,6 +61,12 @@ class Pipeline:
         # 진행 콜백
         self.progress_callback: Optional[Callable] = None
         
+        # 취소 이벤트 (설정되면 단계 사이/진행 보고 시점에 중단)
+        self.cancel_event: Optional[threading.Event] = None
+        
+        # 실행 단위로 공유하는 실패 작업 스냅샷 (변경 시 무효화)
+        self._failed_snapshot: Optional[List[Dict[str, Any]]] = None
+        
         # 환경 체크
         self._check_environment()
     
@@ -66,6 +88,25 @@ class Pipeline:
         """
         self.progress_callback = callback
     
+    def set_cancel_event(self, event: Optional[threading.Event]) -> None:
+        """
+        취소 이벤트 설정
+        
+        Args:
+            event: 다른 스레드에서 set()하면 실행을 중단하는 이벤트 (None이면 해제)
+        """
+        self.cancel_event = event
+    
+    def _check_cancelled(self) -> None:
+        """
+        취소 요청 확인
+        
+        Raises:
+            PipelineCancelled: 취소 이벤트가 설정된 경우
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise PipelineCancelled("사용자 취소")
+    
     def _report_progress(
         self,
         stage: str,
@@ -83,7 +124,12 @@ class Pipeline:
             total: 전체 수
             track_id: 현재 처리 중인 트랙 ID
             message: 추가 메시지
+        
+        Raises:
+            PipelineCancelled: 취소 이벤트가 설정된 경우
         """
+        self._check_cancelled()
+        
         if self.progress_callback:
             elapsed = time.time() - getattr(self, '_start_time', time.time())
             eta = self._calculate_eta(current, total, elapsed)
@@ -129,6 +175,21 @@ class Pipeline:
         """정상 완료 시 checkpoint 삭제"""
         self.checkpoint_db.clear_checkpoint()
     
+    def _get_failed_snapshot(self) -> List[Dict[str, Any]]:
+        """
+        실패 작업 스냅샷 반환 (없으면 DB에서 한 번 조회)
+        
+        Returns:
+            실패 작업 리스트
+        """
+        if self._failed_snapshot is None:
+            self._failed_snapshot = list(self.failed_db.get_failed_tasks())
+        return self._failed_snapshot
+    
+    def _invalidate_failed_snapshot(self) -> None:
+        """실패 작업 스냅샷 무효화 (실패 작업 추가/제거 시 호출)"""
+        self._failed_snapshot = None
+    
     def has_incomplete_run(self) -> bool:
         """미완료 실행이 있는지 확인"""
         return self.checkpoint_db.has_checkpoint()
@@ -158,6 +219,7 @@ class Pipeline:
         track = self.db.get_track(track_id)
         retry_count = track.get("retry_count", 0) if track else 0
         self.failed_db.add_failed_task(track_id, stage, error_msg, retry_count)
+        self._invalidate_failed_snapshot()
     
     def run(
         self,
@@ -174,7 +236,8 @@ class Pipeline:
                 "force": False,           # 기존 결과물 무시
                 "limit": None,            # 처리 개수 제한
                 "style": "default",       # 이미지 스타일
-                "auto_resume": False      # 자동 재개 (CLI용)
+                "auto_resume": False,     # 자동 재개 (CLI용)
+                "metadata_executor": None # 메타데이터 분석 실행기 (None이면 thread)
             }
         
         Returns:
@@ -185,6 +248,7 @@ class Pipeline:
         
         self._start_time = time.time()
         started_at = datetime.now().isoformat()
+        self._invalidate_failed_snapshot()
         
         # 미완료 작업 확인
         if self.has_incomplete_run() and not options.get("auto_resume", False):
@@ -222,7 +286,9 @@ class Pipeline:
             
             # 메타데이터 업데이트
             self.logger.info("메타데이터 업데이트 중...")
-            metadata_result = update_all_metadata(self.db)
+            metadata_result = update_all_metadata(
+                self.db, executor=options.get("metadata_executor")
+            )
             stages_result["scan"]["metadata_updated"] = metadata_result.get("updated", 0)
             
             # 스캔 완료 checkpoint 저장
@@ -231,6 +297,7 @@ class Pipeline:
             self._save_checkpoint("scan", "", track_ids, [])
             
             # 2. 음악 생성 단계 (옵션)
+            self._check_cancelled()
             if not options.get("skip_music", False):
                 self.logger.info("=" * 60)
                 self.logger.info("2. 음악 생성 단계 시작")
@@ -247,6 +314,7 @@ class Pipeline:
                 stages_result["music"] = {"generated": 0, "skipped": 0, "failed": 0}
             
             # 3. 이미지 생성 단계
+            self._check_cancelled()
             if not options.get("skip_images", False):
                 self.logger.info("=" * 60)
                 self.logger.info("3. 이미지 생성 단계 시작")
@@ -308,6 +376,7 @@ class Pipeline:
                 stages_result["images"] = {"generated": 0, "skipped": 0, "failed": 0}
             
             # 4. 영상 렌더링 단계
+            self._check_cancelled()
             if not options.get("skip_videos", False):
                 self.logger.info("=" * 60)
                 self.logger.info("4. 영상 렌더링 단계 시작")
@@ -382,7 +451,7 @@ class Pipeline:
             summary = {
                 "fully_completed": stats["fully_completed"],
                 "pending": stats["total_tracks"] - stats["fully_completed"],
-                "failed": len(self.failed_db.get_failed_tasks())
+                "failed": len(self._get_failed_snapshot())
             }
             
             result = {
@@ -395,7 +464,7 @@ class Pipeline:
             }
             
             # 리포트 생성 및 출력
-            report = self._generate_report(result)
+            report = self._generate_report(result, snapshot=self._get_failed_snapshot())
             self._print_report(report)
             self._save_report(report)
             
@@ -404,7 +473,7 @@ class Pipeline:
             
             return result
         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, PipelineCancelled):
             self.logger.warning("사용자에 의해 중단됨")
             # 현재 상태를 checkpoint로 저장
             try:
@@ -474,6 +543,7 @@ class Pipeline:
         
         self._start_time = time.time()
         started_at = datetime.now().isoformat()
+        self._invalidate_failed_snapshot()
         stages_result = {}
         
         try:
@@ -654,7 +724,7 @@ class Pipeline:
             summary = {
                 "fully_completed": stats["fully_completed"],
                 "pending": stats["total_tracks"] - stats["fully_completed"],
-                "failed": len(self.failed_db.get_failed_tasks())
+                "failed": len(self._get_failed_snapshot())
             }
             
             result = {
@@ -667,7 +737,7 @@ class Pipeline:
                 "resumed": True
             }
             
-            report = self._generate_report(result)
+            report = self._generate_report(result, snapshot=self._get_failed_snapshot())
             self._print_report(report)
             self._save_report(report)
             
@@ -676,6 +746,15 @@ class Pipeline:
             
             return result
         
+        except PipelineCancelled:
+            # 진행 중 저장된 checkpoint를 그대로 두어 다시 재개할 수 있게 함
+            self.logger.warning("사용자에 의해 중단됨")
+            return {
+                "success": False,
+                "error": "사용자 중단",
+                "interrupted": True,
+                "stages": stages_result
+            }
         except Exception as e:
             self.logger.error(f"재개 실패: {e}", exc_info=True)
             return {
@@ -700,6 +779,7 @@ class Pipeline:
         
         self._start_time = time.time()
         started_at = datetime.now().isoformat()
+        self._invalidate_failed_snapshot()
         
         try:
             if stage == "scan":
@@ -792,20 +872,25 @@ class Pipeline:
             "message": "Suno API 연동 필요"
         }
     
-    def retry_failed_tasks(self, stage: Optional[str] = None) -> Dict[str, Any]:
+    def retry_failed_tasks(
+        self,
+        stage: Optional[str] = None,
+        snapshot: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         실패한 작업 재시도
         
         Args:
             stage: 특정 단계만 재시도, None이면 전체
+            snapshot: 이미 조회한 실패 작업 목록 (None이면 DB에서 조회)
         
         Returns:
             재시도 결과
         """
-        failed_tasks = self.failed_db.get_failed_tasks()
-        
-        if stage:
-            failed_tasks = [t for t in failed_tasks if t.get("stage") == stage]
+        if snapshot is not None:
+            failed_tasks = [t for t in snapshot if stage is None or t.get("stage") == stage]
+        else:
+            failed_tasks = self.failed_db.get_failed_tasks(stage=stage)
         
         if not failed_tasks:
             return {
@@ -817,12 +902,45 @@ class Pipeline:
         
         self.logger.info(f"실패 작업 재시도 시작: {len(failed_tasks)}개")
         
+        pipeline_config = self.config.get("pipeline", {})
+        max_retries = pipeline_config.get("auto_retry_count", MAX_RETRIES)
+        
         retried = 0
+        skipped = 0
         results = []
+        now = datetime.now()
         
         for task in failed_tasks:
             track_id = task["track_id"]
             task_stage = task["stage"]
+            retry_count = task.get("retry_count", 0)
+            
+            # 최대 재시도 횟수 초과 작업은 건너뜀
+            if retry_count >= max_retries:
+                skipped += 1
+                results.append({
+                    "track_id": track_id,
+                    "stage": task_stage,
+                    "success": False,
+                    "skipped": True,
+                    "error": f"최대 재시도 횟수 초과 ({retry_count}/{max_retries})"
+                })
+                continue
+            
+            # 지수 백오프 대기 시간이 지나지 않은 작업은 건너뜀
+            last_attempted_at = task.get("last_attempted_at")
+            if last_attempted_at:
+                elapsed = (now - datetime.fromisoformat(last_attempted_at)).total_seconds()
+                if elapsed < self._retry_backoff_seconds(retry_count):
+                    skipped += 1
+                    results.append({
+                        "track_id": track_id,
+                        "stage": task_stage,
+                        "success": False,
+                        "skipped": True,
+                        "error": "재시도 대기 중 (백오프)"
+                    })
+                    continue
             
             try:
                 # stage 이름 정규화 (image/images 일관성)
@@ -830,14 +948,17 @@ class Pipeline:
                 
                 if normalized_stage == "image":
                     result = self.image_gen.generate_for_track(track_id, self.db, style="default", force=True)
-                    if result["success"]:
-                        self.failed_db.remove_failed_task(track_id, task_stage)
-                        retried += 1
                 elif normalized_stage == "video":
                     result = self.video_renderer.render_for_track(track_id, self.db, options={"force": True})
-                    if result["success"]:
-                        self.failed_db.remove_failed_task(track_id, task_stage)
-                        retried += 1
+                else:
+                    result = {"success": False, "error": f"재시도를 지원하지 않는 단계: {task_stage}"}
+                
+                if result.get("success"):
+                    self.failed_db.remove_failed_task(track_id, task_stage)
+                    self._invalidate_failed_snapshot()
+                    retried += 1
+                else:
+                    self._record_retry_failure(track_id, task_stage, result.get("error") or "알 수 없는 오류", retry_count)
                 
                 results.append({
                     "track_id": track_id,
@@ -846,6 +967,7 @@ class Pipeline:
                 })
             except Exception as e:
                 self.logger.error(f"재시도 실패 ({track_id}, {task_stage}): {e}")
+                self._record_retry_failure(track_id, task_stage, str(e), retry_count)
                 results.append({
                     "track_id": track_id,
                     "stage": task_stage,
@@ -857,12 +979,66 @@ class Pipeline:
             "success": True,
             "total": len(failed_tasks),
             "retried": retried,
+            "skipped": skipped,
             "results": results
         }
     
-    def get_failed_summary(self) -> Dict[str, Any]:
-        """실패 작업 요약"""
-        failed_tasks = self.failed_db.get_failed_tasks()
+    def _retry_backoff_seconds(self, retry_count: int) -> float:
+        """
+        재시도 횟수에 따른 백오프 대기 시간(초)
+        
+        Args:
+            retry_count: 지금까지의 재시도 횟수
+        
+        Returns:
+            대기 시간(초)
+        """
+        pipeline_config = self.config.get("pipeline", {})
+        delay = pipeline_config.get("retry_delay_seconds", 2)
+        multiplier = pipeline_config.get("retry_backoff_multiplier", 2)
+        return delay * (multiplier ** retry_count)
+    
+    def _record_retry_failure(
+        self,
+        track_id: str,
+        stage: str,
+        error_msg: str,
+        retry_count: int
+    ) -> None:
+        """
+        재시도 실패를 실패 작업 DB에 기록
+        
+        Args:
+            track_id: 트랙 ID
+            stage: 단계
+            error_msg: 에러 메시지
+            retry_count: 이번 시도 전 재시도 횟수
+        """
+        self.failed_db.update_failed_task(
+            track_id,
+            stage,
+            error_message=error_msg,
+            retry_count=retry_count + 1,
+            last_attempted_at=datetime.now().isoformat()
+        )
+        self._invalidate_failed_snapshot()
+    
+    def get_failed_summary(self, snapshot: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        실패 작업 요약
+        
+        Args:
+            snapshot: 이미 조회한 실패 작업 목록 (None이면 파일에서 새로 조회)
+        
+        Returns:
+            {"total": 전체 수, "by_stage": 단계별 수}
+        """
+        if snapshot is not None:
+            failed_tasks = snapshot
+        else:
+            # 실행 밖(--status 등)에서는 다른 인스턴스의 변경을 반영하도록 파일에서 다시 로드
+            self.failed_db.close()
+            failed_tasks = self.failed_db.get_failed_tasks()
         
         summary = {
             "total": len(failed_tasks),
@@ -877,12 +1053,17 @@ class Pipeline:
         
         return summary
     
-    def _generate_report(self, result: Dict[str, Any]) -> str:
+    def _generate_report(
+        self,
+        result: Dict[str, Any],
+        snapshot: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """
         실행 리포트 생성
         
         Args:
             result: 실행 결과 딕셔너리
+            snapshot: 이미 조회한 실패 작업 목록 (None이면 DB에서 조회)
         
         Returns:
             포맷된 리포트 문자열
@@ -945,13 +1126,18 @@ class Pipeline:
         lines.append("")
         
         # 실패 목록
-        failed_tasks = self.failed_db.get_failed_tasks()
+        if snapshot is not None:
+            failed_tasks = snapshot[:10]  # 최대 10개만 표시
+            failed_total = len(snapshot)
+        else:
+            failed_tasks = self.failed_db.get_failed_tasks(limit=10)
+            failed_total = self.failed_db.count_failed_tasks() if failed_tasks else 0
         if failed_tasks:
             lines.append("⚠️ 실패 목록")
-            for task in failed_tasks[:10]:  # 최대 10개만 표시
+            for task in failed_tasks:
                 lines.append(f"   - {task['track_id']}: {task['stage']} 실패 ({task.get('error_message', 'N/A')[:50]})")
-            if len(failed_tasks) > 10:
-                lines.append(f"   ... 외 {len(failed_tasks) - 10}개")
+            if failed_total > 10:
+                lines.append(f"   ... 외 {failed_total - 10}개")
         lines.append("=" * 60)
         
         return "\n".join(lines)
@@ -972,7 +1158,7 @@ class Pipeline:
             저장된 파일 경로
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
             filename = f"pipeline_report_{timestamp}.txt"
         
         log_folder = Path(self.config.get("paths", {}).get("log_folder", "./logs"))
@@ -1001,6 +1187,10 @@ if __name__ == "__main__":
     parser.add_argument("--force", action="store_true", help="기존 결과물 무시하고 재생성")
     parser.add_argument("--limit", type=int, help="처리 개수 제한")
     parser.add_argument("--quality", type=str, default="normal", help="영상 품질 (fast/normal/high)")
+    parser.add_argument(
+        "--metadata-executor", type=str, choices=["process", "thread", "none"],
+        help="메타데이터 분석 병렬 실행 방식 (기본값: thread)"
+    )
     
     # 재시도 및 상태
     parser.add_argument("--retry-failed", action="store_true", help="실패 작업 재시도")
@@ -1010,6 +1200,12 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    # 공통 실행 옵션 (지정된 값만 전달)
+    options = {
+        k: v for k, v in vars(args).items()
+        if v is not None and v is not False and k in PIPELINE_OPTION_KEYS
+    }
+    
     pipeline = Pipeline()
     
     if args.status:
@@ -1042,6 +1238,8 @@ if __name__ == "__main__":
         print(f"\n✅ 재시도 완료!")
         print(f"  - 전체: {result['total']}개")
         print(f"  - 성공: {result['retried']}개")
+        if result.get("skipped"):
+            print(f"  - 건너뜀: {result['skipped']}개 (최대 재시도 초과/대기 중)")
     
     elif args.only_scan:
         # 스캔만 실행
@@ -1053,12 +1251,6 @@ if __name__ == "__main__":
     
     elif args.only_images:
         # 이미지 생성만
-        options = {"style": args.style}
-        if args.force:
-            options["force"] = True
-        if args.limit:
-            options["limit"] = args.limit
-        
         result = pipeline.run_images_only(args.style, options)
         if result["success"]:
             print(f"\n✅ 이미지 생성 완료!")
@@ -1069,12 +1261,6 @@ if __name__ == "__main__":
     
     elif args.only_videos:
         # 영상 렌더링만
-        options = {"quality": args.quality}
-        if args.force:
-            options["force"] = True
-        if args.limit:
-            options["limit"] = args.limit
-        
         result = pipeline.run_videos_only(options)
         if result["success"]:
             print(f"\n✅ 영상 렌더링 완료!")
@@ -1089,43 +1275,21 @@ if __name__ == "__main__":
         stats = pipeline.db.get_statistics()
         scanner = pipeline.scanner
         
-        tracks_needing_image = scanner.get_tracks_needing_image()
-        tracks_needing_video = scanner.get_tracks_needing_video()
-        
         print(f"\n처리 예정:")
-        print(f"  - 이미지 생성: {len(tracks_needing_image)}개")
-        print(f"  - 영상 렌더링: {len(tracks_needing_video)}개")
+        print(f"  - 이미지 생성: {scanner.count_tracks_needing_image()}개")
+        print(f"  - 영상 렌더링: {scanner.count_tracks_needing_video()}개")
         
         if args.limit:
             print(f"\n⚠️ 제한 적용: 최대 {args.limit}개만 처리")
     
     elif args.resume:
         # 재개
-        options = {
-            "auto_resume": True,
-            "style": args.style,
-            "quality": args.quality
-        }
-        if args.force:
-            options["force"] = True
-        if args.limit:
-            options["limit"] = args.limit
-        
-        result = pipeline.run(options)
+        result = pipeline.run({**options, "auto_resume": True})
         if not result.get("success"):
             print(f"\n❌ 재개 실패: {result.get('error')}")
     
     else:
         # 전체 파이프라인 실행
-        options = {
-            "style": args.style,
-            "quality": args.quality
-        }
-        if args.force:
-            options["force"] = True
-        if args.limit:
-            options["limit"] = args.limit
-        
         result = pipeline.run(options)
         
         if not result.get("success"):
@@ -3,9 +3,16 @@ Mantine 테마 관리 모듈
 Streamlit에서 Light Theme만 사용 (Pretendard 폰트 적용)
 """
 
+import json
 import streamlit as st
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def load_theme_css() -> str:
     """
@@ -62,9 +69,9 @@ def apply_theme() -> None:
                 column.style.setProperty('width', 'auto', 'important');
                 column.style.setProperty('flex-basis', 'auto', 'important');
                 
-                // 컬럼 내부의 모든 요소 수정
-                const allElements = column.querySelectorAll('*');
-                allElements.forEach(el => {
+                // 컬럼 직계 자식 요소만 수정 (전체 DOM 순회 방지)
+                const directChildren = column.querySelectorAll(':scope > *');
+                directChildren.forEach(el => {
                     el.style.setProperty('overflow', 'visible', 'important');
                     el.style.setProperty('overflow-x', 'visible', 'important');
                     el.style.setProperty('overflow-y', 'visible', 'important');
@@ -85,9 +92,8 @@ def apply_theme() -> None:
                 card.style.setProperty('max-width', '100%', 'important');
                 card.style.setProperty('min-width', '0', 'important');
                 
-                // 모든 자식 요소에도 적용
-                const children = card.querySelectorAll('*');
-                children.forEach(child => {
+                // 직계 자식 요소에만 적용
+                Array.from(card.children).forEach(child => {
                     child.style.setProperty('overflow', 'visible', 'important');
                     child.style.setProperty('overflow-x', 'visible', 'important');
                     child.style.setProperty('overflow-y', 'visible', 'important');
@@ -120,7 +126,7 @@ def apply_theme() -> None:
                 container.style.setProperty('overflow', 'visible', 'important');
                 container.style.setProperty('display', 'flex', 'important');
                 
-                const flexItems = container.querySelectorAll('> div');
+                const flexItems = container.querySelectorAll(':scope > div');
                 flexItems.forEach(item => {
                     item.style.setProperty('overflow', 'visible', 'important');
                     item.style.setProperty('min-width', '0', 'important');
@@ -226,24 +232,66 @@ def apply_theme() -> None:
         }
         
         // Streamlit이 동적으로 콘텐츠를 추가할 때를 대비
+        // requestAnimationFrame으로 프레임당 최대 1회만 실행
+        let pending = false;
+        function scheduleFix() {
+            if (pending) {
+                return;
+            }
+            pending = true;
+            requestAnimationFrame(function() {
+                pending = false;
+                fixChromeTextOverflow();
+            });
+        }
+        
+        const observed = new WeakSet();
+        function observeTree(node) {
+            if (node && !observed.has(node)) {
+                observed.add(node);
+                observer.observe(node, {
+                    childList: true,
+                    subtree: true
+                });
+            }
+        }
+        
         const observer = new MutationObserver(function(mutations) {
-            let shouldFix = false;
-            mutations.forEach(function(mutation) {
-                if (mutation.addedNodes.length > 0) {
-                    shouldFix = true;
+            let added = false;
+            for (const mutation of mutations) {
+                if (mutation.addedNodes.length === 0) {
+                    continue;
                 }
-            });
-            if (shouldFix) {
-                setTimeout(fixChromeTextOverflow, 100);
+                added = true;
+                // body에 새로 붙은 드롭다운 포털은 하위 트리까지 관찰 (옵션이 나중에 채워짐)
+                if (mutation.target === document.body) {
+                    mutation.addedNodes.forEach(node => {
+                        if (node.nodeType === Node.ELEMENT_NODE) {
+                            observeTree(node);
+                        }
+                    });
+                }
+            }
+            if (added) {
+                // 사이드바가 나중에 마운트된 경우에도 관찰 대상에 추가
+                observeTree(document.querySelector('[data-testid="stSidebar"]'));
+                scheduleFix();
             }
         });
+        
+        // main 영역과 사이드바, 이미 있는 포털(앱 루트 제외 body 자식)은 하위 트리까지,
+        // body 자체는 포털 추가 감지용으로 직계만 관찰
+        observeTree(document.querySelector('main'));
+        observeTree(document.querySelector('[data-testid="stSidebar"]'));
+        Array.from(document.body.children)
+            .filter(node => node.id !== 'root')
+            .forEach(observeTree);
         observer.observe(document.body, {
-            childList: true,
-            subtree: true
+            childList: true
         });
         
-        // 주기적으로도 체크 (Streamlit의 동적 렌더링 대응, 드롭다운 메뉴 포함)
-        setInterval(fixChromeTextOverflow, 100);
+        // 관찰 범위 밖에서 바뀐 요소를 위한 느린 보조 타이머
+        setInterval(scheduleFix, 3000);
         
         // window load 이벤트에서도 실행
         window.addEventListener('load', fixChromeTextOverflow);
@@ -261,18 +309,19 @@ def init_theme() -> None:
     apply_theme()
 
 
+@st.cache_data
 def get_color_palette() -> dict:
     """
-    Mantine 컬러 팔레트 로드
+    Mantine 컬러 팔레트 로드 (orjson 사용 가능 시 바이트 그대로 파싱)
     
     Returns:
         컬러 팔레트 딕셔너리
     """
-    import json
-    
     colors_path = Path(__file__).parent / "themes" / "mantine_colors.json"
     
     if colors_path.exists():
+        if HAS_ORJSON:
+            return orjson.loads(colors_path.read_bytes())
         with open(colors_path, "r", encoding="utf-8") as f:
             return json.load(f)
     
@@ -3,11 +3,21 @@
 MP3 파일의 길이, 태그 정보 분석 및 처리
 """
 
+import logging
+import multiprocessing
 import os
+import shelve
+import subprocess
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
+import numpy as np
 from mutagen.mp3 import MP3
-from mutagen.id3 import ID3, TIT2, TPE1, TALB, TCON, TDRC
+from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB, TCON, TDRC
 from mutagen import File as MutagenFile
 from pydub import AudioSegment
 
@@ -21,6 +31,142 @@ class AudioFormatError(Exception):
     pass
 
 
+class ID3NoLoad(ID3):
+    """길이만 필요할 때 ID3 프레임 파싱을 건너뛰는 ID3 클래스"""
+    
+    def load(self, *args, **kwargs):
+        # 태그 없음으로 처리 → MPEG 정보 파서가 ID3 헤더를 직접 건너뜀
+        raise ID3NoHeaderError("ID3 로드 생략")
+
+
+# 모듈 로거 (최초 사용 시 한 번만 생성)
+_logger: Optional[logging.Logger] = None
+
+
+def _log() -> logging.Logger:
+    """
+    metadata 모듈 로거 반환 (setup_logger는 프로세스당 한 번만 호출)
+    
+    Returns:
+        Logger 인스턴스
+    """
+    global _logger
+    if _logger is None:
+        _logger = setup_logger("metadata")
+    return _logger
+
+
+# mutagen에 넘길 파일 버퍼 크기 (네트워크 파일시스템에서 작은 읽기/쓰기 왕복 감소)
+_READ_BUFFER_SIZE = 4096
+_WRITE_BUFFER_SIZE = 65536
+
+# 메타데이터 캐시: (절대경로, mtime_ns, 크기) → {"duration", "tags", "analysis"}
+# 파일이 바뀔 때마다 새 키가 생기므로 최대 개수를 넘으면 오래 사용하지 않은 항목부터 제거
+_META_CACHE_MAX_SIZE = 4096
+_META_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_META_CACHE_LOCK = threading.Lock()
+
+# 선택적 디스크 캐시 (CLI 반복 실행 시 재사용)
+_META_DISK_CACHE_PATH = Path.home() / ".cache" / "playlist" / "meta.db"
+_disk_cache_enabled = False
+
+
+def enable_disk_cache(enabled: bool = True) -> None:
+    """
+    메타데이터 디스크 캐시 사용 여부 설정
+    
+    Args:
+        enabled: True면 ~/.cache/playlist/meta.db에 캐시 저장/조회
+    """
+    global _disk_cache_enabled
+    _disk_cache_enabled = enabled
+    if enabled:
+        _META_DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+
+def _meta_key(path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    캐시 키 생성 (파일이 바뀌면 키도 바뀜)
+    
+    Args:
+        path: 파일 경로
+    
+    Returns:
+        (절대경로, mtime_ns, 크기), 파일이 없으면 None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _cache_get(key: Optional[Tuple[str, int, int]]) -> Optional[Dict[str, Any]]:
+    """
+    캐시 조회 (메모리 → 디스크 순)
+    
+    Args:
+        key: _meta_key() 결과
+    
+    Returns:
+        캐시 항목 또는 None
+    """
+    if key is None:
+        return None
+    
+    with _META_CACHE_LOCK:
+        entry = _META_CACHE.get(key)
+        if entry is not None:
+            _META_CACHE.move_to_end(key)
+            return entry
+    
+    if _disk_cache_enabled:
+        try:
+            with shelve.open(str(_META_DISK_CACHE_PATH)) as disk:
+                entry = disk.get(repr(key))
+        except Exception:
+            entry = None
+        if entry is not None:
+            with _META_CACHE_LOCK:
+                _META_CACHE[key] = entry
+                _evict_meta_cache()
+    return entry
+
+
+def _evict_meta_cache() -> None:
+    """최대 개수를 넘은 메모리 캐시 항목 제거 (LRU, _META_CACHE_LOCK 보유 상태에서 호출)"""
+    while len(_META_CACHE) > _META_CACHE_MAX_SIZE:
+        _META_CACHE.popitem(last=False)
+
+
+def _cache_update(updates: Dict[Tuple[str, int, int], Dict[str, Any]]) -> None:
+    """
+    캐시 항목 병합 저장 (디스크 캐시는 한 번만 열어서 기록)
+    
+    Args:
+        updates: {캐시 키: 병합할 필드}
+    """
+    if not updates:
+        return
+    
+    merged = {}
+    with _META_CACHE_LOCK:
+        for key, fields in updates.items():
+            entry = _META_CACHE.setdefault(key, {})
+            entry.update(fields)
+            _META_CACHE.move_to_end(key)
+            merged[key] = entry
+        _evict_meta_cache()
+    
+    if _disk_cache_enabled:
+        try:
+            with shelve.open(str(_META_DISK_CACHE_PATH)) as disk:
+                for key, entry in merged.items():
+                    disk[repr(key)] = entry
+        except Exception:
+            pass
+
+
 def get_duration_mutagen(path: str) -> float:
     """
     mutagen 라이브러리 사용하여 오디오 길이 반환
@@ -39,7 +185,8 @@ def get_duration_mutagen(path: str) -> float:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
     
     try:
-        audio = MP3(path)
+        with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            audio = MP3(f, ID3=ID3NoLoad)
         return float(audio.info.length)
     except Exception as e:
         raise AudioFormatError(f"오디오 파일 분석 실패 ({path}): {str(e)}")
@@ -69,13 +216,44 @@ def get_duration_pydub(path: str) -> float:
         raise AudioFormatError(f"오디오 파일 분석 실패 ({path}): {str(e)}")
 
 
+def get_duration_ffprobe(path: str) -> float:
+    """
+    ffprobe로 컨테이너 헤더만 읽어 오디오 길이 반환 (전체 디코딩 없음)
+    
+    Args:
+        path: 파일 경로
+    
+    Returns:
+        길이(초), 소수점 포함
+    
+    Raises:
+        FileNotFoundError: 파일 없음
+        AudioFormatError: ffprobe 실행 실패 또는 길이 정보 없음
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+    
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", path],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30
+        )
+        return float(result.stdout.strip())
+    except Exception as e:
+        raise AudioFormatError(f"오디오 파일 분석 실패 ({path}): {str(e)}")
+
+
 def get_audio_duration(path: str, method: str = "mutagen") -> float:
     """
     오디오 파일 길이 반환 (초 단위)
     
     Args:
         path: 파일 경로
-        method: "mutagen" | "pydub"
+        method: "mutagen" | "pydub" (ffprobe 헤더 읽기) | "pydub_decode" (전체 디코딩)
     
     Returns:
         길이(초), 소수점 포함
@@ -85,8 +263,18 @@ def get_audio_duration(path: str, method: str = "mutagen") -> float:
         AudioFormatError: 지원하지 않는 포맷
     """
     if method == "mutagen":
-        return get_duration_mutagen(path)
+        key = _meta_key(path)
+        entry = _cache_get(key)
+        if entry is not None and "duration" in entry:
+            return entry["duration"]
+        
+        duration = get_duration_mutagen(path)
+        if key is not None:
+            _cache_update({key: {"duration": duration}})
+        return duration
     elif method == "pydub":
+        return get_duration_ffprobe(path)
+    elif method == "pydub_decode":
         return get_duration_pydub(path)
     else:
         raise ValueError(f"지원하지 않는 메서드: {method}")
@@ -113,6 +301,23 @@ def seconds_to_mmss(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def seconds_to_mmss_batch(seconds: np.ndarray) -> np.ndarray:
+    """
+    초 배열을 MM:SS 형식 문자열 배열로 일괄 변환
+    
+    Args:
+        seconds: 초 단위 시간 배열
+    
+    Returns:
+        MM:SS 형식 문자열 배열
+        예: [185.5, 62.0] → ["03:05", "01:02"]
+    """
+    total = np.maximum(np.asarray(seconds, dtype=np.float64), 0).astype(np.int64)
+    minutes = np.char.zfill((total // 60).astype(str), 2)
+    secs = np.char.zfill((total % 60).astype(str), 2)
+    return np.char.add(np.char.add(minutes, ":"), secs)
+
+
 def seconds_to_hhmmss(seconds: float) -> str:
     """
     초를 HH:MM:SS 형식으로 변환
@@ -172,6 +377,22 @@ def parse_time_string(time_str: str) -> float:
         "03:05" → 185.0
         "01:02:05" → 3725.0
     """
+    b = time_str.strip().encode("ascii", "ignore")
+    
+    # 고정 길이 형식은 split/map 없이 바이트 오프셋으로 바로 계산 (58 == ":")
+    if len(b) == 8 and b[2] == 58 and b[5] == 58 and b[:2].isdigit() and b[3:5].isdigit() and b[6:].isdigit():
+        # HH:MM:SS 형식
+        hours = (b[0] - 48) * 10 + (b[1] - 48)
+        minutes = (b[3] - 48) * 10 + (b[4] - 48)
+        seconds = (b[6] - 48) * 10 + (b[7] - 48)
+        return float(hours * 3600 + minutes * 60 + seconds)
+    if len(b) == 5 and b[2] == 58 and b[:2].isdigit() and b[3:].isdigit():
+        # MM:SS 형식
+        minutes = (b[0] - 48) * 10 + (b[1] - 48)
+        seconds = (b[3] - 48) * 10 + (b[4] - 48)
+        return float(minutes * 60 + seconds)
+    
+    # 그 외 형식 (한 자리 숫자 등)은 일반 파싱
     parts = time_str.strip().split(":")
     
     if len(parts) == 2:
@@ -186,12 +407,45 @@ def parse_time_string(time_str: str) -> float:
         raise ValueError(f"지원하지 않는 시간 형식: {time_str}")
 
 
-def get_mp3_tags(path: str) -> Dict[str, Any]:
+def _load_mp3(path: str) -> MP3:
+    """
+    MP3 파일을 한 번 파싱 (길이/태그 공용)
+    
+    Args:
+        path: 파일 경로
+    
+    Returns:
+        MP3 객체 (ID3 태그 포함)
+    """
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        return MP3(f, ID3=ID3)
+
+
+# get_mp3_tags 기본 추출 필드
+ALL_TAG_FIELDS = frozenset({"title", "artist", "album", "genre", "year"})
+
+# 필드별 태그 후보 (ID3 프레임 우선, 그 외 포맷의 키는 대체값)
+_TAG_MAP = (
+    ("title", ("TIT2", "TITLE")),
+    ("artist", ("TPE1", "ARTIST")),
+    ("album", ("TALB", "ALBUM")),
+    ("genre", ("TCON", "GENRE")),
+    ("year", ("TDRC", "DATE")),
+)
+
+
+def get_mp3_tags(
+    path: str,
+    audio: Optional[Any] = None,
+    fields: frozenset = ALL_TAG_FIELDS
+) -> Dict[str, Any]:
     """
     MP3 태그 정보 추출
     
     Args:
         path: 파일 경로
+        audio: 이미 파싱된 mutagen 객체 (None이면 파일을 한 번만 파싱)
+        fields: 추출할 태그 필드 (지정하지 않은 필드는 None 유지)
     
     Returns:
         {
@@ -212,67 +466,99 @@ def get_mp3_tags(path: str) -> Dict[str, Any]:
         "duration": None
     }
     
+    cache_key = None
+    if audio is None:
+        # 변경되지 않은 파일은 캐시된 태그 사용
+        cache_key = _meta_key(path)
+        entry = _cache_get(cache_key)
+        if entry is not None and "tags" in entry:
+            return dict(entry["tags"])
+        if fields != ALL_TAG_FIELDS:
+            # 일부 필드만 추출한 결과는 캐시하지 않음
+            cache_key = None
+        
+        try:
+            audio = _load_mp3(path)
+        except Exception:
+            # MP3가 아닌 포맷은 범용 파서로 재시도
+            try:
+                with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                    audio = MutagenFile(f)
+            except Exception:
+                audio = None
+        if audio is None:
+            return result
+    
     try:
         # 길이 정보
-        result["duration"] = get_audio_duration(path, method="mutagen")
+        result["duration"] = float(audio.info.length)
     except Exception:
         pass
     
     try:
-        audio_file = MutagenFile(path)
-        if audio_file is None:
-            return result
+        audio_file = audio
         
         # ID3 태그 추출
         if hasattr(audio_file, 'tags') and audio_file.tags is not None:
             tags = audio_file.tags
             
-            # Title
-            if 'TIT2' in tags:
-                result["title"] = str(tags['TIT2'][0])
-            elif 'TITLE' in tags:
-                result["title"] = str(tags['TITLE'][0])
-            
-            # Artist
-            if 'TPE1' in tags:
-                result["artist"] = str(tags['TPE1'][0])
-            elif 'ARTIST' in tags:
-                result["artist"] = str(tags['ARTIST'][0])
-            
-            # Album
-            if 'TALB' in tags:
-                result["album"] = str(tags['TALB'][0])
-            elif 'ALBUM' in tags:
-                result["album"] = str(tags['ALBUM'][0])
-            
-            # Genre
-            if 'TCON' in tags:
-                result["genre"] = str(tags['TCON'][0])
-            elif 'GENRE' in tags:
-                result["genre"] = str(tags['GENRE'][0])
-            
-            # Year
-            if 'TDRC' in tags:
-                year_str = str(tags['TDRC'][0])
-                try:
-                    # 연도만 추출 (예: "2025" 또는 "2025-01-01")
-                    result["year"] = int(year_str.split('-')[0])
-                except (ValueError, IndexError):
-                    pass
-            elif 'DATE' in tags:
-                year_str = str(tags['DATE'][0])
-                try:
-                    result["year"] = int(year_str.split('-')[0])
-                except (ValueError, IndexError):
-                    pass
+            for key, candidates in _TAG_MAP:
+                if key not in fields:
+                    continue
+                for candidate in candidates:
+                    value = tags.get(candidate)
+                    if value is None:
+                        continue
+                    if key == "year":
+                        try:
+                            # 연도만 추출 (예: "2025" 또는 "2025-01-01")
+                            result["year"] = int(str(value[0]).split('-')[0])
+                        except (ValueError, IndexError):
+                            pass
+                    else:
+                        result[key] = str(value[0])
+                    break
     
     except Exception:
         # 태그가 없거나 읽을 수 없는 경우 None 유지
         pass
     
+    if cache_key is not None:
+        _cache_update({cache_key: {"tags": dict(result)}})
+    
     return result
 
 
+def _add_tag_frames(id3: ID3, tags: Dict[str, Any]) -> None:
+    """
+    태그 딕셔너리를 ID3 프레임으로 추가
+    
+    Args:
+        id3: 대상 ID3 객체
+        tags: 태그 딕셔너리 (값이 비어 있는 필드는 건너뜀)
+    """
+    if "title" in tags and tags["title"]:
+        id3.add(TIT2(encoding=3, text=tags["title"]))
+    
+    if "artist" in tags and tags["artist"]:
+        id3.add(TPE1(encoding=3, text=tags["artist"]))
+    
+    if "album" in tags and tags["album"]:
+        id3.add(TALB(encoding=3, text=tags["album"]))
+    
+    if "genre" in tags and tags["genre"]:
+        id3.add(TCON(encoding=3, text=tags["genre"]))
+    
+    if "year" in tags and tags["year"]:
+        year_str = str(tags["year"])
+        id3.add(TDRC(encoding=3, text=year_str))
+
+
+def _tag_padding(info: Any) -> int:
+    """ID3 패딩 정책: 최소 4KB 여유 확보"""
+    return max(4096, info.padding)
+
+
 def set_mp3_tags(path: str, tags: Dict[str, Any]) -> bool:
     """
     MP3 태그 설정 (Suno 생성 후 메타데이터 추가용)
@@ -291,45 +577,145 @@ def set_mp3_tags(path: str, tags: Dict[str, Any]) -> bool:
         성공 여부
     """
     try:
-        audio_file = MP3(path, ID3=ID3)
-        
-        # ID3 태그가 없으면 생성
-        if audio_file.tags is None:
-            audio_file.add_tags()
-        
-        # 태그 설정
-        if "title" in tags and tags["title"]:
-            audio_file.tags.add(TIT2(encoding=3, text=tags["title"]))
-        
-        if "artist" in tags and tags["artist"]:
-            audio_file.tags.add(TPE1(encoding=3, text=tags["artist"]))
-        
-        if "album" in tags and tags["album"]:
-            audio_file.tags.add(TALB(encoding=3, text=tags["album"]))
-        
-        if "genre" in tags and tags["genre"]:
-            audio_file.tags.add(TCON(encoding=3, text=tags["genre"]))
+        # 같은 파일 핸들로 읽기/쓰기 (큰 버퍼로 쓰기 횟수 감소)
+        with open(path, "rb+", buffering=_WRITE_BUFFER_SIZE) as f:
+            audio_file = MP3(f, ID3=ID3)
+            
+            # ID3 태그가 없으면 생성
+            if audio_file.tags is None:
+                audio_file.add_tags()
+            
+            # 태그 설정
+            _add_tag_frames(audio_file.tags, tags)
+            
+            # 저장 (ID3v2.3 고정 + 여유 패딩 확보로 이후 태그 수정 시 오디오 재기록 방지)
+            audio_file.tags.update_to_v23()
+            audio_file.save(f, v2_version=3, padding=_tag_padding)
+            return True
+    
+    except Exception as e:
+        _log().error(f"태그 설정 실패 ({path}): {e}")
+        return False
+
+
+def set_mp3_tags_inmemory(mp3_bytes: bytes, tags: Dict[str, Any]) -> bytes:
+    """
+    메모리상의 MP3 데이터에 태그 설정 (다운로드 직후 파일 재오픈 없이 한 번에 저장)
+    
+    Args:
+        mp3_bytes: MP3 파일 전체 바이트
+        tags: 태그 딕셔너리 (set_mp3_tags와 동일)
+    
+    Returns:
+        태그가 적용된 MP3 바이트
+    """
+    buffer = BytesIO(mp3_bytes)
+    
+    # 기존 ID3 태그가 있으면 유지하고 필드만 덮어씀
+    try:
+        id3 = ID3(buffer)
+    except ID3NoHeaderError:
+        id3 = ID3()
+    
+    _add_tag_frames(id3, tags)
+    id3.update_to_v23()
+    buffer.seek(0)
+    id3.save(buffer, v2_version=3, padding=_tag_padding)
+    return buffer.getvalue()
+
+
+def _analyze_one(item: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+    """
+    단일 mp3 파일 분석 (프로세스 풀 워커용)
+    
+    Args:
+        item: (파일 경로, 파일 크기 바이트) - 크기는 스캔 시 얻은 값 재사용
+    
+    Returns:
+        analyze_folder 항목 딕셔너리, 실패 시 None
+    """
+    path_str, size_bytes = item
+    file_name = os.path.basename(path_str)
+    try:
+        # 파일 크기
+        file_size_mb = size_bytes / (1024 * 1024)
         
-        if "year" in tags and tags["year"]:
-            year_str = str(tags["year"])
-            audio_file.tags.add(TDRC(encoding=3, text=year_str))
+        # 한 번 파싱해서 길이/태그 모두 추출
+        audio = _load_mp3(path_str)
+        duration = float(audio.info.length)
+        tags = get_mp3_tags(path_str, audio=audio)
         
-        # 저장
-        audio_file.save()
-        return True
+        return {
+            "file_name": file_name,
+            "file_path": path_str,
+            "track_id": os.path.splitext(file_name)[0],
+            "duration": duration,
+            "file_size_mb": round(file_size_mb, 2),
+            "tags": tags
+        }
     
     except Exception as e:
-        logger = setup_logger("metadata")
-        logger.error(f"태그 설정 실패 ({path}): {e}")
-        return False
+        _log().warning(f"파일 분석 실패 ({path_str}): {e}")
+        return None
+
 
+# 기본 실행기: 스레드 (UI의 백그라운드 스레드 등 멀티스레드 프로세스에서도 안전)
+# 프로세스 풀은 CLI에서 --executor process로 명시했을 때만 사용
+DEFAULT_EXECUTOR = "thread"
 
-def analyze_folder(folder_path: str) -> List[Dict[str, Any]]:
+
+def _map_parallel(
+    func,
+    items: List[Any],
+    num_workers: Optional[int] = None,
+    executor: Optional[str] = None
+) -> List[Any]:
     """
-    폴더 내 모든 mp3 분석
+    항목별 작업을 워커 풀로 분산 실행 (항목이 적거나 워커 1개면 직접 실행)
+    
+    Args:
+        func: 모듈 레벨 함수 (프로세스 실행 시 pickle 가능해야 함)
+        items: 입력 항목 리스트
+        num_workers: 워커 수 (None이면 process는 CPU 코어 수, thread는 최대 32)
+        executor: "process" | "thread" | "none" (None이면 DEFAULT_EXECUTOR)
+    
+    Returns:
+        입력 순서대로 정렬된 결과 리스트
+    """
+    if executor is None:
+        executor = DEFAULT_EXECUTOR
+    if executor not in ("process", "thread", "none"):
+        raise ValueError(f"지원하지 않는 실행기: {executor}")
+    
+    cpu_count = os.cpu_count() or 1
+    if num_workers is None:
+        num_workers = cpu_count if executor == "process" else min(32, cpu_count * 4)
+    
+    if executor == "none" or num_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            return list(pool.map(func, items))
+    
+    # fork는 다른 스레드가 잡고 있던 잠금을 자식에 복사해 교착될 수 있으므로 spawn 사용
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as pool:
+        return list(pool.map(func, items, chunksize=8))
+
+
+def analyze_folder(
+    folder_path: str,
+    num_workers: Optional[int] = None,
+    executor: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    폴더 내 모든 mp3 분석 (파일 단위 병렬 처리)
     
     Args:
         folder_path: 폴더 경로
+        num_workers: 워커 수 (None이면 실행기별 기본값)
+        executor: "process" | "thread" | "none" (None이면 DEFAULT_EXECUTOR)
     
     Returns:
         [
@@ -345,44 +731,107 @@ def analyze_folder(folder_path: str) -> List[Dict[str, Any]]:
             ...
         ]
     """
-    folder = Path(folder_path)
-    if not folder.exists():
+    if not os.path.isdir(folder_path):
         return []
     
-    results = []
+    # MP3 파일만 찾기 (scandir 항목의 stat 결과를 크기/캐시 키에 재사용)
+    with os.scandir(folder_path) as it:
+        entries = [entry for entry in it if entry.name.endswith(".mp3") and entry.is_file()]
     
-    # MP3 파일만 찾기
-    for file_path in folder.glob("*.mp3"):
+    # 변경되지 않은 파일은 캐시 사용, 나머지만 분석
+    results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+    misses = []
+    for i, entry in enumerate(entries):
         try:
-            file_name = file_path.name
-            track_id = file_path.stem
-            
-            # 파일 크기
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            
-            # 길이 분석
-            duration = get_audio_duration(str(file_path), method="mutagen")
-            duration_formatted = seconds_to_mmss(duration)
-            
-            # 태그 정보
-            tags = get_mp3_tags(str(file_path))
-            
-            results.append({
-                "file_name": file_name,
-                "file_path": str(file_path),
-                "track_id": track_id,
-                "duration": duration,
-                "duration_formatted": duration_formatted,
-                "file_size_mb": round(file_size_mb, 2),
-                "tags": tags
-            })
-        
-        except Exception as e:
-            logger = setup_logger("metadata")
-            logger.warning(f"파일 분석 실패 ({file_path}): {e}")
+            st = entry.stat()
+        except OSError:
             continue
+        key = (os.path.abspath(entry.path), st.st_mtime_ns, st.st_size)
+        cached = _cache_get(key)
+        if cached is not None and "analysis" in cached:
+            results[i] = cached["analysis"]
+        else:
+            misses.append((i, key, (entry.path, st.st_size)))
+    
+    analyzed = _map_parallel(_analyze_one, [item for _, _, item in misses], num_workers, executor)
+    
+    cache_updates = {}
+    for (i, key, _), item in zip(misses, analyzed):
+        results[i] = item
+        if item is not None:
+            cache_updates[key] = {
+                "duration": item["duration"],
+                "tags": item["tags"],
+                "analysis": item
+            }
+    _cache_update(cache_updates)
+    
+    files = [r for r in results if r is not None]
+    
+    # 길이 포맷은 한 번에 일괄 변환
+    if files:
+        formatted = seconds_to_mmss_batch(np.array([f["duration"] for f in files]))
+        for f, text in zip(files, formatted.tolist()):
+            f["duration_formatted"] = text
+    
+    return files
+
+
+@lru_cache(maxsize=16)
+def _analyze_folder_cached(folder_path: str, signature: Tuple[int, ...]) -> Tuple[Dict[str, Any], ...]:
+    """
+    폴더 분석 결과 캐시 (폴더 서명이 바뀌면 키가 달라져 자동 무효화)
+    
+    Args:
+        folder_path: 절대 폴더 경로
+        signature: _folder_signature() 결과
+    
+    Returns:
+        analyze_folder 결과 튜플
+    """
+    return tuple(analyze_folder(folder_path))
+
+
+def _folder_signature(folder_path: str) -> Optional[Tuple[int, ...]]:
+    """
+    폴더 변경 감지용 서명
+    
+    파일을 제자리에서 다시 쓰면 폴더 mtime은 그대로이므로,
+    폴더 mtime과 함께 mp3 항목들의 최대 (st_mtime_ns, st_size)를 사용한다.
+    
+    Args:
+        folder_path: 폴더 경로
+    
+    Returns:
+        (폴더 mtime, 최대 파일 mtime, 해당 파일 크기) 튜플, 폴더가 없으면 None
+    """
+    try:
+        dir_mtime_ns = os.stat(folder_path).st_mtime_ns
+        latest = (0, 0)
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3") and entry.is_file():
+                    st = entry.stat()
+                    latest = max(latest, (st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    return (dir_mtime_ns,) + latest
+
+
+def _analyze_folder_shared(folder_path: str) -> List[Dict[str, Any]]:
+    """
+    통계용 폴더 분석 (연속 호출 시 한 번만 분석)
+    
+    Args:
+        folder_path: 폴더 경로
     
-    return results
+    Returns:
+        analyze_folder 결과 리스트
+    """
+    signature = _folder_signature(folder_path)
+    if signature is None:
+        return []
+    return list(_analyze_folder_cached(os.path.abspath(folder_path), signature))
 
 
 def get_total_duration(folder_path: str) -> float:
@@ -395,16 +844,18 @@ def get_total_duration(folder_path: str) -> float:
     Returns:
         총 길이(초)
     """
-    files = analyze_folder(folder_path)
+    files = _analyze_folder_shared(folder_path)
     return sum(f["duration"] for f in files if f.get("duration"))
 
 
-def get_folder_statistics(folder_path: str) -> Dict[str, Any]:
+def get_folder_statistics(folder_path: str, approximate: bool = False) -> Dict[str, Any]:
     """
     폴더 통계
     
     Args:
         folder_path: 폴더 경로
+        approximate: True면 파일을 열지 않고 파일 크기와 설정 비트레이트
+                     (suno.bitrate_kbps)로 길이를 추정
     
     Returns:
         {
@@ -412,23 +863,41 @@ def get_folder_statistics(folder_path: str) -> Dict[str, Any]:
             "total_duration_seconds": 12500.5,
             "total_duration_formatted": "03:28:20",
             "average_duration": 208.3,
-            "total_size_mb": 245.8
+            "total_size_mb": 245.8,
+            "approximate": False
         }
     """
-    files = analyze_folder(folder_path)
+    if approximate:
+        # 디렉터리 항목의 크기만 사용 (mutagen 파싱 없음)
+        sizes = []
+        if os.path.isdir(folder_path):
+            with os.scandir(folder_path) as it:
+                sizes = [
+                    entry.stat().st_size for entry in it
+                    if entry.name.endswith(".mp3") and entry.is_file()
+                ]
+        bitrate_kbps = load_config().get("suno", {}).get("bitrate_kbps", 128)
+        bytes_per_second = bitrate_kbps * 1000 / 8
+        durations = [size / bytes_per_second for size in sizes]
+        sizes_mb = [size / (1024 * 1024) for size in sizes]
+    else:
+        files = _analyze_folder_shared(folder_path)
+        durations = [f["duration"] for f in files if f.get("duration")]
+        sizes_mb = [f["file_size_mb"] for f in files]
     
-    if not files:
+    if not sizes_mb:
         return {
             "total_files": 0,
             "total_duration_seconds": 0.0,
             "total_duration_formatted": "00:00",
             "average_duration": 0.0,
-            "total_size_mb": 0.0
+            "total_size_mb": 0.0,
+            "approximate": approximate
         }
     
-    total_files = len(files)
-    total_duration = sum(f["duration"] for f in files if f.get("duration"))
-    total_size = sum(f["file_size_mb"] for f in files)
+    total_files = len(sizes_mb)
+    total_duration = sum(durations)
+    total_size = sum(sizes_mb)
     average_duration = total_duration / total_files if total_files > 0 else 0.0
     
     return {
@@ -436,10 +905,48 @@ def get_folder_statistics(folder_path: str) -> Dict[str, Any]:
         "total_duration_seconds": round(total_duration, 2),
         "total_duration_formatted": seconds_to_hhmmss(total_duration),
         "average_duration": round(average_duration, 2),
-        "total_size_mb": round(total_size, 2)
+        "total_size_mb": round(total_size, 2),
+        "approximate": approximate
     }
 
 
+def _read_music_updates(item: Tuple[str, str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    음악 파일에서 DB 업데이트 내용 생성 (프로세스 풀 워커용)
+    
+    Args:
+        item: (트랙 ID, 파일 경로)
+    
+    Returns:
+        (트랙 ID, 업데이트 딕셔너리), 실패 시 업데이트는 None
+    """
+    track_id, file_path = item
+    try:
+        # 한 번 파싱해서 길이/태그 모두 추출
+        audio = _load_mp3(file_path)
+        duration = float(audio.info.length)
+        tags = get_mp3_tags(file_path, audio=audio, fields=frozenset({"title", "artist"}))
+        
+        updates = {
+            "music": {
+                "duration_seconds": duration,
+                "duration_formatted": seconds_to_mmss(duration)
+            }
+        }
+        
+        # 태그 정보도 추가 (있는 경우)
+        if tags.get("title"):
+            updates["music"]["title"] = tags["title"]
+        if tags.get("artist"):
+            updates["music"]["artist"] = tags["artist"]
+        
+        return track_id, updates
+    
+    except Exception as e:
+        _log().error(f"메타데이터 업데이트 실패 ({track_id}): {e}")
+        return track_id, None
+
+
 def update_track_metadata(track_id: str, db: TrackDB) -> bool:
     """
     단일 트랙 메타데이터 DB 업데이트
@@ -462,41 +969,31 @@ def update_track_metadata(track_id: str, db: TrackDB) -> bool:
         if not file_path or not os.path.exists(file_path):
             return False
         
-        # 길이 분석
-        duration = get_audio_duration(file_path, method="mutagen")
-        
-        # 태그 정보
-        tags = get_mp3_tags(file_path)
+        _, updates = _read_music_updates((track_id, file_path))
+        if updates is None:
+            return False
         
         # DB 업데이트
-        updates = {
-            "music": {
-                "duration_seconds": duration,
-                "duration_formatted": seconds_to_mmss(duration)
-            }
-        }
-        
-        # 태그 정보도 추가 (있는 경우)
-        if tags.get("title"):
-            updates["music"]["title"] = tags["title"]
-        if tags.get("artist"):
-            updates["music"]["artist"] = tags["artist"]
-        
         db.update_track(track_id, updates)
         return True
     
     except Exception as e:
-        logger = setup_logger("metadata")
-        logger.error(f"메타데이터 업데이트 실패 ({track_id}): {e}")
+        _log().error(f"메타데이터 업데이트 실패 ({track_id}): {e}")
         return False
 
 
-def update_all_metadata(db: TrackDB) -> Dict[str, int]:
+def update_all_metadata(
+    db: TrackDB,
+    num_workers: Optional[int] = None,
+    executor: Optional[str] = None
+) -> Dict[str, int]:
     """
-    모든 트랙 메타데이터 일괄 업데이트
+    모든 트랙 메타데이터 일괄 업데이트 (파일 분석은 병렬, DB 반영은 메인 프로세스)
     
     Args:
         db: TrackDB 인스턴스
+        num_workers: 워커 수 (None이면 실행기별 기본값)
+        executor: "process" | "thread" | "none" (None이면 DEFAULT_EXECUTOR)
     
     Returns:
         {
@@ -509,6 +1006,7 @@ def update_all_metadata(db: TrackDB) -> Dict[str, int]:
     updated = 0
     skipped = 0
     failed = 0
+    pending = []
     
     for track in all_tracks:
         track_id = track.get("track_id")
@@ -522,11 +1020,25 @@ def update_all_metadata(db: TrackDB) -> Dict[str, int]:
             skipped += 1
             continue
         
-        if update_track_metadata(track_id, db):
-            updated += 1
+        file_path = music_info.get("file_path")
+        if not file_path or not os.path.exists(file_path):
+            failed += 1
+            continue
+        
+        pending.append((track_id, file_path))
+    
+    updates_by_id = {}
+    for track_id, updates in _map_parallel(_read_music_updates, pending, num_workers, executor):
+        if updates is not None:
+            updates_by_id[track_id] = updates
         else:
             failed += 1
     
+    # DB 반영은 한 번의 저장으로 처리
+    if updates_by_id:
+        updated = db.bulk_update(updates_by_id)
+        failed += len(updates_by_id) - updated
+    
     return {
         "updated": updated,
         "skipped": skipped,
@@ -548,36 +1060,38 @@ def get_waveform_data(path: str, samples: int = 100) -> List[float]:
     try:
         audio = AudioSegment.from_mp3(path)
         
-        # 오디오를 샘플 개수만큼 나누기
-        chunk_length = len(audio) // samples
-        waveform = []
+        # PCM 데이터를 numpy 배열로 한 번만 변환 (채널은 평균으로 합침)
+        dtype = {1: np.int8, 2: np.int16, 4: np.int32}[audio.sample_width]
+        pcm = np.frombuffer(audio.raw_data, dtype=dtype)
+        if audio.channels > 1:
+            pcm = pcm.reshape(-1, audio.channels).mean(axis=1)
         
-        for i in range(samples):
-            start = i * chunk_length
-            end = start + chunk_length
-            
-            if end > len(audio):
-                end = len(audio)
-            
-            chunk = audio[start:end]
-            
-            # RMS (Root Mean Square) 계산하여 진폭 추정
-            if len(chunk) > 0:
-                rms = chunk.rms
-                # 정규화 (최대값 32767.0 기준)
-                normalized = min(rms / 32767.0, 1.0)
-                waveform.append(normalized)
-            else:
-                waveform.append(0.0)
+        if len(pcm) < samples:
+            return [0.0] * samples
+        
+        # 구간 경계를 균등 분할 (나머지 샘플도 마지막까지 포함)
+        starts = np.linspace(0, len(pcm), samples + 1, dtype=np.int64)
         
-        return waveform
+        # 제곱 누적합 한 번으로 구간 합 계산 ((samples, step) 임시 배열 없음)
+        cumsum = np.empty(len(pcm) + 1, dtype=np.float64)
+        cumsum[0] = 0.0
+        np.cumsum(np.square(pcm, dtype=np.float64), out=cumsum[1:])
+        sums = cumsum[starts[1:]] - cumsum[starts[:-1]]
+        counts = starts[1:] - starts[:-1]
+        rms = np.sqrt(sums / counts)
+        
+        # 정규화 (샘플 폭의 최대값 기준)
+        return np.minimum(rms / audio.max_possible_amplitude, 1.0).tolist()
     
     except Exception as e:
-        logger = setup_logger("metadata")
-        logger.error(f"파형 데이터 추출 실패 ({path}): {e}")
+        _log().error(f"파형 데이터 추출 실패 ({path}): {e}")
         return [0.0] * samples
 
 
+# detect_bpm 미구현 경고 출력 여부 (프로세스당 한 번만 경고)
+_bpm_warned = False
+
+
 def detect_bpm(path: str) -> Optional[float]:
     """
     BPM 감지 (선택)
@@ -591,8 +1105,10 @@ def detect_bpm(path: str) -> Optional[float]:
     # BPM 감지는 복잡한 알고리즘이 필요하므로
     # 기본 구현은 제공하지 않고, 향후 확장 가능하도록 구조만 제공
     # 실제 구현은 librosa 같은 라이브러리 필요
-    logger = setup_logger("metadata")
-    logger.warning("BPM 감지 기능은 아직 구현되지 않았습니다.")
+    global _bpm_warned
+    if not _bpm_warned:
+        _log().warning("BPM 감지 기능은 아직 구현되지 않았습니다.")
+        _bpm_warned = True
     return None
 
 
@@ -603,6 +1119,7 @@ if __name__ == "__main__":
     parser.add_argument("--analyze", type=str, help="단일 파일 분석")
     parser.add_argument("--folder", type=str, help="폴더 전체 분석")
     parser.add_argument("--stats", type=str, help="폴더 통계 출력")
+    parser.add_argument("--approximate", action="store_true", help="통계 길이를 파일 크기/비트레이트로 추정")
     parser.add_argument("--update-db", action="store_true", help="DB 업데이트")
     parser.add_argument("--set-tags", type=str, help="태그 설정 (트랙 ID)")
     parser.add_argument("--title", type=str, help="제목")
@@ -610,9 +1127,15 @@ if __name__ == "__main__":
     parser.add_argument("--album", type=str, help="앨범")
     parser.add_argument("--genre", type=str, help="장르")
     parser.add_argument("--year", type=int, help="연도")
+    parser.add_argument("--num-workers", type=int, help="병렬 분석 워커 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--executor", type=str, choices=["process", "thread", "none"], help="병렬 실행 방식 (기본값: thread)")
+    parser.add_argument("--disk-cache", action="store_true", help="분석 결과 디스크 캐시 사용 (~/.cache/playlist)")
     
     args = parser.parse_args()
     
+    if args.disk_cache:
+        enable_disk_cache()
+    
     if args.analyze:
         # 단일 파일 분석
         file_path = args.analyze
@@ -640,7 +1163,7 @@ if __name__ == "__main__":
         print(f"\n📁 폴더 분석: {folder_path}")
         print("=" * 60)
         
-        files = analyze_folder(folder_path)
+        files = analyze_folder(folder_path, num_workers=args.num_workers, executor=args.executor)
         
         if not files:
             print("분석할 파일이 없습니다.")
@@ -659,10 +1182,11 @@ if __name__ == "__main__":
         print(f"\n📊 폴더 통계: {folder_path}")
         print("=" * 60)
         
-        stats = get_folder_statistics(folder_path)
+        stats = get_folder_statistics(folder_path, approximate=args.approximate)
         
         print(f"총 파일 수: {stats['total_files']}개")
-        print(f"총 길이: {stats['total_duration_formatted']} ({stats['total_duration_seconds']:.2f}초)")
+        approx_mark = " (추정)" if stats["approximate"] else ""
+        print(f"총 길이: {stats['total_duration_formatted']} ({stats['total_duration_seconds']:.2f}초){approx_mark}")
         print(f"평균 길이: {seconds_to_mmss(stats['average_duration'])}")
         print(f"총 크기: {stats['total_size_mb']:.2f} MB")
     
@@ -672,7 +1196,7 @@ if __name__ == "__main__":
         print("=" * 60)
         
         db = TrackDB()
-        result = update_all_metadata(db)
+        result = update_all_metadata(db, num_workers=args.num_workers, executor=args.executor)
         
         print(f"\n✅ 업데이트 완료!")
         print(f"  - 업데이트: {result['updated']}개")
@@ -3,28 +3,174 @@
 /music 폴더 스캔 및 DB 동기화
 """
 
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from db_manager import TrackDB
 from config_manager import load_config, get_path
 
+try:
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+
+def _stat(track: Dict[str, Any], kind: str) -> Optional[str]:
+    """
+    트랙의 단계별 상태 조회 (빈 딕셔너리 생성 없이 한 번만 접근)
+    
+    Args:
+        track: 트랙 데이터
+        kind: 단계 (music/image/video)
+    
+    Returns:
+        상태 문자열 또는 None
+    """
+    return (track.get(kind) or {}).get("status")
+
+
+def _plan(cur: Dict[str, Any], exists: bool, new_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    단계 하나의 동기화 변경 내용 계산
+    
+    Args:
+        cur: DB의 현재 단계 데이터 (music/image/video)
+        exists: 파일 존재 여부
+        new_path: 실제 파일 경로
+    
+    Returns:
+        변경할 {status, file_path} 딕셔너리, 변경 없으면 None
+    """
+    cur_status = cur.get("status")
+    if not exists:
+        # 파일이 사라졌으면 완료 상태만 되돌림
+        return {"status": "pending"} if cur_status == "completed" else None
+    
+    plan = {}
+    if cur_status != "completed":
+        plan["status"] = "completed"
+    if cur.get("file_path") != new_path:
+        plan["file_path"] = new_path
+    return plan or None
+
+
+class _IndexWatchHandler:
+    """watchdog 이벤트로 MusicScanner 폴더 인덱스를 갱신하는 핸들러"""
+    
+    def __init__(self, scanner: "MusicScanner", index_name: str, folder: str, extensions: Tuple[str, ...]):
+        """
+        _IndexWatchHandler 초기화
+        
+        Args:
+            scanner: 인덱스를 가진 MusicScanner
+            index_name: 갱신할 인덱스 속성 이름 (예: "_music_index")
+            folder: 감시 폴더 (인덱스 경로와 같은 문자열)
+            extensions: 허용 확장자 (앞쪽일수록 우선)
+        """
+        self.scanner = scanner
+        self.index_name = index_name
+        self.folder = folder
+        self.abs_folder = os.path.abspath(folder)
+        self.extensions = extensions
+        self.priority = {ext: rank for rank, ext in enumerate(extensions)}
+    
+    def dispatch(self, event: Any) -> None:
+        """watchdog 이벤트 처리 (생성/삭제/이동만 반영)"""
+        if event.is_directory:
+            return
+        
+        if event.event_type == "created":
+            self._add(event.src_path)
+        elif event.event_type == "deleted":
+            self._remove(event.src_path)
+        elif event.event_type == "moved":
+            self._remove(event.src_path)
+            self._add(event.dest_path)
+    
+    def _split(self, path: str) -> Optional[Tuple[str, str]]:
+        """감시 폴더의 지원 파일이면 (이름, 확장자), 아니면 None"""
+        if os.path.dirname(os.path.abspath(path)) != self.abs_folder:
+            return None
+        stem, ext = os.path.splitext(os.path.basename(path))
+        if ext.lower() not in self.priority:
+            return None
+        return stem, ext
+    
+    def _add(self, path: str) -> None:
+        """생성/이동된 파일을 인덱스에 반영 (확장자 우선순위 유지)"""
+        parts = self._split(path)
+        if parts is None:
+            return
+        stem, ext = parts
+        
+        with self.scanner._index_lock:
+            index = getattr(self.scanner, self.index_name)
+            current = index.get(stem)
+            current_rank = (
+                len(self.extensions) if current is None
+                else self.priority.get(os.path.splitext(current)[1].lower(), len(self.extensions))
+            )
+            if self.priority[ext.lower()] < current_rank:
+                index[stem] = os.path.join(self.folder, stem + ext)
+    
+    def _remove(self, path: str) -> None:
+        """삭제/이동된 파일을 인덱스에서 제거"""
+        parts = self._split(path)
+        if parts is None:
+            return
+        stem, ext = parts
+        
+        with self.scanner._index_lock:
+            index = getattr(self.scanner, self.index_name)
+            if index.get(stem) != os.path.join(self.folder, stem + ext):
+                return
+            del index[stem]
+            
+            # 같은 이름의 다른 확장자 파일이 남아 있으면 대체
+            for other_ext in self.extensions:
+                other_path = os.path.join(self.folder, stem + other_ext)
+                if os.path.exists(other_path):
+                    index[stem] = other_path
+                    break
+
 
 class MusicScanner:
     """음악 파일 스캐너 클래스"""
     
-    SUPPORTED_FORMATS = ['.mp3', '.wav', '.flac']
+    # 순서가 필요한 곳(확장자 우선순위)은 튜플, 포함 여부 확인은 frozenset 사용
+    SUPPORTED_FORMATS_TUPLE = ('.mp3', '.wav', '.flac')
+    SUPPORTED_FORMATS_SET = frozenset(SUPPORTED_FORMATS_TUPLE)
+    SUPPORTED_FORMATS = SUPPORTED_FORMATS_SET
+    IMAGE_FORMATS = ('.png', '.jpg', '.jpeg')
+    VIDEO_FORMATS = ('.mp4',)
+    
+    # 인덱스 미사용 시 파일 상태 확인 스레드 수 (네트워크 파일시스템 기준)
+    STATUS_WORKERS = 8
+    
+    # 실행 단위 카운터 (변경 없이 건너뛴 스캔에서는 0으로 보고)
+    PER_RUN_SUMMARY_KEYS = ("new_tracks_registered", "synced_tracks")
     
-    def __init__(self, music_folder: Optional[str] = None, db: Optional[TrackDB] = None):
+    def __init__(
+        self,
+        music_folder: Optional[str] = None,
+        db: Optional[TrackDB] = None,
+        use_index: bool = True
+    ):
         """
         MusicScanner 초기화
         
         Args:
             music_folder: 음악 폴더 경로 (None이면 config에서 로드)
             db: TrackDB 인스턴스 (None이면 새로 생성)
+            use_index: True면 폴더 인덱스로 파일 상태 확인,
+                       False면 트랙별 파일 확인 (스레드 풀 병렬)
         """
+        config = load_config()
         if music_folder is None:
-            config = load_config()
             music_folder = get_path('music_folder', config)
         
         self.music_folder = Path(music_folder)
@@ -36,42 +182,170 @@ class MusicScanner:
             self.db = db
         
         # 이미지/영상 폴더 경로 (config에서 로드)
-        config = load_config()
         self.image_folder = Path(get_path('image_folder', config))
         self.video_folder = Path(get_path('video_folder', config))
         self.image_folder.mkdir(parents=True, exist_ok=True)
         self.video_folder.mkdir(parents=True, exist_ok=True)
+        
+        # 반복 경로 연산용 문자열 경로 (Path 객체 생성/정규화 비용 회피)
+        self._music_folder_str = str(self.music_folder)
+        self._image_folder_str = str(self.image_folder)
+        self._video_folder_str = str(self.video_folder)
+        
+        # 폴더별 파일 인덱스 {track_id: 경로} (check_file_status용, 지연 생성)
+        self.use_index = use_index
+        self._music_index: Dict[str, str] = {}
+        self._image_index: Dict[str, str] = {}
+        self._video_index: Dict[str, str] = {}
+        self._indices_built = False
+        
+        # 파일 감시 (watch() 호출 시 인덱스를 이벤트로 갱신)
+        self._observer = None
+        self._index_lock = threading.Lock()
+    
+    def _index_folder(self, folder: str, extensions: Tuple[str, ...]) -> Dict[str, str]:
+        """
+        폴더를 한 번 순회해 {파일명(확장자 제외): 경로} 인덱스 생성
+        
+        Args:
+            folder: 대상 폴더
+            extensions: 허용 확장자 (앞쪽일수록 우선)
+        
+        Returns:
+            인덱스 딕셔너리 (같은 이름이 여러 확장자로 있으면 우선순위가 높은 쪽)
+        """
+        priority = {ext: rank for rank, ext in enumerate(extensions)}
+        index: Dict[str, str] = {}
+        ranks: Dict[str, int] = {}
+        
+        if not os.path.isdir(folder):
+            return index
+        
+        with os.scandir(folder) as it:
+            for entry in it:
+                stem, ext = os.path.splitext(entry.name)
+                # scan()과 같이 확장자는 대소문자 구분 없이 비교 (TRACK.MP3 등)
+                rank = priority.get(ext.lower())
+                if rank is None:
+                    continue
+                if stem not in ranks or rank < ranks[stem]:
+                    ranks[stem] = rank
+                    index[stem] = entry.path
+        
+        return index
+    
+    def _build_indices(self, scanned_tracks: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        음악/이미지/영상 폴더 인덱스 생성 (폴더당 디렉터리 목록 1회)
+        
+        Args:
+            scanned_tracks: 이미 수행한 scan() 결과 (있으면 음악 폴더는 다시 읽지 않음)
+        """
+        if scanned_tracks is not None:
+            rank = {ext: i for i, ext in enumerate(self.SUPPORTED_FORMATS_TUPLE)}
+            best: Dict[str, Dict[str, Any]] = {}
+            for track in scanned_tracks:
+                current = best.get(track["track_id"])
+                if current is None or rank[track["extension"]] < rank[current["extension"]]:
+                    best[track["track_id"]] = track
+            self._music_index = {track_id: track["file_path"] for track_id, track in best.items()}
+        else:
+            self._music_index = self._index_folder(self._music_folder_str, self.SUPPORTED_FORMATS_TUPLE)
+        self._image_index = self._index_folder(self._image_folder_str, self.IMAGE_FORMATS)
+        self._video_index = self._index_folder(self._video_folder_str, self.VIDEO_FORMATS)
+        self._indices_built = True
+    
+    def watch(self) -> bool:
+        """
+        음악/이미지/영상 폴더 감시 시작 (watchdog 필요)
+        
+        감시 중에는 파일 생성/삭제/이동 이벤트로 폴더 인덱스를 갱신하므로
+        full_scan_and_sync가 이미지/영상 폴더를 다시 읽지 않는다.
+        
+        Returns:
+            감시 시작 여부 (watchdog 미설치 또는 인덱스 미사용 시 False)
+        """
+        if not HAS_WATCHDOG or not self.use_index:
+            return False
+        if self._observer is not None:
+            return True
+        
+        observer = Observer()
+        for index_name, folder, extensions in (
+            ("_music_index", self._music_folder_str, self.SUPPORTED_FORMATS_TUPLE),
+            ("_image_index", self._image_folder_str, self.IMAGE_FORMATS),
+            ("_video_index", self._video_folder_str, self.VIDEO_FORMATS)
+        ):
+            observer.schedule(
+                _IndexWatchHandler(self, index_name, folder, extensions),
+                folder,
+                recursive=False
+            )
+        observer.daemon = True
+        observer.start()
+        
+        # 감시 시작 후 인덱스 생성 (그 사이 변경 누락 방지)
+        with self._index_lock:
+            self._build_indices()
+        self._observer = observer
+        return True
+    
+    def stop_watch(self) -> None:
+        """폴더 감시 중지"""
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join()
+        self._observer = None
     
     def scan(self) -> List[Dict[str, Any]]:
         """
         폴더 스캔 후 트랙 목록 반환
         
+        인덱스를 사용하고 폴더 감시 중이 아니면, 스캔할 때마다 폴더 인덱스도 새로 만든다
+        (오래 실행되는 UI 프로세스에서 첫 스냅샷을 계속 사용하지 않도록).
+        
         Returns:
             트랙 정보 리스트
         """
-        tracks = []
+        if not os.path.isdir(self._music_folder_str):
+            return []
         
-        if not self.music_folder.exists():
-            return tracks
-        
-        # 지원 포맷 파일 스캔
-        for ext in self.SUPPORTED_FORMATS:
-            for file_path in self.music_folder.glob(f"*{ext}"):
-                # 숨김 파일 제외
-                if file_path.name.startswith('.'):
+        # 디렉터리를 한 번만 순회 (DirEntry의 stat 캐시 재사용)
+        tracks = []
+        with os.scandir(self._music_folder_str) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.'):
                     continue
                 
-                track_id = self.get_track_id(file_path.name)
+                stem, ext = os.path.splitext(name)
+                ext = ext.lower()
+                if ext not in self.SUPPORTED_FORMATS_SET or not entry.is_file():
+                    continue
+                
+                try:
+                    st = entry.stat()
+                    size_bytes, mtime_ns = st.st_size, st.st_mtime_ns
+                except OSError:
+                    size_bytes, mtime_ns = 0, 0
+                
                 tracks.append({
-                    "track_id": track_id,
-                    "filename": file_path.name,
-                    "file_path": str(file_path),
+                    "track_id": stem,
+                    "filename": name,
+                    "file_path": entry.path,
                     "extension": ext,
-                    "size_bytes": file_path.stat().st_size if file_path.exists() else 0
+                    "size_bytes": size_bytes,
+                    "mtime_ns": mtime_ns
                 })
         
         # track_id 기준으로 정렬
         tracks.sort(key=lambda x: x["track_id"])
+        
+        # 폴더 인덱스 재생성 (음악 인덱스는 스캔 결과 재사용, 감시 중이면 이벤트로 최신 상태)
+        if self.use_index and self._observer is None:
+            with self._index_lock:
+                self._build_indices(tracks)
         return tracks
     
     def get_track_id(self, filename: str) -> str:
@@ -85,7 +359,7 @@ class MusicScanner:
             track_id (예: "track_001")
         """
         # 확장자 제거
-        name_without_ext = Path(filename).stem
+        name_without_ext = os.path.splitext(filename)[0]
         return name_without_ext
     
     def is_supported_format(self, filename: str) -> bool:
@@ -98,12 +372,11 @@ class MusicScanner:
         Returns:
             지원 여부
         """
-        ext = Path(filename).suffix.lower()
-        return ext in self.SUPPORTED_FORMATS
+        return os.path.splitext(filename)[1].lower() in self.SUPPORTED_FORMATS_SET
     
     def check_file_status(self, track_id: str) -> Dict[str, Any]:
         """
-        파일 존재 여부 확인
+        파일 존재 여부 확인 (폴더 인덱스 조회, 파일별 stat 없음)
         
         Args:
             track_id: 트랙 ID
@@ -111,6 +384,36 @@ class MusicScanner:
         Returns:
             파일 상태 딕셔너리
         """
+        if not self.use_index:
+            return self._probe_file_status(track_id)
+        
+        if not self._indices_built:
+            self._build_indices()
+        
+        music_path = self._music_index.get(track_id)
+        image_path = self._image_index.get(track_id)
+        video_path = self._video_index.get(track_id)
+        
+        return {
+            "track_id": track_id,
+            "music_exists": music_path is not None,
+            "music_path": music_path,
+            "image_exists": image_path is not None,
+            "image_path": image_path,
+            "video_exists": video_path is not None,
+            "video_path": video_path
+        }
+    
+    def _probe_file_status(self, track_id: str) -> Dict[str, Any]:
+        """
+        트랙별 파일 존재 여부를 직접 확인 (인덱스 미사용 시)
+        
+        Args:
+            track_id: 트랙 ID
+        
+        Returns:
+            파일 상태 딕셔너리 (check_file_status와 동일)
+        """
         status = {
             "track_id": track_id,
             "music_exists": False,
@@ -121,92 +424,72 @@ class MusicScanner:
             "video_path": None
         }
         
-        # 음악 파일 확인 (여러 확장자 체크)
-        for ext in self.SUPPORTED_FORMATS:
-            music_path = self.music_folder / f"{track_id}{ext}"
-            if music_path.exists():
-                status["music_exists"] = True
-                status["music_path"] = str(music_path)
-                break
-        
-        # 이미지 파일 확인 (png, jpg 둘 다 체크)
-        for ext in ['.png', '.jpg', '.jpeg']:
-            image_path = self.image_folder / f"{track_id}{ext}"
-            if image_path.exists():
-                status["image_exists"] = True
-                status["image_path"] = str(image_path)
-                break
-        
-        # 영상 파일 확인
-        video_path = self.video_folder / f"{track_id}.mp4"
-        if video_path.exists():
-            status["video_exists"] = True
-            status["video_path"] = str(video_path)
+        for kind, folder, extensions in (
+            ("music", self._music_folder_str, self.SUPPORTED_FORMATS_TUPLE),
+            ("image", self._image_folder_str, self.IMAGE_FORMATS),
+            ("video", self._video_folder_str, self.VIDEO_FORMATS)
+        ):
+            for ext in extensions:
+                path = os.path.join(folder, f"{track_id}{ext}")
+                if os.path.exists(path):
+                    status[f"{kind}_exists"] = True
+                    status[f"{kind}_path"] = path
+                    break
         
         return status
     
-    def sync_with_db(self, track_id: str, status: Dict[str, Any]) -> bool:
+    def sync_with_db(
+        self,
+        track_id: str,
+        status: Dict[str, Any],
+        track: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         파일 상태를 DB에 동기화
         
         Args:
             track_id: 트랙 ID
             status: 파일 상태 딕셔너리
+            track: 이미 조회한 트랙 데이터 (None이면 DB에서 조회)
         
         Returns:
             성공 여부
         """
-        track = self.db.get_track(track_id)
+        if track is None:
+            track = self.db.get_track(track_id)
         if track is None:
             return False
         
         updates = {}
-        
-        # 음악 상태 동기화
-        if status["music_exists"]:
-            if track.get("music", {}).get("status") != "completed":
-                updates.setdefault("music", {})["status"] = "completed"
-            if track.get("music", {}).get("file_path") != status["music_path"]:
-                updates.setdefault("music", {})["file_path"] = status["music_path"]
-        else:
-            if track.get("music", {}).get("status") == "completed":
-                updates.setdefault("music", {})["status"] = "pending"
-        
-        # 이미지 상태 동기화
-        if status["image_exists"]:
-            if track.get("image", {}).get("status") != "completed":
-                updates.setdefault("image", {})["status"] = "completed"
-            if track.get("image", {}).get("file_path") != status["image_path"]:
-                updates.setdefault("image", {})["file_path"] = status["image_path"]
-        else:
-            if track.get("image", {}).get("status") == "completed":
-                updates.setdefault("image", {})["status"] = "pending"
-        
-        # 영상 상태 동기화
-        if status["video_exists"]:
-            if track.get("video", {}).get("status") != "completed":
-                updates.setdefault("video", {})["status"] = "completed"
-            if track.get("video", {}).get("file_path") != status["video_path"]:
-                updates.setdefault("video", {})["file_path"] = status["video_path"]
-        else:
-            if track.get("video", {}).get("status") == "completed":
-                updates.setdefault("video", {})["status"] = "pending"
+        for kind in ("music", "image", "video"):
+            plan = _plan(track.get(kind) or {}, status[f"{kind}_exists"], status[f"{kind}_path"])
+            if plan:
+                updates[kind] = plan
         
         if updates:
             return self.db.update_track(track_id, updates)
         
         return True
     
-    def detect_new_tracks(self) -> List[str]:
+    def detect_new_tracks(
+        self,
+        scanned_tracks: Optional[List[Dict[str, Any]]] = None,
+        db_track_ids: Optional[set] = None
+    ) -> List[str]:
         """
         DB에 없는 새 트랙 ID 목록
         
+        Args:
+            scanned_tracks: 이미 수행한 scan() 결과 (None이면 새로 스캔)
+            db_track_ids: DB 트랙 ID 집합 (None이면 DB에서 조회)
+        
         Returns:
             새 트랙 ID 리스트
         """
-        scanned_tracks = self.scan()
-        db_tracks = self.db.get_all_tracks()
-        db_track_ids = {track.get("track_id") for track in db_tracks}
+        if scanned_tracks is None:
+            scanned_tracks = self.scan()
+        if db_track_ids is None:
+            db_track_ids = {track.get("track_id") for track in self.db.get_all_tracks()}
         
         new_track_ids = [
             track["track_id"] for track in scanned_tracks
@@ -230,12 +513,17 @@ class MusicScanner:
         if self.db.get_track(track_id) is not None:
             return False
         
-        # 음악 파일 경로 찾기
+        # 음악 파일 경로 찾기 (인덱스 우선, 인덱스 생성 이후 추가된 파일은 직접 확인)
+        if music_path is None and self.use_index:
+            if not self._indices_built:
+                self._build_indices()
+            music_path = self._music_index.get(track_id)
+        
         if music_path is None:
-            for ext in self.SUPPORTED_FORMATS:
-                path = self.music_folder / f"{track_id}{ext}"
-                if path.exists():
-                    music_path = str(path)
+            for ext in self.SUPPORTED_FORMATS_TUPLE:
+                path = os.path.join(self._music_folder_str, f"{track_id}{ext}")
+                if os.path.exists(path):
+                    music_path = path
                     break
         
         if music_path is None:
@@ -252,30 +540,100 @@ class MusicScanner:
         
         return self.db.add_track(track_id, initial_data)
     
-    def register_all_new(self) -> int:
+    def register_new_tracks_bulk(
+        self,
+        scanned_tracks: List[Dict[str, Any]],
+        db_track_ids: Optional[set] = None
+    ) -> int:
         """
-        모든 신규 트랙 일괄 등록
+        scan() 결과에서 DB에 없는 트랙을 한 번에 등록
+        
+        스캔 결과에 이미 파일 경로가 있으므로 파일을 다시 확인하지 않는다.
+        같은 track_id가 여러 확장자로 있으면 SUPPORTED_FORMATS_TUPLE 순서로 우선한다.
+        
+        Args:
+            scanned_tracks: scan() 결과
+            db_track_ids: DB 트랙 ID 집합 (None이면 DB에서 조회)
         
         Returns:
             등록된 트랙 개수
         """
-        new_track_ids = self.detect_new_tracks()
-        registered_count = 0
+        if db_track_ids is None:
+            db_track_ids = {track.get("track_id") for track in self.db.get_all_tracks()}
+        rank = {ext: i for i, ext in enumerate(self.SUPPORTED_FORMATS_TUPLE)}
         
-        for track_id in new_track_ids:
-            if self.register_new_track(track_id):
-                registered_count += 1
+        best: Dict[str, Dict[str, Any]] = {}
+        for track in scanned_tracks:
+            track_id = track["track_id"]
+            if track_id in db_track_ids:
+                continue
+            current = best.get(track_id)
+            if current is None or rank[track["extension"]] < rank[current["extension"]]:
+                best[track_id] = track
         
-        return registered_count
+        # 트랙 추가 (music 상태는 completed로 설정)
+        new_tracks = {
+            track_id: {
+                "track_id": track_id,
+                "music": {
+                    "status": "completed",
+                    "file_path": track["file_path"]
+                }
+            }
+            for track_id, track in best.items()
+        }
+        
+        return self.db.add_tracks_bulk(new_tracks)
+    
+    def register_all_new(self, scanned_tracks: Optional[List[Dict[str, Any]]] = None) -> int:
+        """
+        모든 신규 트랙 일괄 등록
+        
+        Args:
+            scanned_tracks: 이미 수행한 scan() 결과 (None이면 새로 스캔)
+        
+        Returns:
+            등록된 트랙 개수
+        """
+        if scanned_tracks is None:
+            scanned_tracks = self.scan()
+        return self.register_new_tracks_bulk(scanned_tracks)
     
-    def detect_missing_files(self) -> List[str]:
+    def detect_missing_files(
+        self,
+        refresh: bool = True,
+        db_tracks: Optional[List[Dict[str, Any]]] = None
+    ) -> List[str]:
         """
         파일은 없고 DB에만 있는 트랙 ID
         
+        Args:
+            refresh: True면 음악 폴더 인덱스를 새로 생성 (False면 기존 인덱스 사용)
+            db_tracks: 이미 조회한 DB 트랙 목록 (None이면 DB에서 조회)
+        
         Returns:
             누락된 트랙 ID 리스트
         """
-        db_tracks = self.db.get_all_tracks()
+        if db_tracks is None:
+            db_tracks = self.db.get_all_tracks()
+        
+        if self.use_index:
+            if refresh or not self._indices_built:
+                self._build_indices()
+            
+            # 음악 폴더 인덱스에 있으면 존재, 없을 때만 DB 경로를 직접 확인
+            # (음악 폴더 밖 경로로 등록된 트랙 대비)
+            music_index = self._music_index
+            missing_track_ids = []
+            for track in db_tracks:
+                track_id = track.get("track_id")
+                if track_id in music_index:
+                    continue
+                music_path = (track.get("music") or {}).get("file_path")
+                if not music_path or not os.path.exists(music_path):
+                    missing_track_ids.append(track_id)
+            return missing_track_ids
+        
         missing_track_ids = []
         
         for track in db_tracks:
@@ -283,7 +641,7 @@ class MusicScanner:
             music_path = track.get("music", {}).get("file_path")
             
             # 음악 파일이 없으면 누락으로 간주
-            if music_path and not Path(music_path).exists():
+            if music_path and not os.path.exists(music_path):
                 missing_track_ids.append(track_id)
             elif not music_path:
                 # DB에 경로가 없으면 스캔해서 확인
@@ -319,40 +677,120 @@ class MusicScanner:
         
         return False
     
-    def full_scan_and_sync(self) -> Dict[str, Any]:
+    def _scan_watermark(self, scanned_tracks: List[Dict[str, Any]]) -> List[Any]:
+        """
+        마지막 스캔 이후 변경 여부 판단용 워터마크
+        
+        음악 파일은 트랙별 (경로, 크기, mtime_ns)를 요약해 제자리 수정도 감지하고,
+        이미지/영상 폴더는 mtime(ns)(파일 추가/삭제/이름 변경 시 갱신), DB는 트랙 수를 사용한다.
+        
+        Args:
+            scanned_tracks: 이번 scan() 결과
+        
+        Returns:
+            [music_digest, image_mtime_ns, video_mtime_ns, total_tracks]
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for track in scanned_tracks:
+            digest.update(
+                f"{track['file_path']}\0{track['size_bytes']}\0{track['mtime_ns']}\n".encode("utf-8")
+            )
+        
+        watermark: List[Any] = [digest.hexdigest()]
+        for folder in (self._image_folder_str, self._video_folder_str):
+            try:
+                watermark.append(os.stat(folder).st_mtime_ns)
+            except OSError:
+                watermark.append(0)
+        watermark.append(len(self.db.load().get("tracks", {})))
+        return watermark
+    
+    def full_scan_and_sync(self, force: bool = False) -> Dict[str, Any]:
         """
         전체 스캔 수행, 결과 요약 반환
         
+        음악 폴더 스캔(디렉터리 목록 1회)은 항상 수행한다. 트랙별 파일 상태와
+        이미지/영상 폴더, DB 트랙 수가 마지막 스캔과 같고, 파일이 사라졌는데 아직
+        completed로 남은 트랙도 없으면 DB 동기화를 건너뛰고 저장된 요약의 총계만
+        반환한다 ("cached": True, 실행 단위 카운터는 0).
+        
+        Args:
+            force: True면 워터마크와 무관하게 전체 스캔
+        
         Returns:
             스캔 결과 요약
         """
-        # 스캔
+        # 스캔 (음악 폴더는 이번 스캔에서 한 번만 읽고, 폴더 인덱스도 함께 재생성)
         scanned_tracks = self.scan()
         total_music_files = len(scanned_tracks)
         
-        # 신규 트랙 등록
-        new_tracks_registered = self.register_all_new()
-        
-        # 누락 파일 감지
-        missing_files_found = len(self.detect_missing_files())
-        
-        # DB 동기화 (모든 트랙의 파일 상태 확인 및 업데이트)
-        db_tracks = self.db.get_all_tracks()
-        synced_count = 0
-        
-        for track in db_tracks:
-            track_id = track.get("track_id")
-            status = self.check_file_status(track_id)
-            if self.sync_with_db(track_id, status):
-                synced_count += 1
+        if not force:
+            last_summary = self.db.get_meta("last_scan_summary")
+            if (last_summary is not None and
+                    self.db.get_meta("last_scan_watermark") == self._scan_watermark(scanned_tracks)):
+                # DB↔디스크 대조는 인덱스 조회라 저렴하므로 건너뛰지 않음
+                db_tracks = self.db.get_all_tracks()
+                missing = set(self.detect_missing_files(refresh=False, db_tracks=db_tracks))
+                unreconciled = any(
+                    track.get("track_id") in missing and _stat(track, "music") == "completed"
+                    for track in db_tracks
+                )
+                if not unreconciled:
+                    no_change = {key: 0 for key in self.PER_RUN_SUMMARY_KEYS}
+                    return {
+                        **last_summary,
+                        **no_change,
+                        "missing_files_found": len(missing),
+                        "cached": True
+                    }
+        
+        # 등록/동기화 변경은 하나의 트랜잭션으로 묶어 한 번만 저장
+        with self.db.transaction():
+            # 신규 트랙 등록
+            db_tracks = self.db.get_all_tracks()
+            new_tracks_registered = self.register_new_tracks_bulk(
+                scanned_tracks,
+                db_track_ids={track.get("track_id") for track in db_tracks}
+            )
+            if new_tracks_registered:
+                db_tracks = self.db.get_all_tracks()
+            
+            # 누락 파일 감지
+            missing_files_found = len(
+                self.detect_missing_files(refresh=False, db_tracks=db_tracks)
+            )
+            
+            # DB 동기화 (트랙 목록은 한 번만 조회해 트랙별 재조회 없이 전달)
+            tracks_by_id = {track.get("track_id"): track for track in db_tracks}
+            synced_count = 0
+            
+            # 파일 상태 확인: 인덱스 사용 시 메모리 조회라 순차 처리,
+            # 인덱스 미사용 시 파일 확인(I/O)만 스레드 풀에서 병렬 처리
+            if self.use_index:
+                statuses = [self.check_file_status(track_id) for track_id in tracks_by_id]
+            else:
+                with ThreadPoolExecutor(max_workers=self.STATUS_WORKERS) as executor:
+                    statuses = list(executor.map(self.check_file_status, tracks_by_id))
+            
+            # DB 반영은 순차 처리
+            for status in statuses:
+                track_id = status["track_id"]
+                if self.sync_with_db(track_id, status, track=tracks_by_id[track_id]):
+                    synced_count += 1
+            
+            summary = {
+                "total_music_files": total_music_files,
+                "new_tracks_registered": new_tracks_registered,
+                "missing_files_found": missing_files_found,
+                "db_synced": synced_count == len(db_tracks),
+                "synced_tracks": synced_count
+            }
+            
+            # 워터마크 갱신 (동기화 결과와 같은 저장에 포함)
+            self.db.set_meta("last_scan_watermark", self._scan_watermark(scanned_tracks))
+            self.db.set_meta("last_scan_summary", summary)
         
-        return {
-            "total_music_files": total_music_files,
-            "new_tracks_registered": new_tracks_registered,
-            "missing_files_found": missing_files_found,
-            "db_synced": synced_count == len(db_tracks),
-            "synced_tracks": synced_count
-        }
+        return {**summary, "cached": False}
     
     def get_tracks_needing_image(self) -> List[Dict[str, Any]]:
         """
@@ -361,11 +799,7 @@ class MusicScanner:
         Returns:
             트랙 리스트
         """
-        all_tracks = self.db.get_all_tracks()
-        return [
-            track for track in all_tracks
-            if track.get("image", {}).get("status") in ["pending", "failed"]
-        ]
+        return self.db.query({"image.status": ("pending", "failed")})
     
     def get_tracks_needing_video(self) -> List[Dict[str, Any]]:
         """
@@ -374,12 +808,35 @@ class MusicScanner:
         Returns:
             트랙 리스트
         """
-        all_tracks = self.db.get_all_tracks()
-        return [
-            track for track in all_tracks
-            if track.get("video", {}).get("status") in ["pending", "failed"]
-            and track.get("image", {}).get("status") == "completed"
-        ]
+        return self.db.query({
+            "video.status": ("pending", "failed"),
+            "image.status": "completed"
+        })
+    
+    def count_tracks_needing_image(self) -> int:
+        """
+        이미지가 필요한 트랙 수 (목록 생성 없이 집계)
+        
+        Returns:
+            트랙 수
+        """
+        return sum(
+            1 for track in self.db.get_all_tracks()
+            if _stat(track, "image") in ("pending", "failed")
+        )
+    
+    def count_tracks_needing_video(self) -> int:
+        """
+        영상이 필요한 트랙 수 (목록 생성 없이 집계)
+        
+        Returns:
+            트랙 수
+        """
+        return sum(
+            1 for track in self.db.get_all_tracks()
+            if _stat(track, "video") in ("pending", "failed")
+            and _stat(track, "image") == "completed"
+        )
     
     def get_tracks_fully_completed(self) -> List[Dict[str, Any]]:
         """
@@ -388,13 +845,11 @@ class MusicScanner:
         Returns:
             트랙 리스트
         """
-        all_tracks = self.db.get_all_tracks()
-        return [
-            track for track in all_tracks
-            if (track.get("music", {}).get("status") == "completed" and
-                track.get("image", {}).get("status") == "completed" and
-                track.get("video", {}).get("status") == "completed")
-        ]
+        return self.db.query({
+            "music.status": "completed",
+            "image.status": "completed",
+            "video.status": "completed"
+        })
     
     def get_tracks_by_style(self, style: str) -> List[Dict[str, Any]]:
         """
@@ -406,11 +861,7 @@ class MusicScanner:
         Returns:
             트랙 리스트
         """
-        all_tracks = self.db.get_all_tracks()
-        return [
-            track for track in all_tracks
-            if track.get("image", {}).get("style") == style
-        ]
+        return self.db.query({"image.style": style})
 
 
 if __name__ == "__main__":
@@ -418,6 +869,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="음악 파일 스캐너")
     parser.add_argument("--scan", action="store_true", help="전체 스캔")
+    parser.add_argument("--force", action="store_true", help="변경이 없어도 전체 스캔 (--scan과 함께 사용)")
     parser.add_argument("--status", action="store_true", help="상태 요약 출력")
     parser.add_argument("--check", type=str, help="특정 트랙 상태 확인")
     parser.add_argument("--register-new", action="store_true", help="신규 트랙만 등록")
@@ -429,8 +881,8 @@ if __name__ == "__main__":
     
     if args.scan:
         print("전체 스캔 중...")
-        result = scanner.full_scan_and_sync()
-        print(f"\n스캔 결과:")
+        result = scanner.full_scan_and_sync(force=args.force)
+        print(f"\n스캔 결과{' (변경 없음, 이전 결과)' if result['cached'] else ''}:")
         print(f"  - 음악 파일: {result['total_music_files']}개")
         print(f"  - 신규 등록: {result['new_tracks_registered']}개")
         print(f"  - 누락 파일: {result['missing_files_found']}개")
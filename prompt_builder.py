@@ -4,15 +4,74 @@
 """
 
 import json
+import os
 import random
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from config_manager import load_config, get_path
+from config_manager import get_path
 
 
+# 음악 템플릿 변수 ({instrument}, {mood}, {tempo})
+_VAR_RE = re.compile(r"\{(instrument|mood|tempo)\}")
+
+# 음악 프롬프트 키워드 (스타일 + 일반 키워드를 한 번의 스캔으로 검출, 부분 문자열 매칭)
+_KW_RE = re.compile(r"celtic|lofi|jazz|ambient|classical|folk|traditional|electronic|synth|acoustic")
+
+# 음악 프롬프트에서 추출하는 시각 키워드 최대 개수
+_MAX_MUSIC_KEYWORDS = 5
+
+# 일반 키워드 그룹 → 시각 키워드 (그룹당 한 번만 추가)
+_GENERAL_VISUAL_KEYWORDS = (
+    (frozenset({"folk", "traditional"}), ["traditional", "heritage", "cultural"]),
+    (frozenset({"electronic", "synth"}), ["futuristic", "digital", "neon"]),
+    (frozenset({"acoustic"}), ["natural", "organic", "warm"]),
+)
+
+# random_elements.json에 항목이 없을 때 기본값
+_DEFAULT_ELEMENTS = {
+    "instrument": ["piano", "guitar"],
+    "mood": ["peaceful", "energetic"],
+    "tempo": ["moderate", "upbeat"]
+}
+
+
+def _get_prompt_folder() -> Path:
+    """
+    설정의 프롬프트 폴더 경로 반환
+    
+    get_path()의 기본 경로 캐시를 사용하므로 invalidate_config_cache() 후에는 새 설정을 따른다.
+    
+    Returns:
+        프롬프트 폴더 Path
+    """
+    return Path(get_path('prompt_folder'))
+
+
+@lru_cache(maxsize=None)
+def _load_random_elements(path_str: str) -> Dict[str, List[str]]:
+    """
+    random_elements.json 로드 (경로별 캐시)
+    
+    Args:
+        path_str: random_elements.json 경로
+    
+    Returns:
+        변수별 후보 리스트 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    elements_file = Path(path_str)
+    if not elements_file.exists():
+        return {}
+    
+    with open(elements_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
 def load_music_template(style: str) -> str:
     """
-    스타일별 음악 템플릿 로드
+    스타일별 음악 템플릿 로드 (스타일별 캐시)
     
     Args:
         style: 스타일 이름 (celtic, lofi, jazz, ambient)
@@ -20,9 +79,7 @@ def load_music_template(style: str) -> str:
     Returns:
         템플릿 문자열
     """
-    config = load_config()
-    prompt_folder = Path(get_path('prompt_folder', config))
-    music_folder = prompt_folder / "music"
+    music_folder = _get_prompt_folder() / "music"
     
     template_file = music_folder / f"{style}.txt"
     
@@ -49,37 +106,24 @@ def build_music_prompt(style: str, randomize: bool = True) -> str:
     
     if not randomize:
         # 변수 제거 (간단한 처리)
-        prompt = template.replace("{instrument}", "").replace("{mood}", "").replace("{tempo}", "")
+        prompt = _VAR_RE.sub("", template)
         prompt = prompt.replace("  ", " ").strip()
         return prompt
     
     # 랜덤 요소 로드
-    config = load_config()
-    prompt_folder = Path(get_path('prompt_folder', config))
-    music_folder = prompt_folder / "music"
-    elements_file = music_folder / "random_elements.json"
-    
-    elements = {}
-    if elements_file.exists():
-        with open(elements_file, 'r', encoding='utf-8') as f:
-            elements = json.load(f)
-    
-    # 변수 치환
-    prompt = template
-    
-    if "{instrument}" in prompt:
-        instruments = elements.get("instrument", ["piano", "guitar"])
-        prompt = prompt.replace("{instrument}", random.choice(instruments))
+    elements_file = _get_prompt_folder() / "music" / "random_elements.json"
+    elements = _load_random_elements(str(elements_file))
     
-    if "{mood}" in prompt:
-        moods = elements.get("mood", ["peaceful", "energetic"])
-        prompt = prompt.replace("{mood}", random.choice(moods))
+    # 변수 치환 (한 번의 스캔, 같은 변수는 같은 값으로 치환)
+    chosen: Dict[str, str] = {}
     
-    if "{tempo}" in prompt:
-        tempos = elements.get("tempo", ["moderate", "upbeat"])
-        prompt = prompt.replace("{tempo}", random.choice(tempos))
+    def _pick(match: "re.Match") -> str:
+        name = match.group(1)
+        if name not in chosen:
+            chosen[name] = random.choice(elements.get(name, _DEFAULT_ELEMENTS[name]))
+        return chosen[name]
     
-    return prompt.strip()
+    return _VAR_RE.sub(_pick, template).strip()
 
 
 def get_available_styles() -> List[str]:
@@ -89,19 +133,19 @@ def get_available_styles() -> List[str]:
     Returns:
         스타일 이름 리스트
     """
-    config = load_config()
-    prompt_folder = Path(get_path('prompt_folder', config))
-    music_folder = prompt_folder / "music"
+    music_folder = _get_prompt_folder() / "music"
     
     if not music_folder.exists():
         return []
     
-    styles = []
-    for file_path in music_folder.glob("*.txt"):
-        if file_path.name != "random_elements.json":
-            styles.append(file_path.stem)
+    with os.scandir(music_folder) as it:
+        styles = [
+            entry.name[:-4] for entry in it
+            if entry.name.endswith(".txt") and entry.is_file()
+        ]
     
-    return sorted(styles)
+    styles.sort()
+    return styles
 
 
 class ImagePromptBuilder:
@@ -123,14 +167,18 @@ class ImagePromptBuilder:
             prompt_folder: 프롬프트 폴더 경로 (None이면 config에서 로드)
         """
         if prompt_folder is None:
-            config = load_config()
-            prompt_folder = get_path('prompt_folder', config)
-        
-        self.prompt_folder = Path(prompt_folder)
+            self.prompt_folder = _get_prompt_folder()
+        else:
+            self.prompt_folder = Path(prompt_folder)
         self.quality_suffix = (
             "High quality, 4K resolution, cinematic lighting, "
             "professional photography, no text, no watermark."
         )
+        
+        # 스타일별 템플릿 캐시 / 스타일 목록 캐시 (폴더 mtime 기준)
+        self._template_cache: Dict[str, str] = {}
+        self._styles_cache: Optional[List[str]] = None
+        self._styles_mtime_ns: Optional[int] = None
     
     def load_style_template(self, style: str) -> str:
         """
@@ -142,14 +190,21 @@ class ImagePromptBuilder:
         Returns:
             템플릿 문자열
         """
+        cached = self._template_cache.get(style)
+        if cached is not None:
+            return cached
+        
         template_file = self.prompt_folder / f"style_{style}.txt"
         
         if not template_file.exists():
             # 기본 템플릿 반환
-            return "A beautiful, atmospheric background image for music visualization."
+            template = "A beautiful, atmospheric background image for music visualization."
+        else:
+            with open(template_file, 'r', encoding='utf-8') as f:
+                template = f.read().strip()
         
-        with open(template_file, 'r', encoding='utf-8') as f:
-            return f.read().strip()
+        self._template_cache[style] = template
+        return template
     
     def extract_keywords_from_music(self, music_prompt: str) -> List[str]:
         """
@@ -162,23 +217,26 @@ class ImagePromptBuilder:
             키워드 리스트
         """
         keywords = []
-        music_lower = music_prompt.lower()
         
-        # 스타일 매칭
+        # 프롬프트를 한 번만 스캔해 등장한 키워드 수집
+        found = set(_KW_RE.findall(music_prompt.lower()))
+        if not found:
+            return keywords
+        
+        # 스타일 매칭 (사전 순서 우선)
         for style, visual_keywords in self.MUSIC_TO_VISUAL_KEYWORDS.items():
-            if style in music_lower:
+            if style in found:
                 keywords.extend(visual_keywords)
                 break
         
-        # 일반 키워드 추출
-        if "folk" in music_lower or "traditional" in music_lower:
-            keywords.extend(["traditional", "heritage", "cultural"])
-        if "electronic" in music_lower or "synth" in music_lower:
-            keywords.extend(["futuristic", "digital", "neon"])
-        if "acoustic" in music_lower:
-            keywords.extend(["natural", "organic", "warm"])
+        # 일반 키워드 추출 (최대 5개가 채워지면 중단)
+        for group, visual_keywords in _GENERAL_VISUAL_KEYWORDS:
+            if len(keywords) >= _MAX_MUSIC_KEYWORDS:
+                break
+            if not found.isdisjoint(group):
+                keywords.extend(visual_keywords)
         
-        return keywords[:5]  # 최대 5개
+        return keywords[:_MAX_MUSIC_KEYWORDS]
     
     def build_prompt(
         self,
@@ -226,12 +284,29 @@ class ImagePromptBuilder:
         Returns:
             스타일 이름 리스트
         """
+        # 폴더가 바뀌지 않았으면 이전 목록 재사용
+        try:
+            mtime_ns = os.stat(self.prompt_folder).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self._styles_cache is not None and mtime_ns == self._styles_mtime_ns:
+            return list(self._styles_cache)
+        
         styles = []
-        for file_path in self.prompt_folder.glob("style_*.txt"):
-            style_name = file_path.stem.replace("style_", "")
-            styles.append(style_name)
+        if mtime_ns is not None:
+            with os.scandir(self.prompt_folder) as it:
+                styles = [
+                    entry.name[6:-4] for entry in it
+                    if entry.name.startswith("style_") and entry.name.endswith(".txt")
+                    and entry.is_file()
+                ]
+        
+        self._styles_cache = sorted(styles) if styles else ["default"]
+        self._styles_mtime_ns = mtime_ns
         
-        return sorted(styles) if styles else ["default"]
+        # 파일 추가/삭제가 있었으므로 템플릿 캐시도 초기화
+        self._template_cache.clear()
+        return list(self._styles_cache)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@
 필요한 폴더 구조를 자동으로 생성합니다."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
 REQUIRED_FOLDERS = [
     "music",
@@ -16,6 +18,23 @@ REQUIRED_FOLDERS = [
 ]
 
 
+def _mkdir_one(folder_path: Path) -> Tuple[Path, bool, Optional[Exception]]:
+    """
+    폴더 하나 생성 (스레드 풀 워커용)
+    
+    Args:
+        folder_path: 생성할 폴더 경로
+    
+    Returns:
+        (폴더 경로, 성공 여부, 예외)
+    """
+    try:
+        folder_path.mkdir(parents=True, exist_ok=True)
+        return folder_path, True, None
+    except Exception as e:
+        return folder_path, False, e
+
+
 def create_folders(base_path: str = ".") -> list[str]:
     """
     필요한 폴더들을 생성합니다.
@@ -29,15 +48,19 @@ def create_folders(base_path: str = ".") -> list[str]:
     base = Path(base_path)
     created_folders = []
     
-    for folder_name in REQUIRED_FOLDERS:
-        folder_path = base / folder_name
-        
-        try:
-            folder_path.mkdir(parents=True, exist_ok=True)
+    # mkdir은 병렬로 수행, 출력은 메인 스레드에서 폴더 순서대로
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_FOLDERS)) as executor:
+        results = list(executor.map(
+            lambda folder_name: _mkdir_one(base / folder_name),
+            REQUIRED_FOLDERS
+        ))
+    
+    for folder_path, ok, error in results:
+        if ok:
             created_folders.append(str(folder_path))
             print(f"[OK] {folder_path} 생성 완료")
-        except Exception as e:
-            print(f"[FAIL] {folder_path} 생성 실패: {e}")
+        else:
+            print(f"[FAIL] {folder_path} 생성 실패: {error}")
     
     return created_folders
 
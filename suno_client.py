@@ -3,15 +3,45 @@ Suno API 클라이언트 모듈
 음악 생성, 상태 확인, 다운로드 기능
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, Optional, List, Any, Callable
+from typing import Dict, Optional, List, Any, Callable, ClassVar
 from datetime import datetime, timedelta
 from config_manager import load_config, get_api_key, get_path
 from db_manager import TrackDB
 from logger import setup_logger
 
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# 프롬프트 정규화 (중복 생성 판별용)
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
 
 class SunoAPIError(Exception):
     """Suno API 관련 예외"""
@@ -31,63 +61,115 @@ class RateLimiter:
         """
         self.rpm = requests_per_minute
         self.daily_limit = daily_limit
-        self.request_times: List[float] = []
+        self.request_times: deque = deque()  # time.monotonic() 기준 요청 시각 (슬롯 예약 시점)
         self.daily_count = 0
-        self.daily_reset_time = self._get_midnight()
+        self._schedule_daily_reset(time.monotonic())
+        
+        # 여러 스레드(create_batch)가 공유하므로 기록/카운터 접근을 직렬화
+        # 슬롯을 기다리는 스레드는 잠금을 놓고 Condition에서 대기
+        self._lock = threading.RLock()
+        self._cond = threading.Condition(self._lock)
+    
+    def _schedule_daily_reset(self, now: float) -> None:
+        """
+        다음 자정을 계산해 리셋 시각 설정 (datetime은 여기서만 사용)
+        
+        Args:
+            now: 현재 time.monotonic() 값
+        """
+        wall_now = datetime.now()
+        self.daily_reset_time = wall_now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        # 리셋 시각의 monotonic 값 (요청마다 datetime.now() 호출 없이 비교)
+        self._daily_reset_mono = now + (self.daily_reset_time - wall_now).total_seconds()
+    
+    def _evict_expired(self, now: float) -> None:
+        """60초가 지난 요청 기록 제거 (오래된 것부터 순서대로 저장되어 있음)"""
+        request_times = self.request_times
+        while request_times and now - request_times[0] >= 60:
+            request_times.popleft()
     
-    def _get_midnight(self) -> datetime:
-        """다음 자정 시간 계산"""
-        now = datetime.now()
-        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        if now.hour >= 0:
-            midnight += timedelta(days=1)
-        return midnight
+    def _next_slot_delay_locked(self, now: float) -> float:
+        """분당 슬롯이 빌 때까지 남은 시간 (0이면 바로 가능, 잠금 보유 상태에서 호출)"""
+        self._evict_expired(now)
+        if len(self.request_times) < self.rpm:
+            return 0.0
+        return 60 - (now - self.request_times[0])
     
     def wait_if_needed(self) -> None:
-        """필요시 대기"""
-        now = time.time()
-        
-        # 일일 카운트 리셋 체크
-        if datetime.now() >= self.daily_reset_time:
-            self.reset_daily_count()
-        
-        # 일일 한도 체크
-        if self.daily_count >= self.daily_limit:
-            wait_seconds = (self.daily_reset_time - datetime.now()).total_seconds()
-            if wait_seconds > 0:
-                raise SunoAPIError(f"일일 한도 초과. {wait_seconds/3600:.1f}시간 후 재시도 가능합니다.")
-        
-        # 분당 요청 수 제한
-        self.request_times = [t for t in self.request_times if now - t < 60]
+        """
+        필요시 대기 후 분당 슬롯 예약 (스레드 안전)
         
-        if len(self.request_times) >= self.rpm:
-            wait_time = 60 - (now - self.request_times[0])
-            if wait_time > 0:
-                time.sleep(wait_time)
-                self.request_times = [t for t in self.request_times if now - t < 60]
+        슬롯 확인과 예약을 한 번에 처리하므로 여러 스레드가 동시에 통과해
+        분당 제한을 넘는 일이 없고, 대기 중에는 잠금을 놓아 다른 스레드가
+        카운터를 갱신할 수 있다.
+        """
+        with self._cond:
+            now = time.monotonic()
+            
+            # 일일 카운트 리셋 체크
+            if now >= self._daily_reset_mono:
+                self.reset_daily_count(now)
+            
+            # 일일 한도 체크
+            if self.daily_count >= self.daily_limit:
+                wait_seconds = self._daily_reset_mono - now
+                if wait_seconds > 0:
+                    raise SunoAPIError(f"일일 한도 초과. {wait_seconds/3600:.1f}시간 후 재시도 가능합니다.")
+            
+            # 분당 요청 수 제한 (슬라이딩 윈도우, 가장 오래된 기록이 만료될 때까지 대기)
+            delay = self._next_slot_delay_locked(now)
+            while delay > 0:
+                self._cond.wait(timeout=delay)
+                now = time.monotonic()
+                delay = self._next_slot_delay_locked(now)
+            
+            self.request_times.append(now)
     
     def can_make_request(self) -> bool:
         """요청 가능 여부"""
-        # 일일 카운트 리셋 체크
-        if datetime.now() >= self.daily_reset_time:
-            self.reset_daily_count()
-        
-        return self.daily_count < self.daily_limit
+        with self._cond:
+            # 일일 카운트 리셋 체크
+            now = time.monotonic()
+            if now >= self._daily_reset_mono:
+                self.reset_daily_count(now)
+            
+            return self.daily_count < self.daily_limit
     
     def record_request(self) -> None:
-        """요청 기록"""
-        self.request_times.append(time.time())
-        self.daily_count += 1
+        """요청 기록 (일일 카운트, 분당 슬롯은 wait_if_needed에서 예약됨)"""
+        with self._cond:
+            self.daily_count += 1
     
-    def reset_daily_count(self) -> None:
-        """일일 카운트 리셋 (자정 기준)"""
-        self.daily_count = 0
-        self.daily_reset_time = self._get_midnight()
+    def reset_daily_count(self, now: Optional[float] = None) -> None:
+        """
+        일일 카운트 리셋 (자정 기준)
+        
+        Args:
+            now: 호출 측에서 이미 읽은 time.monotonic() 값 (None이면 새로 읽음)
+        """
+        with self._cond:
+            self.daily_count = 0
+            self._schedule_daily_reset(time.monotonic() if now is None else now)
 
 
 class SunoClient:
     """Suno API 클라이언트"""
     
+    # 응답 캐시 (성공 응답만 저장, 초과 시 오래 사용하지 않은 항목부터 제거)
+    MAX_CACHE_SIZE = 1000
+    STATUS_CACHE_TTL = 5        # check_status 폴링 중복 방지 (초)
+    GENERATE_CACHE_TTL = 60     # 같은 generate 요청 중복 제출 방지 (초)
+    
+    # 429 응답 시 재시도 횟수 (초과하면 SunoAPIError)
+    MAX_RATE_LIMIT_RETRIES = 5
+    
+    # 메모리 다운로드 시 이 크기 미만이면 content-length만큼 버퍼를 미리 할당
+    MAX_PREALLOC_BYTES = 100 << 20
+    
+    # 클라이언트 간 공유 (로거 핸들러 중복 생성 방지)
+    _shared_logger: ClassVar[Optional[logging.Logger]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, api_key: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
         """
         SunoClient 초기화
@@ -102,39 +184,125 @@ class SunoClient:
         if api_key is None:
             api_key = get_api_key('suno', config)
         
+        self._config = config
+        self.music_folder = Path(get_path('music_folder', config))
+        
         self.api_key = api_key
         self.base_url = config.get("suno", {}).get("api_base_url", "https://api.suno.ai")
         self.model = config.get("suno", {}).get("model", "v3.5")
         self.timeout = config.get("suno", {}).get("timeout_seconds", 300)
         self.daily_limit = config.get("suno", {}).get("daily_limit", 60)
         
+        # 인증 헤더는 한 번만 만들어 세션 기본 헤더로 사용
+        self._api_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
         self.session = requests.Session()
+        self.session.headers.update(self._api_headers)
+        self._mount_adapters()
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # 병렬 create_track 간 track_id 중복 방지 (DB 등록 전까지 예약)
+        self._id_lock = threading.Lock()
+        self._reserved_ids: set = set()
+        
         self.rate_limiter = RateLimiter(
             requests_per_minute=10,
             daily_limit=self.daily_limit
         )
         
-        self.logger = setup_logger("suno_client")
+        self.logger = self._get_shared_logger()
     
-    def _get_headers(self) -> Dict[str, str]:
+    @staticmethod
+    def _open_db() -> TrackDB:
         """
-        인증 헤더 반환
+        db 미지정 시 사용할 TrackDB (호출마다 새로 생성)
+        
+        TrackDB는 처음 로드한 내용을 계속 사용하므로, 오래 유지하면 스캐너/파이프라인의
+        다른 인스턴스가 등록한 트랙을 놓치고 저장 시 덮어쓸 수 있다.
+        """
+        return TrackDB()
+    
+    @classmethod
+    def _get_shared_logger(cls) -> logging.Logger:
+        """공유 로거 (setup_logger는 호출마다 핸들러를 다시 만들므로 한 번만 호출)"""
+        if cls._shared_logger is None:
+            with cls._shared_lock:
+                if cls._shared_logger is None:
+                    cls._shared_logger = setup_logger("suno_client")
+        return cls._shared_logger
+    
+    def _mount_adapters(self) -> None:
+        """
+        세션에 연결 풀/재시도 어댑터 장착 (Suno API와 오디오 CDN 공용)
+        
+        - 동시 요청(create_batch 등)을 위해 호스트당 연결 풀 확대
+        - 연결 오류와 5xx는 지수 백오프로 자동 재시도 (멱등 메서드만)
+        - 429는 RateLimiter 기록과 Retry-After 처리를 위해 _request에서 직접 처리
+        """
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def _cache_key(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> str:
+        """
+        요청 캐시 키 (메서드 + 엔드포인트 + 정규화한 본문/파라미터의 SHA-256)
         
         Returns:
-            헤더 딕셔너리
+            16진수 해시 문자열
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        body = json.dumps(
+            {"json": kwargs.get("json"), "params": kwargs.get("params")},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(f"{method}:{endpoint}:{body}".encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 캐시 응답 반환 (없으면 None)"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if time.monotonic() >= expires_at:
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return response
     
-    def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    def _cache_put(self, key: str, response: Dict[str, Any], ttl: float) -> None:
+        """성공 응답 캐시 저장 (최대 개수 초과 시 LRU 제거)"""
+        with self._cache_lock:
+            self._response_cache[key] = (time.monotonic() + ttl, response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.MAX_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        cache_ttl: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
         """
         공통 요청 래퍼 (에러 핸들링 포함)
         
         Args:
             method: HTTP 메서드 (GET, POST 등)
             endpoint: API 엔드포인트
+            cache_ttl: 지정 시 같은 요청의 성공 응답을 이 시간(초) 동안 재사용
+                       (멱등 요청 또는 중복 제출 방지용으로만 사용)
             **kwargs: requests 요청 파라미터
         
         Returns:
@@ -143,33 +311,44 @@ class SunoClient:
         Raises:
             SunoAPIError: API 오류 시
         """
-        # Rate Limit 체크
-        if not self.rate_limiter.can_make_request():
-            raise SunoAPIError("일일 요청 한도에 도달했습니다.")
-        
-        self.rate_limiter.wait_if_needed()
+        cache_key = None
+        if cache_ttl:
+            cache_key = self._cache_key(method, endpoint, kwargs)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        
+        # orjson이 있으면 본문을 미리 직렬화 (Content-Type은 세션 기본 헤더)
+        if HAS_ORJSON and kwargs.get("json") is not None:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                timeout=self.timeout,
-                **kwargs
-            )
-            
-            # Rate Limit 기록
-            self.rate_limiter.record_request()
-            
-            # 429 Rate Limit 처리
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                # Rate Limit 체크 (일일 한도 확인 + 분당 슬롯 대기, 시계 1회 조회)
+                self.rate_limiter.wait_if_needed()
+                
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    timeout=self.timeout,
+                    **kwargs
+                )
+                
+                # Rate Limit 기록
+                self.rate_limiter.record_request()
+                
+                if response.status_code != 429:
+                    break
+                
+                # 429 Rate Limit 처리 (Retry-After 우선, 없으면 지수 백오프)
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise SunoAPIError(f"Rate limit 재시도 횟수 초과 ({self.MAX_RATE_LIMIT_RETRIES}회)")
+                retry_after = int(response.headers.get("Retry-After", min(60, 5 * 2 ** attempt)))
+                response.close()  # 대기 중 연결을 풀에 반환
                 self.logger.warning(f"Rate limit 도달. {retry_after}초 대기...")
                 time.sleep(retry_after)
-                return self._request(method, endpoint, **kwargs)
             
             # 401 인증 오류
             if response.status_code == 401:
@@ -178,7 +357,10 @@ class SunoClient:
             # 기타 오류
             response.raise_for_status()
             
-            return response.json()
+            result = orjson.loads(response.content) if HAS_ORJSON else response.json()
+            if cache_key is not None:
+                self._cache_put(cache_key, result, cache_ttl)
+            return result
         
         except requests.exceptions.Timeout:
             raise SunoAPIError(f"요청 시간 초과 (timeout: {self.timeout}초)")
@@ -186,6 +368,9 @@ class SunoClient:
             raise SunoAPIError("네트워크 연결 실패")
         except requests.exceptions.RequestException as e:
             raise SunoAPIError(f"API 요청 실패: {str(e)}")
+        except ValueError as e:
+            # JSON 파싱 실패 (orjson.JSONDecodeError / requests JSONDecodeError 모두 ValueError)
+            raise SunoAPIError(f"응답 파싱 실패: {str(e)}")
     
     def health_check(self) -> bool:
         """
@@ -206,6 +391,39 @@ class SunoClient:
             self.logger.error(f"Health check 실패: {e}")
             return False
     
+    def _build_generate_payload(
+        self,
+        prompt: str,
+        style: Optional[str],
+        duration: int,
+        instrumental: bool,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        음악 생성 요청 페이로드 구성 (동기/비동기 공용)
+        
+        Raises:
+            SunoAPIError: 프롬프트가 비어있을 때
+        """
+        # 프롬프트 검증
+        if not prompt or len(prompt.strip()) == 0:
+            raise SunoAPIError("프롬프트가 비어있습니다.")
+        
+        # 요청 페이로드 구성
+        payload = {
+            "prompt": prompt,
+            "model": self.model,
+            "duration": duration,
+            "instrumental": instrumental,
+            "make_instrumental": instrumental
+        }
+        
+        if style:
+            payload["style"] = style
+        
+        payload.update(kwargs)
+        return payload
+    
     def generate_music(
         self,
         prompt: str,
@@ -233,32 +451,18 @@ class SunoClient:
         Raises:
             SunoAPIError: API 오류 시
         """
-        # 프롬프트 검증
-        if not prompt or len(prompt.strip()) == 0:
-            raise SunoAPIError("프롬프트가 비어있습니다.")
-        
-        # 요청 페이로드 구성
-        payload = {
-            "prompt": prompt,
-            "model": self.model,
-            "duration": duration,
-            "instrumental": instrumental,
-            "make_instrumental": instrumental
-        }
-        
-        if style:
-            payload["style"] = style
-        
-        payload.update(kwargs)
+        payload = self._build_generate_payload(prompt, style, duration, instrumental, **kwargs)
         
         try:
             # 실제 엔드포인트는 Suno API 문서에 따라 수정 필요
-            # 예시: response = self._request("POST", "/v1/generate", json=payload)
+            # 예시: response = self._request("POST", "/v1/generate", json=payload,
+            #                                 cache_ttl=self.GENERATE_CACHE_TTL)
             # 현재는 구조만 구현
             self.logger.info(f"음악 생성 요청: {prompt[:50]}...")
             
             # 실제 API 호출 (엔드포인트는 실제 문서 확인 필요)
-            # response = self._request("POST", "/v1/generate", json=payload)
+            # response = self._request("POST", "/v1/generate", json=payload,
+            #                          cache_ttl=self.GENERATE_CACHE_TTL)
             
             # 임시 응답 (실제 API 연동 시 제거)
             return {
@@ -290,7 +494,8 @@ class SunoClient:
         """
         try:
             # 실제 엔드포인트는 Suno API 문서에 따라 수정 필요
-            # 예시: response = self._request("GET", f"/v1/status/{task_id}")
+            # 예시: response = self._request("GET", f"/v1/status/{task_id}",
+            #                                 cache_ttl=self.STATUS_CACHE_TTL)
             
             # 임시 응답 (실제 API 연동 시 제거)
             return {
@@ -313,16 +518,22 @@ class SunoClient:
     def wait_for_completion(
         self,
         task_id: str,
-        poll_interval: int = 10,
-        timeout: int = 300
+        poll_interval: int = 5,
+        timeout: int = 300,
+        estimated_time: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         완료될 때까지 대기
         
+        예상 시간이 있으면 그 시간만큼 먼저 기다린 뒤 폴링을 시작하고,
+        이후 간격은 1.5배씩 늘린다(최대 30초 또는 timeout/10).
+        병렬 작업끼리 폴링 시점이 겹치지 않도록 간격에 ±20% 지터를 준다.
+        
         Args:
             task_id: 작업 ID
-            poll_interval: 폴링 간격(초)
+            poll_interval: 최소 폴링 간격(초)
             timeout: 최대 대기 시간(초)
+            estimated_time: generate_music 응답의 예상 소요 시간(초)
         
         Returns:
             완료된 작업 정보 (audio_url 포함)
@@ -332,6 +543,12 @@ class SunoClient:
             SunoAPIError: 생성 실패
         """
         start_time = time.time()
+        max_delay = max(poll_interval, min(30, timeout / 10))
+        delay = max(poll_interval, (estimated_time or 0) * 0.5)
+        
+        # 예상 시간 전에는 완료될 가능성이 낮으므로 바로 폴링하지 않음
+        if estimated_time:
+            time.sleep(min(estimated_time, timeout))
         
         while True:
             status = self.check_status(task_id)
@@ -354,13 +571,52 @@ class SunoClient:
             progress = status.get("progress", 0)
             self.logger.info(f"작업 {task_id} 진행 중... {progress}%")
             
-            time.sleep(poll_interval)
+            delay = min(delay * 1.5, max_delay)
+            time.sleep(min(delay * random.uniform(0.8, 1.2), max(0, timeout - elapsed)))
+    
+    def _read_body(self, response: requests.Response, chunk_size: int) -> bytearray:
+        """
+        스트리밍 응답 본문 전체를 하나의 버퍼로 수신
+        
+        content-length를 알면 버퍼를 미리 할당해 청크를 제자리에 복사하고
+        (크기 재할당/중간 bytes 생성 없음), 모르거나 너무 크면 이어 붙인다.
+        
+        Returns:
+            본문 bytearray
+        """
+        total_size = int(response.headers.get('content-length', 0))
+        if not 0 < total_size < self.MAX_PREALLOC_BYTES:
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                buf += chunk
+            return buf
+        
+        buf = bytearray(total_size)
+        view = memoryview(buf)
+        off = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            end = off + len(chunk)
+            if end > total_size:
+                # content-length보다 길게 오면 (압축 해제 등) 남은 부분은 이어 붙임
+                view.release()
+                del buf[off:]
+                buf += chunk
+                for rest in response.iter_content(chunk_size=chunk_size):
+                    buf += rest
+                return buf
+            view[off:end] = chunk
+            off = end
+        view.release()
+        
+        del buf[off:]
+        return buf
     
     def download_audio(
         self,
         audio_url: str,
         save_path: str,
-        chunk_size: int = 8192
+        chunk_size: int = 1 << 20,
+        tags: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         오디오 파일 다운로드
@@ -368,7 +624,8 @@ class SunoClient:
         Args:
             audio_url: 다운로드 URL
             save_path: 저장 경로 (예: ./music/track_001.mp3)
-            chunk_size: 다운로드 청크 크기
+            chunk_size: 다운로드 청크 크기 (기본 1 MiB)
+            tags: MP3 태그 (지정 시 메모리에서 태그 적용 후 한 번에 저장)
         
         Returns:
             성공 여부
@@ -379,22 +636,36 @@ class SunoClient:
             
             self.logger.info(f"오디오 다운로드 시작: {audio_url}")
             
-            response = self.session.get(audio_url, stream=True, timeout=self.timeout)
+            # 오디오 CDN에는 API 키를 보내지 않음 (None이면 세션 헤더에서 제외)
+            response = self.session.get(
+                audio_url,
+                headers={"Authorization": None},
+                stream=True,
+                timeout=self.timeout
+            )
             response.raise_for_status()
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            if tags:
+                # 전체를 받아 메모리에서 태그 적용 → 파일 재오픈 없이 한 번에 기록
+                from metadata import set_mp3_tags_inmemory
+                
+                audio_bytes = self._read_body(response, chunk_size)
+                try:
+                    audio_bytes = set_mp3_tags_inmemory(audio_bytes, tags)
+                except Exception as e:
+                    self.logger.warning(f"태그 적용 실패, 원본으로 저장: {e}")
+                
+                with open(save_path_obj, 'wb') as f:
+                    f.write(audio_bytes)
+                
+                self.logger.info(f"다운로드 완료: {save_path}")
+                return True
             
+            # raw 스트림을 파일로 바로 복사 (청크별 파이썬 처리 없음)
+            # 버퍼드 파일은 부분 쓰기 없이 전체 기록을 보장 (raw FileIO는 짧은 write를 반환할 수 있음)
+            response.raw.decode_content = True
             with open(save_path_obj, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            if downloaded % (chunk_size * 10) == 0:  # 10청크마다 로깅
-                                self.logger.debug(f"다운로드 진행: {progress:.1f}%")
+                shutil.copyfileobj(response.raw, f, length=chunk_size)
             
             self.logger.info(f"다운로드 완료: {save_path}")
             return True
@@ -403,53 +674,86 @@ class SunoClient:
             self.logger.error(f"다운로드 실패: {e}")
             return False
     
-    def generate_track_id(self, prefix: str = "track") -> str:
+    def generate_track_id(self, prefix: str = "track", db: Optional[TrackDB] = None) -> str:
         """
         새 트랙 ID 생성
-        기존 파일 확인 후 다음 번호 부여
+        DB 기준 다음 번호를 부여하고, 같은 이름의 파일이 이미 있으면 건너뜀
         
         Args:
             prefix: 트랙 ID 접두사
+            db: TrackDB 인스턴스 (None이면 호출마다 새로 로드)
         
         Returns:
             트랙 ID (예: track_001)
         """
-        config = load_config()
-        music_folder = Path(get_path('music_folder', config))
+        if db is None:
+            db = self._open_db()
+        
+        music_folder = self.music_folder
         music_folder.mkdir(parents=True, exist_ok=True)
         
-        # 기존 파일에서 최대 번호 찾기
-        max_num = 0
-        for file_path in music_folder.glob(f"{prefix}_*.mp3"):
-            try:
-                num_str = file_path.stem.split('_')[1]
-                num = int(num_str)
-                max_num = max(max_num, num)
-            except (ValueError, IndexError):
-                continue
-        
-        # DB에서도 확인
-        db = TrackDB()
-        all_tracks = db.get_all_tracks()
-        for track in all_tracks:
-            track_id = track.get("track_id", "")
-            if track_id.startswith(prefix + "_"):
-                try:
-                    num_str = track_id.split('_')[1]
-                    num = int(num_str)
-                    max_num = max(max_num, num)
-                except (ValueError, IndexError):
-                    continue
+        track_id = db.next_track_id(prefix)
         
-        # 다음 번호 생성
-        next_num = max_num + 1
-        return f"{prefix}_{next_num:03d}"
+        # DB에 등록되지 않은 파일 / 다른 스레드가 예약한 ID 건너뜀 (보통 stat 1회)
+        next_num = int(track_id[len(prefix) + 1:])
+        while track_id in self._reserved_ids or os.path.exists(os.path.join(music_folder, f"{track_id}.mp3")):
+            next_num += 1
+            track_id = f"{prefix}_{next_num:03d}"
+        
+        return track_id
+    
+    def _content_hash(
+        self,
+        prompt: str,
+        style: Optional[str],
+        duration: int = 120,
+        instrumental: bool = False
+    ) -> str:
+        """
+        생성 요청 내용 해시 (소문자/구두점 제거/공백 정리한 프롬프트 + 모델/스타일/길이/보컬 여부)
+        
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        norm = _SPACE_RE.sub(" ", _PUNCT_RE.sub("", prompt.lower())).strip()
+        key = f"{self.model}|{style}|{duration}|{instrumental}|{norm}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    
+    def _find_existing_track(self, db: TrackDB, content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 요청으로 이미 완료된 트랙 조회 (파일이 남아있는 경우만)
+        
+        Returns:
+            create_track 형식의 결과 딕셔너리 또는 None
+        """
+        for track in db.query({"music.content_hash": content_hash, "music.status": "completed"}):
+            music = track.get("music", {})
+            file_path = music.get("file_path")
+            if file_path and Path(file_path).exists():
+                self.logger.info(f"같은 요청의 기존 트랙 재사용: {track['track_id']}")
+                return {
+                    "success": True,
+                    "track_id": track["track_id"],
+                    "file_path": file_path,
+                    "duration": music.get("duration_seconds"),
+                    "suno_task_id": music.get("suno_task_id"),
+                    "reused": True
+                }
+        return None
+    
+    def _reserve_track_id(self, db: TrackDB) -> str:
+        """track_id 생성 후 DB 등록 전까지 예약 (병렬 실행 시 중복 방지)"""
+        with self._id_lock:
+            track_id = self.generate_track_id(db=db)
+            self._reserved_ids.add(track_id)
+        return track_id
     
     def create_track(
         self,
         prompt: str,
         style: str = "default",
         db: Optional[TrackDB] = None,
+        reuse_existing: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -458,7 +762,8 @@ class SunoClient:
         Args:
             prompt: 음악 프롬프트
             style: 스타일
-            db: TrackDB 인스턴스 (None이면 새로 생성)
+            db: TrackDB 인스턴스 (None이면 호출마다 새로 로드)
+            reuse_existing: True면 같은 요청으로 완료된 트랙이 있을 때 재생성하지 않고 반환
             **kwargs: 추가 파라미터
         
         Returns:
@@ -469,40 +774,53 @@ class SunoClient:
                 "duration": 185.5,
                 "suno_task_id": "suno_xxx_xxx"
             }
+            (기존 트랙 재사용 시 "reused": True 추가)
         """
         if db is None:
-            db = TrackDB()
+            db = self._open_db()
+        
+        content_hash = self._content_hash(
+            prompt, style, kwargs.get("duration", 120), kwargs.get("instrumental", False)
+        )
+        if reuse_existing:
+            existing = self._find_existing_track(db, content_hash)
+            if existing is not None:
+                return existing
         
         track_id = None  # 초기화 (에러 처리 시 사용)
         
         try:
-            # 1. track_id 생성
-            track_id = self.generate_track_id()
+            # 1. track_id 생성 (DB 등록 전까지 예약해 병렬 실행 시 중복 방지)
+            track_id = self._reserve_track_id(db)
             self.logger.info(f"새 트랙 ID 생성: {track_id}")
             
             # 2. 음악 생성 요청
             result = self.generate_music(prompt, style=style, **kwargs)
             suno_task_id = result["task_id"]
             
-            # DB에 트랙 추가 (pending 상태)
-            db.add_track(track_id)
-            db.update_track(track_id, {
-                "music": {
-                    "status": "processing",
-                    "suno_task_id": suno_task_id,
-                    "suno_prompt": prompt
-                }
-            })
+            # DB에 트랙 추가 (processing 상태, 한 번만 저장)
+            with db.transaction():
+                db.add_track(track_id)
+                db.update_track(track_id, {
+                    "music": {
+                        "status": "processing",
+                        "suno_task_id": suno_task_id,
+                        "suno_prompt": prompt,
+                        "content_hash": content_hash
+                    }
+                })
+            self._reserved_ids.discard(track_id)
             
             # 3. 완료 대기
             self.logger.info(f"음악 생성 대기 중... (task_id: {suno_task_id})")
-            completed = self.wait_for_completion(suno_task_id)
+            completed = self.wait_for_completion(
+                suno_task_id,
+                estimated_time=result.get("estimated_time")
+            )
             audio_url = completed["audio_url"]
             
             # 4. 파일 다운로드
-            config = load_config()
-            music_folder = Path(get_path('music_folder', config))
-            file_path = music_folder / f"{track_id}.mp3"
+            file_path = self.music_folder / f"{track_id}.mp3"
             
             if not self.download_audio(audio_url, str(file_path)):
                 raise SunoAPIError("오디오 다운로드 실패")
@@ -540,9 +858,12 @@ class SunoClient:
         
         except Exception as e:
             self.logger.error(f"트랙 생성 실패: {e}")
+            if track_id:
+                self._reserved_ids.discard(track_id)
             if db and track_id:
-                db.add_error_log(track_id, "music", str(e))
-                db.update_status(track_id, "music", "failed")
+                with db.transaction():
+                    db.add_error_log(track_id, "music", str(e))
+                    db.update_status(track_id, "music", "failed")
             raise
     
     def create_batch(
@@ -554,10 +875,15 @@ class SunoClient:
         """
         배치 음악 생성
         
+        생성 대기(폴링)가 대부분이므로 스레드 풀로 동시에 진행한다.
+        동시 실행 수는 분당 요청 수와 남은 할당량 중 작은 값이며,
+        실제 요청 간격은 공유 RateLimiter가 조절한다.
+        
         Args:
             prompts: [{"prompt": "...", "style": "celtic"}, ...]
             db: 트랙 DB
-            progress_callback: 진행 콜백 함수 (current, total, track_id)
+            progress_callback: 진행 콜백 함수 (current, total, track_id, result)
+                               - 완료 순서대로 메인 스레드에서 호출
         
         Returns:
             {
@@ -568,31 +894,388 @@ class SunoClient:
             }
         """
         if db is None:
-            db = TrackDB()
+            db = self._open_db()
         
         total = len(prompts)
         successful = 0
         failed = 0
         tracks = []
         
-        for i, prompt_data in enumerate(prompts, 1):
-            prompt = prompt_data.get("prompt", "")
-            style = prompt_data.get("style", "default")
+        if total == 0:
+            return {
+                "total_requested": 0,
+                "successful": 0,
+                "failed": 0,
+                "tracks": tracks
+            }
+        
+        max_workers = max(1, min(self.rate_limiter.rpm, self.get_remaining_quota(), total))
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="suno_batch") as executor:
+            futures = [
+                executor.submit(
+                    self.create_track,
+                    prompt_data.get("prompt", ""),
+                    style=prompt_data.get("style", "default"),
+                    db=db
+                )
+                for prompt_data in prompts
+            ]
             
-            try:
-                result = self.create_track(prompt, style=style, db=db)
-                tracks.append(result)
-                successful += 1
+            for i, future in enumerate(as_completed(futures), 1):
+                try:
+                    result = future.result()
+                    tracks.append(result)
+                    successful += 1
+                    
+                    if progress_callback:
+                        progress_callback(i, total, result["track_id"], "success")
+                
+                except Exception as e:
+                    failed += 1
+                    self.logger.error(f"배치 생성 실패 ({i}/{total}): {e}")
+                    
+                    if progress_callback:
+                        progress_callback(i, total, None, "failed")
+        
+        return {
+            "total_requested": total,
+            "successful": successful,
+            "failed": failed,
+            "tracks": tracks
+        }
+    
+    # ------------------------------------------------------------------
+    # 비동기 API (aiohttp 설치 시) - 한 스레드에서 여러 트랙의 대기를 겹쳐 처리
+    # ------------------------------------------------------------------
+    
+    def _async_session(self) -> "aiohttp.ClientSession":
+        """
+        비동기 세션 생성 (호출 측에서 async with로 닫음)
+        
+        인증 헤더는 오디오 CDN에 보내지 않도록 _arequest에서만 붙인다.
+        
+        Raises:
+            SunoAPIError: aiohttp 미설치 시
+        """
+        if not HAS_AIOHTTP:
+            raise SunoAPIError("비동기 기능을 사용하려면 aiohttp를 설치하세요: pip install aiohttp")
+        
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=32)
+        )
+    
+    async def _arequest(
+        self,
+        session: "aiohttp.ClientSession",
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        공통 요청 래퍼의 비동기 버전 (_request와 같은 에러 처리)
+        
+        Args:
+            session: _async_session()으로 만든 세션
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            **kwargs: aiohttp 요청 파라미터
+        
+        Returns:
+            응답 JSON 딕셔너리
+        
+        Raises:
+            SunoAPIError: API 오류 시
+        """
+        url = f"{self.base_url}{endpoint}"
+        loop = asyncio.get_running_loop()
+        
+        try:
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                # RateLimiter 대기는 블로킹이므로 이벤트 루프 밖에서 실행
+                await loop.run_in_executor(None, self.rate_limiter.wait_if_needed)
+                
+                async with session.request(method, url, headers=self._api_headers, **kwargs) as response:
+                    self.rate_limiter.record_request()
+                    
+                    if response.status == 429:
+                        if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                            raise SunoAPIError(
+                                f"Rate limit 재시도 횟수 초과 ({self.MAX_RATE_LIMIT_RETRIES}회)"
+                            )
+                        retry_after = int(response.headers.get("Retry-After", min(60, 5 * 2 ** attempt)))
+                    else:
+                        if response.status == 401:
+                            raise SunoAPIError("API 키가 유효하지 않습니다.")
+                        
+                        response.raise_for_status()
+                        return await response.json()
                 
-                if progress_callback:
-                    progress_callback(i, total, result["track_id"], "success")
+                self.logger.warning(f"Rate limit 도달. {retry_after}초 대기...")
+                await asyncio.sleep(retry_after)
+        
+        except asyncio.TimeoutError:
+            raise SunoAPIError(f"요청 시간 초과 (timeout: {self.timeout}초)")
+        except aiohttp.ClientConnectionError:
+            raise SunoAPIError("네트워크 연결 실패")
+        except aiohttp.ClientError as e:
+            raise SunoAPIError(f"API 요청 실패: {str(e)}")
+    
+    async def generate_music_async(
+        self,
+        session: "aiohttp.ClientSession",
+        prompt: str,
+        style: Optional[str] = None,
+        duration: int = 120,
+        instrumental: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """generate_music의 비동기 버전 (반환 형식 동일)"""
+        payload = self._build_generate_payload(prompt, style, duration, instrumental, **kwargs)
+        
+        self.logger.info(f"음악 생성 요청: {prompt[:50]}...")
+        
+        # 실제 API 호출 (엔드포인트는 실제 문서 확인 필요)
+        # return await self._arequest(session, "POST", "/v1/generate", json=payload)
+        
+        # 임시 응답 (실제 API 연동 시 제거)
+        return {
+            "task_id": f"suno_{int(time.time())}",
+            "status": "pending",
+            "estimated_time": 60
+        }
+    
+    async def check_status_async(
+        self,
+        session: "aiohttp.ClientSession",
+        task_id: str
+    ) -> Dict[str, Any]:
+        """check_status의 비동기 버전 (반환 형식 동일)"""
+        try:
+            # 실제 API 호출 (엔드포인트는 실제 문서 확인 필요)
+            # return await self._arequest(session, "GET", f"/v1/status/{task_id}")
+            
+            # 임시 응답 (실제 API 연동 시 제거)
+            return {
+                "task_id": task_id,
+                "status": "processing",
+                "progress": 0,
+                "audio_url": None,
+                "error": None
+            }
+        
+        except Exception as e:
+            return {
+                "task_id": task_id,
+                "status": "failed",
+                "progress": 0,
+                "audio_url": None,
+                "error": str(e)
+            }
+    
+    async def wait_for_completion_async(
+        self,
+        session: "aiohttp.ClientSession",
+        task_id: str,
+        poll_interval: int = 5,
+        timeout: int = 300,
+        estimated_time: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """wait_for_completion의 비동기 버전 (같은 백오프/지터, 대기 중 다른 작업 진행)"""
+        start_time = time.time()
+        max_delay = max(poll_interval, min(30, timeout / 10))
+        delay = max(poll_interval, (estimated_time or 0) * 0.5)
+        
+        if estimated_time:
+            await asyncio.sleep(min(estimated_time, timeout))
+        
+        while True:
+            status = await self.check_status_async(session, task_id)
+            
+            if status["status"] == "completed":
+                if not status.get("audio_url"):
+                    raise SunoAPIError("완료되었지만 audio_url이 없습니다.")
+                return status
+            
+            if status["status"] == "failed":
+                error_msg = status.get("error", "알 수 없는 오류")
+                raise SunoAPIError(f"음악 생성 실패: {error_msg}")
+            
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
+                raise TimeoutError(f"타임아웃 초과 ({timeout}초)")
+            
+            self.logger.info(f"작업 {task_id} 진행 중... {status.get('progress', 0)}%")
+            
+            delay = min(delay * 1.5, max_delay)
+            await asyncio.sleep(min(delay * random.uniform(0.8, 1.2), max(0, timeout - elapsed)))
+    
+    async def download_audio_async(
+        self,
+        session: "aiohttp.ClientSession",
+        audio_url: str,
+        save_path: str,
+        chunk_size: int = 1 << 20
+    ) -> bool:
+        """download_audio의 비동기 버전 (성공 여부 반환)"""
+        try:
+            save_path_obj = Path(save_path)
+            save_path_obj.parent.mkdir(parents=True, exist_ok=True)
+            
+            self.logger.info(f"오디오 다운로드 시작: {audio_url}")
+            
+            async with session.get(audio_url) as response:
+                response.raise_for_status()
+                # 버퍼드 파일로 기록 (raw FileIO의 부분 쓰기로 파일이 잘리지 않도록)
+                with open(save_path_obj, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+            
+            self.logger.info(f"다운로드 완료: {save_path}")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"다운로드 실패: {e}")
+            return False
+    
+    async def create_track_async(
+        self,
+        session: "aiohttp.ClientSession",
+        prompt: str,
+        style: str = "default",
+        db: Optional[TrackDB] = None,
+        reuse_existing: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """create_track의 비동기 버전 (반환 형식 동일)"""
+        if db is None:
+            db = self._open_db()
+        
+        content_hash = self._content_hash(
+            prompt, style, kwargs.get("duration", 120), kwargs.get("instrumental", False)
+        )
+        if reuse_existing:
+            existing = self._find_existing_track(db, content_hash)
+            if existing is not None:
+                return existing
+        
+        track_id = None
+        
+        try:
+            track_id = self._reserve_track_id(db)
+            self.logger.info(f"새 트랙 ID 생성: {track_id}")
+            
+            result = await self.generate_music_async(session, prompt, style=style, **kwargs)
+            suno_task_id = result["task_id"]
+            
+            with db.transaction():
+                db.add_track(track_id)
+                db.update_track(track_id, {
+                    "music": {
+                        "status": "processing",
+                        "suno_task_id": suno_task_id,
+                        "suno_prompt": prompt,
+                        "content_hash": content_hash
+                    }
+                })
+            self._reserved_ids.discard(track_id)
+            
+            self.logger.info(f"음악 생성 대기 중... (task_id: {suno_task_id})")
+            completed = await self.wait_for_completion_async(
+                session,
+                suno_task_id,
+                estimated_time=result.get("estimated_time")
+            )
+            
+            file_path = self.music_folder / f"{track_id}.mp3"
             
-            except Exception as e:
-                failed += 1
-                self.logger.error(f"배치 생성 실패 ({i}/{total}): {e}")
+            if not await self.download_audio_async(session, completed["audio_url"], str(file_path)):
+                raise SunoAPIError("오디오 다운로드 실패")
+            
+            db.update_track(track_id, {
+                "music": {
+                    "status": "completed",
+                    "file_path": str(file_path)
+                }
+            })
+            
+            self.logger.info(f"트랙 생성 완료: {track_id}")
+            
+            return {
+                "success": True,
+                "track_id": track_id,
+                "file_path": str(file_path),
+                "duration": db.get_track(track_id).get("music", {}).get("duration_seconds"),
+                "suno_task_id": suno_task_id
+            }
+        
+        except Exception as e:
+            self.logger.error(f"트랙 생성 실패: {e}")
+            if track_id:
+                self._reserved_ids.discard(track_id)
+            if db and track_id:
+                with db.transaction():
+                    db.add_error_log(track_id, "music", str(e))
+                    db.update_status(track_id, "music", "failed")
+            raise
+    
+    async def create_batch_async(
+        self,
+        prompts: List[Dict[str, Any]],
+        db: Optional[TrackDB] = None,
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, Any]:
+        """
+        create_batch의 비동기 버전 (aiohttp 필요)
+        
+        하나의 이벤트 루프에서 모든 트랙의 생성 대기를 겹쳐 처리하며,
+        동시에 진행하는 트랙 수는 분당 요청 수로 제한한다.
+        사용 예: asyncio.run(client.create_batch_async(prompts))
+        
+        Args:
+            prompts: [{"prompt": "...", "style": "celtic"}, ...]
+            db: 트랙 DB
+            progress_callback: 진행 콜백 함수 (current, total, track_id, result)
+        
+        Returns:
+            create_batch와 같은 형식의 결과 딕셔너리
+        """
+        if db is None:
+            db = self._open_db()
+        
+        total = len(prompts)
+        successful = 0
+        failed = 0
+        tracks = []
+        
+        semaphore = asyncio.Semaphore(max(1, self.rate_limiter.rpm))
+        
+        async with self._async_session() as session:
+            async def _run(prompt_data: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.create_track_async(
+                        session,
+                        prompt_data.get("prompt", ""),
+                        style=prompt_data.get("style", "default"),
+                        db=db
+                    )
+            
+            for i, coro in enumerate(asyncio.as_completed([_run(p) for p in prompts]), 1):
+                try:
+                    result = await coro
+                    tracks.append(result)
+                    successful += 1
+                    
+                    if progress_callback:
+                        progress_callback(i, total, result["track_id"], "success")
                 
-                if progress_callback:
-                    progress_callback(i, total, None, "failed")
+                except Exception as e:
+                    failed += 1
+                    self.logger.error(f"배치 생성 실패 ({i}/{total}): {e}")
+                    
+                    if progress_callback:
+                        progress_callback(i, total, None, "failed")
         
         return {
             "total_requested": total,
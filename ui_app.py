@@ -3,16 +3,20 @@ Streamlit UI 애플리케이션
 음악 → 이미지 → 영상 파이프라인 관리 인터페이스
 """
 
+import copy
+import io
+import os
+import pandas as pd
 import streamlit as st
 import time
 from pathlib import Path
+from PIL import Image
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from ui_handlers import (
     init_handlers,
     handle_get_statistics,
-    handle_run_full_pipeline,
     handle_get_track_list,
     handle_get_track_detail,
     handle_generate_image_single,
@@ -59,12 +63,175 @@ apply_theme()
 # 유틸리티 함수
 # ─────────────────────────────────────────
 
-@st.cache_resource
+def _release_handlers(handlers: Dict[str, Any]) -> None:
+    """캐시에서 제거된 핸들러의 DB 캐시 해제"""
+    handlers["db"].close()
+    handlers["failed_db"].close()
+
+
+try:
+    _cache_handlers = st.cache_resource(on_release=_release_handlers)
+except TypeError:
+    # on_release를 지원하지 않는 Streamlit 버전
+    _cache_handlers = st.cache_resource
+
+
+@_cache_handlers
 def get_handlers():
-    """핸들러 객체 캐시"""
+    """핸들러 객체 캐시 (main()에서 한 번 조회해 각 페이지에 전달)"""
     return init_handlers()
 
 
+@st.cache_data(ttl="30s", max_entries=16)
+def _cached_track_list(filter_status: str) -> Dict[str, Any]:
+    """
+    필터별 트랙 목록 캐시 (위젯 조작으로 인한 재실행마다 DB 조회 방지)
+    
+    DB를 변경한 뒤에는 _cached_track_list.clear()로 무효화한다.
+    """
+    return handle_get_track_list(get_handlers()["db"], filter_status)
+
+
+@st.cache_data(ttl="1m", max_entries=64)
+def _preview_prompt(track_id: str, style: str) -> Dict[str, Any]:
+    """트랙/스타일별 이미지 프롬프트 미리보기 캐시"""
+    handlers = get_handlers()
+    return handle_preview_image_prompt(track_id, style, handlers["prompt_builder"], handlers["db"])
+
+
+@st.cache_data(ttl="5m")
+def _image_styles() -> Dict[str, Any]:
+    """이미지 스타일 목록 캐시 (세션 중 거의 바뀌지 않음, 템플릿 추가는 5분 내 반영)"""
+    return handle_get_image_styles(get_handlers()["prompt_builder"])
+
+
+@st.cache_data(ttl="5m")
+def _music_styles() -> Dict[str, Any]:
+    """음악 스타일 목록 캐시 (세션 중 거의 바뀌지 않음, 템플릿 추가는 5분 내 반영)"""
+    return handle_get_available_styles()
+
+
+@st.cache_data(ttl="10m")
+def _ffmpeg_status() -> Dict[str, Any]:
+    """FFmpeg 환경 체크 결과 캐시 (재실행마다 ffmpeg 프로세스 실행 방지)"""
+    return handle_check_ffmpeg(get_handlers()["video_renderer"])
+
+
+@st.cache_data(ttl="10s", max_entries=16)
+def _existing_files(folder: str) -> frozenset:
+    """
+    폴더의 파일 이름 집합 캐시 (파일마다 stat 호출 대신 scandir 한 번)
+    
+    파일을 생성한 뒤에는 _cached_track_list와 함께 _existing_files.clear()로 무효화한다.
+    
+    Args:
+        folder: 폴더 경로
+    
+    Returns:
+        파일 이름 frozenset (폴더가 없으면 빈 집합)
+    """
+    try:
+        with os.scandir(folder) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+# 갤러리 썸네일 최대 크기 (px) / JPEG 품질
+THUMBNAIL_SIZE = (256, 256)
+THUMBNAIL_QUALITY = 80
+
+
+@st.cache_data(ttl="1h", max_entries=500)
+def _thumb(path: str, mtime: float) -> bytes:
+    """
+    갤러리용 축소 JPEG 썸네일 캐시 (원본 PNG 대신 전송)
+    
+    Args:
+        path: 이미지 파일 경로
+        mtime: 파일 수정 시각 (재생성 시 캐시 무효화용 키)
+    
+    Returns:
+        JPEG 바이트
+    """
+    with Image.open(path) as img:
+        img.thumbnail(THUMBNAIL_SIZE)
+        buf = io.BytesIO()
+        img.convert("RGB").save(buf, "JPEG", quality=THUMBNAIL_QUALITY)
+    return buf.getvalue()
+
+
+def _file_exists(file_path: Optional[str]) -> bool:
+    """
+    파일 존재 여부 (상위 폴더의 _existing_files 캐시 사용)
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        존재 여부
+    """
+    if not file_path:
+        return False
+    path = Path(file_path)
+    return path.name in _existing_files(str(path.parent))
+
+
+# 세션 상태 기본값 (main()에서 실행마다 한 번 setdefault)
+SESSION_DEFAULTS = {
+    "current_page": "대시보드",
+    "pipeline_seen_runs": 0,  # 이 세션에서 확인한 백그라운드 파이프라인 완료 수
+    "music_filter": "all"  # 음악 목록에 적용된 상태 필터
+}
+
+# 백그라운드 파이프라인 진행 상황 갱신 주기 (초)
+PIPELINE_POLL_INTERVAL = 0.5
+
+# 음악 목록 페이지당 트랙 수
+MUSIC_LIST_PAGE_SIZE = 25
+
+# 이미지 대상 선택 표에 표시할 최대 트랙 수 ('전체 생성'은 제한 없음)
+IMAGE_SELECT_MAX_ROWS = 200
+
+# 부분 재실행 데코레이터 (지원하지 않는 Streamlit 버전에서는 일반 함수로 동작)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# 진행률 UI 갱신 최소 간격 (초, 마지막 항목은 항상 갱신)
+PROGRESS_MIN_INTERVAL = 0.1
+
+# 음악 목록 상태 필터 표시 이름
+_STATUS_LABELS = {
+    "all": "전체",
+    "need_image": "이미지 필요",
+    "need_video": "영상 필요",
+    "completed": "완료",
+    "failed": "실패"
+}
+
+# 영상 해상도 표시 이름
+_RESOLUTION_LABELS = {
+    "1920x1080": "1920x1080 (YouTube HD)",
+    "1080x1920": "1080x1920 (Shorts)",
+    "1080x1080": "1080x1080 (Instagram)"
+}
+
+
+def render_progress(slot, progress: float, *lines: str) -> None:
+    """
+    진행 바와 상태 텍스트를 하나의 placeholder에 한 번에 렌더링
+    
+    Args:
+        slot: st.empty() placeholder
+        progress: 진행률 (0~1)
+        *lines: 진행 바 아래 표시할 텍스트 (빈 값은 생략)
+    """
+    with slot.container():
+        st.progress(progress)
+        for line in lines:
+            if line:
+                st.text(line)
+
+
 def format_duration(seconds: float) -> str:
     """초를 MM:SS 형식으로 변환"""
     if seconds is None:
@@ -74,6 +241,13 @@ def format_duration(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def format_durations(seconds_list: List[Optional[float]]) -> List[str]:
+    """초 목록을 MM:SS 형식 목록으로 한 번에 변환 (format_duration의 일괄 버전)"""
+    total = pd.Series(seconds_list, dtype="float64").fillna(0).astype("int64")
+    minutes, secs = total // 60, total % 60
+    return (minutes.map("{:02d}".format) + ":" + secs.map("{:02d}".format)).tolist()
+
+
 def format_file_size(size_bytes: float) -> str:
     """바이트를 MB 형식으로 변환"""
     if size_bytes is None:
@@ -103,13 +277,11 @@ def format_eta(eta_seconds: float) -> str:
 # 대시보드 페이지
 # ─────────────────────────────────────────
 
-def render_dashboard():
+def render_dashboard(handlers: Dict[str, Any]):
     """대시보드 페이지 렌더링 (Mantine 스타일)"""
     # 페이지 제목
     st.markdown('<h1 class="m-title-h1 m-fade-in" style="overflow: visible !important; white-space: normal !important; word-break: keep-all !important; color: #212529 !important;">대시보드</h1>', unsafe_allow_html=True)
     
-    handlers = get_handlers()
-    
     # 통계 조회
     result = handle_get_statistics(handlers["db"])
     
@@ -124,9 +296,9 @@ def render_dashboard():
     # 통계 카드 그리드 (CSS Grid)
     total = stats.get("total_tracks", 0)
     music_completed = stats.get("music", {}).get("completed", 0)
-    music_total = stats.get("music", {}).get("completed", 0) + stats.get("music", {}).get("pending", 0)
+    music_total = stats.get("music", {}).get("target", 0)
     image_completed = stats.get("image", {}).get("completed", 0)
-    image_total = stats.get("image", {}).get("completed", 0) + stats.get("image", {}).get("pending", 0)
+    image_total = stats.get("image", {}).get("target", 0)
     fully_completed = stats.get("fully_completed", 0)
 
     metric_cards = [
@@ -153,15 +325,18 @@ def render_dashboard():
     
     with col1:
         if st.button("전체 실행", type="primary", use_container_width=True):
-            run_pipeline_with_progress({})
+            run_pipeline_with_progress({}, handlers)
     
     with col2:
         if st.button("이미지만", use_container_width=True):
-            run_pipeline_with_progress({"skip_music": True, "skip_videos": True})
+            run_pipeline_with_progress({"skip_music": True, "skip_videos": True}, handlers)
     
     with col3:
         if st.button("영상만", use_container_width=True):
-            run_pipeline_with_progress({"skip_music": True, "skip_images": True})
+            run_pipeline_with_progress({"skip_music": True, "skip_images": True}, handlers)
+    
+    # 진행 상황 (백그라운드 실행, 주기적으로 이 영역만 갱신)
+    render_pipeline_monitor(handlers)
     
     st.markdown('</div>', unsafe_allow_html=True)
     st.markdown('<hr class="m-divider">', unsafe_allow_html=True)
@@ -196,34 +371,25 @@ def render_dashboard():
     st.markdown('</div>', unsafe_allow_html=True)
 
 
-def run_pipeline_with_progress(options: Dict[str, Any]):
-    """진행 상황을 표시하며 파이프라인 실행"""
-    handlers = get_handlers()
-    
-    # 세션 상태로 취소 플래그 관리
-    if "pipeline_cancelled" not in st.session_state:
-        st.session_state.pipeline_cancelled = False
-    
-    progress_container = st.container()
-    
-    with progress_container:
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        eta_text = st.empty()
-        
-        col1, col2 = st.columns([3, 1])
-        with col2:
-            cancel_button = st.button("취소", key="cancel_pipeline")
-            if cancel_button:
-                st.session_state.pipeline_cancelled = True
-        
-        def progress_callback(stage, current, total, track_id=None, eta=None, message=None):
-            # 취소 확인
-            if st.session_state.get("pipeline_cancelled", False):
-                raise KeyboardInterrupt("사용자 취소")
-            
-            progress = current / total if total > 0 else 0
-            progress_bar.progress(progress)
+def run_pipeline_with_progress(options: Dict[str, Any], handlers: Dict[str, Any]):
+    """파이프라인을 백그라운드에서 시작 (진행 상황은 render_pipeline_monitor에서 표시)"""
+    if not handlers["pipeline_worker"].start(options):
+        st.warning("파이프라인이 이미 실행 중입니다.")
+
+
+def _render_pipeline_monitor_body(handlers: Dict[str, Any]):
+    """백그라운드 파이프라인 진행 상황/결과 표시"""
+    worker = handlers["pipeline_worker"]
+    progress_info = worker.poll()
+    
+    if worker.is_running():
+        if progress_info:
+            stage = progress_info["stage"]
+            current = progress_info["current"]
+            total = progress_info["total"]
+            track_id = progress_info["track_id"]
+            message = progress_info["message"]
+            eta = progress_info["eta"]
             
             status_msg = f"[{stage}] "
             if track_id:
@@ -232,33 +398,50 @@ def run_pipeline_with_progress(options: Dict[str, Any]):
             if message:
                 status_msg += f" - {message}"
             
-            status_text.text(status_msg)
-            
-            if eta is not None:
-                eta_text.text(f"예상 남은 시간: {format_eta(eta)}")
+            eta_msg = f"예상 남은 시간: {format_eta(eta)}" if eta is not None else ""
+            render_progress(st.empty(), current / total if total > 0 else 0, status_msg, eta_msg)
+        else:
+            render_progress(st.empty(), 0, "파이프라인 시작 중...")
         
-        try:
-            st.session_state.pipeline_cancelled = False
-            result = handle_run_full_pipeline(
-                handlers["pipeline"],
-                options,
-                progress_callback=progress_callback
-            )
-            
-            if result["success"]:
-                st.success("파이프라인 실행 완료!")
-                display_result_summary(result["data"])
-            else:
-                error = result["error"]
-                st.error(f"{error['type']}: {error['message']}")
-                st.info(f"안내: {error['action']}")
+        col1, col2 = st.columns([3, 1])
+        with col2:
+            if st.button("취소", key="cancel_pipeline", disabled=worker.cancel_event.is_set()):
+                worker.cancel()
         
-        except KeyboardInterrupt:
+        if not hasattr(st, "fragment"):
+            # 자동 갱신 fragment를 지원하지 않으면 전체 재실행으로 갱신
+            time.sleep(PIPELINE_POLL_INTERVAL)
+            st.rerun()
+        return
+    
+    # 새로 끝난 실행이 있으면 캐시를 비우고 전체 페이지 갱신 (통계 반영)
+    if worker.run_count != st.session_state.pipeline_seen_runs:
+        st.session_state.pipeline_seen_runs = worker.run_count
+        _cached_track_list.clear()
+        _existing_files.clear()
+        st.rerun()
+    
+    result = worker.result
+    if result is None:
+        return
+    
+    if result["success"]:
+        data = result["data"]
+        if data.get("interrupted"):
             st.warning("사용자에 의해 취소되었습니다.")
-            st.session_state.pipeline_cancelled = False
-        except Exception as e:
-            st.error(f"오류 발생: {str(e)}")
-            st.session_state.pipeline_cancelled = False
+        else:
+            st.success("파이프라인 실행 완료!")
+            display_result_summary(data)
+    else:
+        error = result["error"]
+        st.error(f"{error['type']}: {error['message']}")
+        st.info(f"안내: {error['action']}")
+
+
+if hasattr(st, "fragment"):
+    render_pipeline_monitor = st.fragment(run_every=PIPELINE_POLL_INTERVAL)(_render_pipeline_monitor_body)
+else:
+    render_pipeline_monitor = _render_pipeline_monitor_body
 
 
 def display_result_summary(result: Dict[str, Any]):
@@ -288,12 +471,66 @@ def display_result_summary(result: Dict[str, Any]):
 # 음악 목록 페이지
 # ─────────────────────────────────────────
 
-def render_music_generation():
+@st.cache_data(ttl="2m", max_entries=64)
+def _auto_build_prompt(user_input: str) -> Dict[str, Any]:
+    """입력 문구별 자동 프롬프트 미리보기 캐시 (같은 문구를 다시 입력하면 재생성하지 않음)"""
+    return handle_auto_build_prompt(user_input)
+
+
+@_fragment
+def _music_prompt_preview():
+    """
+    음악 설명 입력과 자동 프롬프트 미리보기 (fragment: 입력할 때마다 페이지 전체를 다시 실행하지 않음)
+    
+    미리보기 결과는 st.session_state["music_preview"]에 (프롬프트, 감지된 스타일)로 저장한다.
+    감지된 스타일이 바뀌면 fragment 밖의 폼(스타일 기본값)도 갱신되도록 전체 재실행한다.
+    """
+    # 한 줄 입력 (자동 프롬프트 생성)
+    user_input = st.text_input(
+        "음악 설명 (한 줄 입력)",
+        placeholder="예: 평화로운 아침의 켈틱 풍 음악",
+        help="간단히 입력하면 자동으로 프롬프트를 생성합니다. 예: '편안한 로파이 음악', '에너지 넘치는 일렉트로닉' 등",
+        key="music_user_input"
+    )
+    
+    # 생성된 프롬프트 미리보기 (체크박스는 fragment 밖에 있으므로 세션 상태에서 읽음)
+    generated_prompt = None
+    detected_style = None
+    
+    if user_input and st.session_state.get("music_auto_build", True):
+        # 실시간 프롬프트 생성 (폼 제출 전 미리보기, 입력 문구별 캐시)
+        preview_result = _auto_build_prompt(user_input.strip())
+        if preview_result["success"]:
+            preview_data = preview_result["data"]
+            generated_prompt = preview_data["prompt"]
+            detected_style = preview_data["detected_style"]
+            
+            with st.expander("📝 생성된 프롬프트 미리보기", expanded=True):
+                st.text_area(
+                    "프롬프트",
+                    value=generated_prompt,
+                    height=100,
+                    disabled=True,
+                    label_visibility="collapsed",
+                    key="preview_prompt"
+                )
+                if detected_style:
+                    st.caption(f"🎵 감지된 스타일: **{detected_style}**")
+                else:
+                    st.caption("🎵 스타일: 자동 (감지되지 않음)")
+    
+    previous_style = st.session_state.get("music_preview", (None, None))[1]
+    st.session_state.music_preview = (generated_prompt, detected_style)
+    
+    # 폼의 "음악 스타일" 기본값은 fragment 밖에서 계산되므로 앱 전체를 다시 실행
+    if detected_style != previous_style:
+        st.rerun()
+
+
+def render_music_generation(handlers: Dict[str, Any]):
     """음악 생성 페이지 렌더링"""
     st.header("Suno 음악 생성")
     
-    handlers = get_handlers()
-    
     # 크레딧 정보 표시
     credits_result = handle_get_suno_credits()
     if credits_result["success"]:
@@ -315,15 +552,10 @@ def render_music_generation():
     
     st.divider()
     
-    # 한 줄 입력 (자동 프롬프트 생성)
-    user_input = st.text_input(
-        "음악 설명 (한 줄 입력)",
-        placeholder="예: 평화로운 아침의 켈틱 풍 음악",
-        help="간단히 입력하면 자동으로 프롬프트를 생성합니다. 예: '편안한 로파이 음악', '에너지 넘치는 일렉트로닉' 등",
-        key="music_user_input"
-    )
+    # 한 줄 입력 + 프롬프트 미리보기 (입력 중에는 이 부분만 다시 실행)
+    _music_prompt_preview()
     
-    # 자동 프롬프트 생성 여부
+    # 자동 프롬프트 생성 여부 (바뀌면 폼 구성도 달라지므로 전체 재실행)
     auto_build = st.checkbox(
         "자동 프롬프트 생성 (권장)",
         value=True,
@@ -331,31 +563,8 @@ def render_music_generation():
         key="music_auto_build"
     )
     
-    # 생성된 프롬프트 미리보기
-    generated_prompt = None
-    detected_style = None
-    
-    if user_input and auto_build:
-        # 실시간 프롬프트 생성 (폼 제출 전 미리보기)
-        preview_result = handle_auto_build_prompt(user_input)
-        if preview_result["success"]:
-            preview_data = preview_result["data"]
-            generated_prompt = preview_data["prompt"]
-            detected_style = preview_data["detected_style"]
-            
-            with st.expander("📝 생성된 프롬프트 미리보기", expanded=True):
-                st.text_area(
-                    "프롬프트",
-                    value=generated_prompt,
-                    height=100,
-                    disabled=True,
-                    label_visibility="collapsed",
-                    key="preview_prompt"
-                )
-                if detected_style:
-                    st.caption(f"🎵 감지된 스타일: **{detected_style}**")
-                else:
-                    st.caption("🎵 스타일: 자동 (감지되지 않음)")
+    user_input = st.session_state.get("music_user_input", "")
+    generated_prompt, detected_style = st.session_state.get("music_preview", (None, None))
     
     # 입력 폼
     with st.form("music_generation_form"):
@@ -407,7 +616,7 @@ def render_music_generation():
         
         with col2:
             # 스타일 선택
-            styles_result = handle_get_available_styles()
+            styles_result = _music_styles()
             styles = styles_result["data"] if styles_result["success"] else []
             
             # 자동 감지된 스타일이 있으면 기본값으로 설정
@@ -526,6 +735,8 @@ def render_music_generation():
         # 결과 표시
         if result["success"]:
             data = result["data"]
+            _cached_track_list.clear()
+            _existing_files.clear()
             
             st.success(f"완료! {data['successful_songs']}곡 생성됨")
             
@@ -554,29 +765,29 @@ def render_music_generation():
             st.info(f"안내: {error['action']}")
 
 
-def render_music_list():
+def render_music_list(handlers: Dict[str, Any]):
     """음악 목록 페이지 렌더링"""
     st.title("음악 목록")
     
-    handlers = get_handlers()
-    
-    # 필터
+    # 필터 (폼으로 묶어 선택을 바꿀 때마다가 아니라 '적용' 시에만 재조회)
+    filter_options = list(_STATUS_LABELS)
     col1, col2 = st.columns([1, 3])
     with col1:
-        filter_status = st.selectbox(
-            "상태 필터",
-            ["all", "need_image", "need_video", "completed", "failed"],
-            format_func=lambda x: {
-                "all": "전체",
-                "need_image": "이미지 필요",
-                "need_video": "영상 필요",
-                "completed": "완료",
-                "failed": "실패"
-            }[x]
-        )
+        with st.form("filter_form"):
+            chosen = st.selectbox(
+                "상태 필터",
+                filter_options,
+                index=filter_options.index(st.session_state.music_filter),
+                format_func=_STATUS_LABELS.__getitem__
+            )
+            if st.form_submit_button("적용"):
+                # 위젯 키가 아닌 별도 세션 값에 저장 (다른 페이지를 다녀와도 유지)
+                st.session_state.music_filter = chosen
+    
+    filter_status = st.session_state.music_filter
     
     # 트랙 목록 조회
-    result = handle_get_track_list(handlers["db"], filter_status)
+    result = _cached_track_list(filter_status)
     
     if not result["success"]:
         error = result["error"]
@@ -591,76 +802,105 @@ def render_music_list():
     
     st.write(f"**총 {len(tracks)}개 트랙**")
     
-    # 트랙 목록 표시
-    for track in tracks:
-        track_id = track["track_id"]
-        music_info = track.get("music", {})
-        image_info = track.get("image", {})
-        video_info = track.get("video", {})
-        
-        duration = music_info.get("duration_seconds", 0)
+    # 페이지 단위로 표시 (재실행마다 전체 트랙의 위젯을 만들지 않도록)
+    page_count = (len(tracks) - 1) // MUSIC_LIST_PAGE_SIZE + 1
+    page = 1
+    if page_count > 1:
+        with col2:
+            page = st.number_input("페이지", min_value=1, max_value=page_count, value=1, step=1)
+    start = (page - 1) * MUSIC_LIST_PAGE_SIZE
+    
+    # 이미지 스타일 (행마다 조회하지 않도록 한 번만)
+    style_result = _image_styles()
+    
+    # 트랙 목록 표시 (길이 표시는 페이지 단위로 한 번에 변환)
+    page_tracks = tracks[start:start + MUSIC_LIST_PAGE_SIZE]
+    duration_labels = format_durations(
+        [t.get("music", {}).get("duration_seconds") for t in page_tracks]
+    )
+    for track, duration_label in zip(page_tracks, duration_labels):
+        _render_track_row(track, handlers, style_result, duration_label)
+
+
+@_fragment
+def _render_track_row(
+    track: Dict[str, Any],
+    handlers: Dict[str, Any],
+    style_result: Dict[str, Any],
+    duration_label: str
+):
+    """음악 목록의 트랙 한 행 (fragment: 이 행의 위젯 조작은 이 행만 다시 실행)"""
+    track_id = track["track_id"]
+    music_info = track.get("music", {})
+    image_info = track.get("image", {})
+    video_info = track.get("video", {})
+    
+    with st.expander(f"{track_id} - {duration_label}"):
+        col1, col2, col3 = st.columns([2, 1, 1])
         
-        with st.expander(f"{track_id} - {format_duration(duration)}"):
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                music_status = "완료" if music_info.get("status") == "completed" else "대기"
-                image_status = "완료" if image_info.get("status") == "completed" else "대기"
-                video_status = "완료" if video_info.get("status") == "completed" else "대기"
-                
-                st.write(f"**상태:** 음악 {music_status} | 이미지 {image_status} | 영상 {video_status}")
-                
-                if music_info.get("suno_prompt"):
-                    st.caption(f"프롬프트: {music_info['suno_prompt'][:100]}...")
+        with col1:
+            music_status = "완료" if music_info.get("status") == "completed" else "대기"
+            image_status = "완료" if image_info.get("status") == "completed" else "대기"
+            video_status = "완료" if video_info.get("status") == "completed" else "대기"
             
-            with col2:
-                if image_info.get("status") != "completed":
-                    if st.button("이미지 생성", key=f"img_{track_id}"):
-                        with st.spinner("이미지 생성 중..."):
-                            style_result = handle_get_image_styles()
-                            if style_result["success"]:
-                                styles = style_result["data"]
-                                if styles:
-                                    result = handle_generate_image_single(
-                                        track_id, styles[0], handlers["image_gen"], handlers["db"]
-                                    )
-                                    if result["success"]:
-                                        st.success("이미지 생성 완료!")
-                                        st.rerun()
-                                    else:
-                                        error = result["error"]
-                                        st.error(f"{error['message']}")
+            st.write(f"**상태:** 음악 {music_status} | 이미지 {image_status} | 영상 {video_status}")
             
-            with col3:
-                if image_info.get("status") == "completed" and video_info.get("status") != "completed":
-                    if st.button("영상 생성", key=f"vid_{track_id}"):
-                        with st.spinner("영상 렌더링 중..."):
-                            result = handle_render_video_single(
-                                track_id, {}, handlers["video_renderer"], handlers["db"]
-                            )
-                            if result["success"]:
-                                st.success("영상 생성 완료!")
-                                st.rerun()
-                            else:
-                                error = result["error"]
-                                st.error(f"{error['message']}")
+            if music_info.get("suno_prompt"):
+                st.caption(f"프롬프트: {music_info['suno_prompt'][:100]}...")
+        
+        with col2:
+            if image_info.get("status") != "completed":
+                if st.button("이미지 생성", key=f"img_{track_id}"):
+                    with st.spinner("이미지 생성 중..."):
+                        if style_result["success"]:
+                            styles = style_result["data"]
+                            if styles:
+                                result = handle_generate_image_single(
+                                    track_id, styles[0], handlers["image_gen"], handlers["db"]
+                                )
+                                if result["success"]:
+                                    st.success("이미지 생성 완료!")
+                                    _cached_track_list.clear()
+                                    _existing_files.clear()
+                                    st.rerun()
+                                else:
+                                    error = result["error"]
+                                    st.error(f"{error['message']}")
+        
+        with col3:
+            if image_info.get("status") == "completed" and video_info.get("status") != "completed":
+                if st.button("영상 생성", key=f"vid_{track_id}"):
+                    with st.spinner("영상 렌더링 중..."):
+                        result = handle_render_video_single(
+                            track_id, {}, handlers["video_renderer"], handlers["db"]
+                        )
+                        if result["success"]:
+                            st.success("영상 생성 완료!")
+                            _cached_track_list.clear()
+                            _existing_files.clear()
+                            st.rerun()
+                        else:
+                            error = result["error"]
+                            st.error(f"{error['message']}")
 
 
 # ─────────────────────────────────────────
 # 이미지 생성 페이지
 # ─────────────────────────────────────────
 
-def render_image_generator():
+def render_image_generator(handlers: Dict[str, Any]):
     """이미지 생성 페이지 렌더링"""
     st.title("이미지 생성")
     
-    handlers = get_handlers()
+    # 전체 트랙은 한 번만 조회해 미리보기 선택지와 갤러리에서 같이 사용
+    all_result = _cached_track_list("all")
+    all_tracks = all_result["data"] if all_result["success"] else []
     
     # 스타일 선택
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        style_result = handle_get_image_styles(handlers["prompt_builder"])
+        style_result = _image_styles()
         if not style_result["success"]:
             st.error("스타일 목록을 불러올 수 없습니다.")
             return
@@ -678,13 +918,11 @@ def render_image_generator():
         # 프롬프트 미리보기 (예시 트랙)
         preview_track = st.selectbox(
             "프롬프트 미리보기 (트랙 선택)",
-            ["없음"] + [t["track_id"] for t in handle_get_track_list(handlers["db"], "all")["data"][:10]]
+            ["없음"] + [t["track_id"] for t in all_tracks[:10]]
         )
         
         if preview_track != "없음":
-            preview_result = handle_preview_image_prompt(
-                preview_track, style, handlers["prompt_builder"], handlers["db"]
-            )
+            preview_result = _preview_prompt(preview_track, style)
             if preview_result["success"]:
                 st.text_area("프롬프트 미리보기", preview_result["data"], height=100, disabled=True)
     
@@ -693,26 +931,43 @@ def render_image_generator():
     # 대상 트랙 선택
     st.subheader("대상 트랙 선택")
     
-    pending_result = handle_get_track_list(handlers["db"], "need_image")
-    if not pending_result["success"]:
+    if not all_result["success"]:
         st.error("트랙 목록을 불러올 수 없습니다.")
         return
     
-    pending_tracks = pending_result["data"]
+    # 이미지가 필요한 트랙은 이미 조회한 전체 목록에서 추림 (need_image 필터와 같은 기준)
+    pending_ids = [
+        t["track_id"] for t in all_tracks
+        if t.get("image", {}).get("status") == "pending"
+    ]
     
-    if not pending_tracks:
+    if not pending_ids:
         st.info("이미지가 필요한 트랙이 없습니다.")
         return
     
-    st.write(f"**{len(pending_tracks)}개 트랙이 이미지를 필요로 합니다.**")
-    
-    # 체크박스로 선택
-    selected = []
-    cols = st.columns(5)
-    for i, track in enumerate(pending_tracks[:50]):  # 최대 50개만 표시
-        with cols[i % 5]:
-            if st.checkbox(track["track_id"], key=f"sel_{track['track_id']}"):
-                selected.append(track["track_id"])
+    st.write(f"**{len(pending_ids)}개 트랙이 이미지를 필요로 합니다.**")
+    
+    selected: List[str] = []
+    if st.checkbox("트랙 목록 펼치기", key="image_show_list"):
+        # 선택 표 (위젯 하나로 전체 선택 상태 관리)
+        select_df = pd.DataFrame({
+            "select": False,
+            "track_id": pending_ids[:IMAGE_SELECT_MAX_ROWS]
+        })
+        if len(pending_ids) > IMAGE_SELECT_MAX_ROWS:
+            st.caption(f"앞 {IMAGE_SELECT_MAX_ROWS}개만 표시합니다. 나머지는 '전체 생성'으로 처리하세요.")
+        edited = st.data_editor(
+            select_df,
+            column_config={
+                "select": st.column_config.CheckboxColumn("선택"),
+                "track_id": st.column_config.TextColumn("트랙 ID")
+            },
+            disabled=["track_id"],
+            hide_index=True,
+            use_container_width=True,
+            key="image_select"
+        )
+        selected = edited.loc[edited["select"], "track_id"].tolist()
     
     st.divider()
     
@@ -728,25 +983,35 @@ def render_image_generator():
     
     with col2:
         if st.button("전체 생성"):
-            all_ids = [t["track_id"] for t in pending_tracks]
-            run_image_batch(all_ids, style, handlers, force)
+            run_image_batch(pending_ids, style, handlers, force)
     
     st.divider()
     
     # 생성된 이미지 갤러리
     st.subheader("생성된 이미지")
-    display_image_gallery(handlers["db"])
+    display_image_gallery(all_tracks)
 
 
 def run_image_batch(track_ids: List[str], style: str, handlers: Dict, force: bool):
     """배치 이미지 생성 실행"""
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    progress_slot = st.empty()
+    render_progress(progress_slot, 0)
+    last_update = {"ts": 0.0, "msg": None}
     
     def progress_callback(current, total, track_id, status):
+        # 직전과 같은 내용이면 다시 그리지 않음 (진행 수가 메시지에 포함되어 있음)
+        status_msg = f"처리 중: {track_id} ({current}/{total}) - {status}"
+        if status_msg == last_update["msg"]:
+            return
+        
+        now = time.monotonic()
+        if current < total and now - last_update["ts"] < PROGRESS_MIN_INTERVAL:
+            return
+        last_update["ts"] = now
+        last_update["msg"] = status_msg
+        
         progress = current / total if total > 0 else 0
-        progress_bar.progress(progress)
-        status_text.text(f"처리 중: {track_id} ({current}/{total}) - {status}")
+        render_progress(progress_slot, progress, status_msg)
     
     result = handle_generate_image_batch(
         track_ids, style, handlers["image_gen"], handlers["db"],
@@ -756,6 +1021,8 @@ def run_image_batch(track_ids: List[str], style: str, handlers: Dict, force: boo
     if result["success"]:
         data = result["data"]
         st.success(f"완료! 성공: {data.get('successful', 0)}, 실패: {data.get('failed', 0)}, 스킵: {data.get('skipped', 0)}")
+        _cached_track_list.clear()
+        _existing_files.clear()
         st.rerun()
     else:
         error = result["error"]
@@ -763,13 +1030,13 @@ def run_image_batch(track_ids: List[str], style: str, handlers: Dict, force: boo
         st.info(f"안내: {error['action']}")
 
 
-def display_image_gallery(db):
-    """이미지 갤러리 표시"""
-    result = handle_get_track_list(db, "all")
-    if not result["success"]:
-        return
+def display_image_gallery(tracks: List[Dict[str, Any]]):
+    """
+    이미지 갤러리 표시
     
-    tracks = result["data"]
+    Args:
+        tracks: 전체 트랙 리스트 (호출부에서 조회한 목록 재사용)
+    """
     image_tracks = [t for t in tracks if t.get("image", {}).get("status") == "completed"]
     
     if not image_tracks:
@@ -781,22 +1048,24 @@ def display_image_gallery(db):
     for i, track in enumerate(image_tracks[:20]):  # 최대 20개만 표시
         with cols[i % 4]:
             image_path = track.get("image", {}).get("file_path")
-            if image_path and Path(image_path).exists():
-                st.image(image_path, caption=track["track_id"], use_container_width=True)
+            if _file_exists(image_path):
+                try:
+                    thumb = _thumb(image_path, os.path.getmtime(image_path))
+                except OSError:
+                    continue
+                st.image(thumb, caption=track["track_id"], use_container_width=True)
 
 
 # ─────────────────────────────────────────
 # 영상 렌더링 페이지
 # ─────────────────────────────────────────
 
-def render_video_page():
+def render_video_page(handlers: Dict[str, Any]):
     """영상 렌더링 페이지 렌더링"""
     st.title("영상 렌더링")
     
-    handlers = get_handlers()
-    
     # FFmpeg 체크
-    ffmpeg_result = handle_check_ffmpeg(handlers["video_renderer"])
+    ffmpeg_result = _ffmpeg_status()
     if ffmpeg_result["success"]:
         ffmpeg_info = ffmpeg_result["data"]
         if not ffmpeg_info.get("ready", False):
@@ -808,17 +1077,20 @@ def render_video_page():
     
     st.divider()
     
+    # 완료 트랙 목록은 한 번만 조회해 두 탭에서 같이 사용
+    completed_result = _cached_track_list("completed")
+    
     # 탭으로 개별/통합 영상 생성 구분
     tab1, tab2 = st.tabs(["개별 영상 생성", "통합 영상 생성"])
     
     with tab1:
-        render_individual_videos(handlers)
+        render_individual_videos(handlers, completed_result)
     
     with tab2:
-        render_combined_video(handlers)
+        render_combined_video(handlers, completed_result)
 
 
-def render_individual_videos(handlers: Dict):
+def render_individual_videos(handlers: Dict, completed_result: Dict[str, Any]):
     """개별 영상 생성 섹션"""
     st.subheader("렌더링 옵션")
     col1, col2, col3 = st.columns(3)
@@ -826,12 +1098,8 @@ def render_individual_videos(handlers: Dict):
     with col1:
         resolution_option = st.selectbox(
             "해상도",
-            ["1920x1080", "1080x1920", "1080x1080"],
-            format_func=lambda x: {
-                "1920x1080": "1920x1080 (YouTube HD)",
-                "1080x1920": "1080x1920 (Shorts)",
-                "1080x1080": "1080x1080 (Instagram)"
-            }[x],
+            list(_RESOLUTION_LABELS),
+            format_func=_RESOLUTION_LABELS.__getitem__,
             key="individual_resolution"
         )
         
@@ -855,7 +1123,7 @@ def render_individual_videos(handlers: Dict):
     # 대상 트랙
     st.subheader("렌더링 대상")
     
-    pending_result = handle_get_track_list(handlers["db"], "need_video")
+    pending_result = _cached_track_list("need_video")
     if not pending_result["success"]:
         st.error("트랙 목록을 불러올 수 없습니다.")
         return
@@ -884,10 +1152,11 @@ def render_individual_videos(handlers: Dict):
     
     # 완료된 영상 목록
     st.subheader("완료된 영상")
-    display_completed_videos(handlers["db"])
+    if completed_result["success"]:
+        display_completed_videos(completed_result["data"])
 
 
-def render_combined_video(handlers: Dict):
+def render_combined_video(handlers: Dict, completed_result: Dict[str, Any]):
     """통합 영상 생성 섹션 (여러 곡을 하나의 영상으로 합치기)"""
     st.subheader("통합 영상 생성")
     st.info("여러 곡을 하나의 영상으로 합칩니다. 곡이 바뀔 때 이미지도 자동으로 전환됩니다.")
@@ -899,12 +1168,8 @@ def render_combined_video(handlers: Dict):
     with col1:
         resolution_option = st.selectbox(
             "해상도",
-            ["1920x1080", "1080x1920", "1080x1080"],
-            format_func=lambda x: {
-                "1920x1080": "1920x1080 (YouTube HD)",
-                "1080x1920": "1080x1920 (Shorts)",
-                "1080x1080": "1080x1080 (Instagram)"
-            }[x],
+            list(_RESOLUTION_LABELS),
+            format_func=_RESOLUTION_LABELS.__getitem__,
             key="combined_resolution"
         )
         
@@ -924,21 +1189,18 @@ def render_combined_video(handlers: Dict):
     
     st.divider()
     
-    # 완료된 트랙 목록 가져오기 (이미지와 음악이 모두 있는 트랙)
-    result = handle_get_track_list(handlers["db"], "completed")
-    if not result["success"]:
+    # 완료된 트랙 목록 (이미지와 음악이 모두 있는 트랙)
+    if not completed_result["success"]:
         st.error("트랙 목록을 불러올 수 없습니다.")
         return
     
-    all_tracks = result["data"]
+    all_tracks = completed_result["data"]
     # 이미지와 음악이 모두 있는 트랙만 필터링
     available_tracks = [
         t for t in all_tracks
         if t.get("image", {}).get("status") == "completed" and
-           t.get("music", {}).get("file_path") and
-           Path(t.get("music", {}).get("file_path")).exists() and
-           t.get("image", {}).get("file_path") and
-           Path(t.get("image", {}).get("file_path")).exists()
+           _file_exists(t.get("music", {}).get("file_path")) and
+           _file_exists(t.get("image", {}).get("file_path"))
     ]
     
     if len(available_tracks) < 2:
@@ -1075,15 +1337,26 @@ def seconds_to_mmss(seconds: float) -> str:
 
 def run_video_batch(tracks: List[Dict], options: Dict, handlers: Dict):
     """배치 영상 렌더링 실행"""
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    progress_slot = st.empty()
+    render_progress(progress_slot, 0)
+    last_update = {"ts": 0.0, "msg": None}
     
     track_ids = [t["track_id"] for t in tracks]
     
     def progress_callback(current, total, track_id, status, eta=None):
+        # 직전과 같은 내용이면 다시 그리지 않음 (진행 수가 메시지에 포함되어 있음)
+        status_msg = f"처리 중: {track_id} ({current}/{total}) - {status}"
+        if status_msg == last_update["msg"]:
+            return
+        
+        now = time.monotonic()
+        if current < total and now - last_update["ts"] < PROGRESS_MIN_INTERVAL:
+            return
+        last_update["ts"] = now
+        last_update["msg"] = status_msg
+        
         progress = current / total if total > 0 else 0
-        progress_bar.progress(progress)
-        status_text.text(f"처리 중: {track_id} ({current}/{total}) - {status}")
+        render_progress(progress_slot, progress, status_msg)
     
     result = handle_render_video_batch(
         track_ids, options, handlers["video_renderer"], handlers["db"],
@@ -1093,6 +1366,8 @@ def run_video_batch(tracks: List[Dict], options: Dict, handlers: Dict):
     if result["success"]:
         data = result["data"]
         st.success(f"완료! 성공: {data.get('successful', 0)}, 실패: {data.get('failed', 0)}, 스킵: {data.get('skipped', 0)}")
+        _cached_track_list.clear()
+        _existing_files.clear()
         st.rerun()
     else:
         error = result["error"]
@@ -1100,14 +1375,13 @@ def run_video_batch(tracks: List[Dict], options: Dict, handlers: Dict):
         st.info(f"안내: {error['action']}")
 
 
-def display_completed_videos(db):
-    """완료된 영상 목록 표시"""
-    result = handle_get_track_list(db, "completed")
-    if not result["success"]:
-        return
-    
-    tracks = result["data"]
+def display_completed_videos(tracks: List[Dict[str, Any]]):
+    """
+    완료된 영상 목록 표시
     
+    Args:
+        tracks: 완료 트랙 리스트 (호출부에서 조회한 목록 재사용)
+    """
     if not tracks:
         st.info("완료된 영상이 없습니다.")
         return
@@ -1124,7 +1398,7 @@ def display_completed_videos(db):
                 st.write(f"**{track['track_id']}**")
                 st.caption(f"경로: {video_path}")
             with col2:
-                if Path(video_path).exists():
+                if _file_exists(video_path):
                     st.success("파일 존재")
                 else:
                     st.warning("파일 없음")
@@ -1134,8 +1408,17 @@ def display_completed_videos(db):
 # 실패 작업 관리 UI
 # ─────────────────────────────────────────
 
+def _rerun_fragment():
+    """현재 fragment만 다시 실행 (scope 인자를 지원하지 않는 버전에서는 전체 재실행)"""
+    try:
+        st.rerun(scope="fragment")
+    except TypeError:
+        st.rerun()
+
+
+@_fragment
 def render_failed_tasks_section(handlers: Dict[str, Any]):
-    """실패 작업 섹션 렌더링"""
+    """실패 작업 섹션 렌더링 (fragment: 버튼 조작은 이 섹션만 다시 실행)"""
     failed_result = handle_get_failed_tasks(handlers["failed_db"])
     
     if not failed_result["success"]:
@@ -1156,6 +1439,8 @@ def render_failed_tasks_section(handlers: Dict[str, Any]):
         retry_result = handle_retry_all_failed(handlers["pipeline"])
         if retry_result["success"]:
             st.success("재시도가 시작되었습니다.")
+            _cached_track_list.clear()
+            _existing_files.clear()
             st.rerun()
         else:
             error = retry_result["error"]
@@ -1189,6 +1474,8 @@ def render_failed_tasks_section(handlers: Dict[str, Any]):
                         )
                         if retry_result["success"]:
                             st.success("재시도가 시작되었습니다.")
+                            _cached_track_list.clear()
+                            _existing_files.clear()
                             st.rerun()
                         else:
                             error = retry_result["error"]
@@ -1201,7 +1488,8 @@ def render_failed_tasks_section(handlers: Dict[str, Any]):
                         )
                         if remove_result["success"]:
                             st.success("실패 작업이 제거되었습니다.")
-                            st.rerun()
+                            # 트랙 상태는 그대로이므로 통계 카드는 다시 그리지 않음
+                            _rerun_fragment()
                         else:
                             error = remove_result["error"]
                             st.error(f"{error['message']}")
@@ -1546,7 +1834,8 @@ def render_settings():
     # 저장 버튼
     if st.button("설정 저장", type="primary"):
         # 설정 업데이트 (API 키는 .env에 저장해야 하지만 여기서는 config만 업데이트)
-        updated_config = config.copy()
+        # load_config() 캐시 딕셔너리를 건드리지 않도록 중첩 구조까지 복사
+        updated_config = copy.deepcopy(config)
         
         if suno_key and not suno_key.startswith("*"):
             updated_config["suno"]["api_key"] = suno_key
@@ -1579,15 +1868,34 @@ def main():
     """메인 함수"""
     # 테마 스위처 제거 (Light Theme만 사용)
     
-    # 사이드바 네비게이션 (버튼 형태)
-    # 현재 페이지 확인
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "대시보드"
+    # 세션 상태 초기화 (한 곳에서만)
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     
-    # 메뉴 버튼들
-    pages = ["대시보드", "음악 생성", "음악 목록", "이미지 생성", "영상 렌더링", "설정"]
+    # 핸들러는 실행당 한 번만 조회
+    handlers = get_handlers()
+    
+    # 페이지 이름 → (URL 경로, 렌더링 함수)
+    page_routes = {
+        "대시보드": ("dashboard", lambda: render_dashboard(handlers)),
+        "음악 생성": ("music_generation", lambda: render_music_generation(handlers)),
+        "음악 목록": ("music_list", lambda: render_music_list(handlers)),
+        "이미지 생성": ("images", lambda: render_image_generator(handlers)),
+        "영상 렌더링": ("videos", lambda: render_video_page(handlers)),
+        "설정": ("settings", render_settings),
+    }
+    
+    if hasattr(st, "navigation"):
+        # 멀티페이지 네비게이션 (선택된 페이지만 실행, 페이지별 URL)
+        nav = st.navigation([
+            st.Page(render, title=title, url_path=url_path, default=(title == "대시보드"))
+            for title, (url_path, render) in page_routes.items()
+        ])
+        nav.run()
+        return
     
-    for page_name in pages:
+    # st.navigation을 지원하지 않는 버전: 사이드바 버튼 + 세션 상태로 페이지 선택
+    for page_name in page_routes:
         is_selected = st.session_state.current_page == page_name
         button_type = "primary" if is_selected else "secondary"
         
@@ -1601,20 +1909,8 @@ def main():
             st.rerun()
     
     # 페이지 렌더링
-    page = st.session_state.current_page
-    
-    if page == "대시보드":
-        render_dashboard()
-    elif page == "음악 생성":
-        render_music_generation()
-    elif page == "음악 목록":
-        render_music_list()
-    elif page == "이미지 생성":
-        render_image_generator()
-    elif page == "영상 렌더링":
-        render_video_page()
-    elif page == "설정":
-        render_settings()
+    _, render = page_routes[st.session_state.current_page]
+    render()
 
 
 if __name__ == "__main__":
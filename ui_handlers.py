@@ -4,8 +4,10 @@ Streamlit UI의 비즈니스 로직 처리
 모든 Pipeline/DB/모듈 호출은 여기서 처리
 """
 
+import queue
+import threading
 from typing import Dict, List, Optional, Any, Callable
-from main import Pipeline
+from main import Pipeline, PipelineCancelled
 from db_manager import TrackDB, FailedTasksDB
 from image_generator import ImageGenerator
 from video_renderer import FFmpegRenderer
@@ -29,11 +31,15 @@ def init_handlers() -> Dict[str, Any]:
     """
     try:
         config = load_config()
+        pipeline = Pipeline()
         return {
             "config": config,
-            "db": TrackDB(),
-            "failed_db": FailedTasksDB(),
-            "pipeline": Pipeline(),
+            # 백그라운드 파이프라인과 같은 DB 인스턴스를 공유
+            # (TrackDB는 로드한 내용을 메모리에 유지하므로 별도 인스턴스면 서로의 변경을 못 보고 덮어씀)
+            "db": pipeline.db,
+            "failed_db": pipeline.failed_db,
+            "pipeline": pipeline,
+            "pipeline_worker": PipelineWorker(pipeline),
             "image_gen": ImageGenerator(config=config),
             "video_renderer": FFmpegRenderer(config=config),
             "prompt_builder": ImagePromptBuilder()
@@ -89,6 +95,111 @@ def handle_run_full_pipeline(
         return {"success": False, "error": format_error(e, "pipeline")}
 
 
+class PipelineWorker:
+    """
+    파이프라인을 백그라운드 스레드에서 실행하는 작업자
+    
+    UI 스크립트는 실행을 시작만 하고 바로 반환하며, 진행 상황은 큐로 전달되어
+    UI가 주기적으로 poll()해서 표시한다. 한 번에 하나의 실행만 허용한다.
+    """
+    
+    def __init__(self, pipeline: Pipeline):
+        """
+        PipelineWorker 초기화
+        
+        Args:
+            pipeline: 실행할 Pipeline 인스턴스
+        """
+        self.pipeline = pipeline
+        self.progress_q: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.last_progress: Optional[Dict[str, Any]] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.run_count = 0  # 완료된 실행 수 (UI가 새 결과를 감지하는 데 사용)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
+        # 파이프라인이 단계 사이와 진행 보고 시점에 직접 확인
+        pipeline.set_cancel_event(self.cancel_event)
+    
+    def is_running(self) -> bool:
+        """실행 중 여부"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, options: Dict[str, Any]) -> bool:
+        """
+        파이프라인 실행 시작
+        
+        Args:
+            options: 파이프라인 옵션
+        
+        Returns:
+            시작 여부 (이미 실행 중이면 False)
+        """
+        with self._lock:
+            if self.is_running():
+                return False
+            
+            self.cancel_event.clear()
+            self.last_progress = None
+            self.result = None
+            while not self.progress_q.empty():
+                self.progress_q.get_nowait()
+            
+            self._thread = threading.Thread(
+                target=self._run, args=(options,), name="pipeline_worker", daemon=True
+            )
+            self._thread.start()
+            return True
+    
+    def cancel(self) -> None:
+        """실행 취소 요청 (다음 단계 전환 또는 진행 보고 시점에 중단)"""
+        self.cancel_event.set()
+    
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """
+        쌓인 진행 상황을 비우고 가장 최근 항목 반환
+        
+        Returns:
+            {"stage", "current", "total", "track_id", "eta", "message"} 또는 None
+        """
+        try:
+            while True:
+                self.last_progress = self.progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        return self.last_progress
+    
+    def _on_progress(self, stage, current, total, track_id=None, eta=None, message=None) -> None:
+        """파이프라인 진행 콜백 (작업 스레드에서 호출, 취소 확인은 Pipeline이 담당)"""
+        self.progress_q.put_nowait({
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "track_id": track_id,
+            "eta": eta,
+            "message": message
+        })
+    
+    def _run(self, options: Dict[str, Any]) -> None:
+        """작업 스레드 본문"""
+        try:
+            self.result = handle_run_full_pipeline(
+                self.pipeline, options, progress_callback=self._on_progress
+            )
+        except PipelineCancelled:
+            # Pipeline이 처리하지 않는 경로(단계별 실행 등)에서 올라온 취소
+            self.result = {
+                "success": True,
+                "data": {"success": False, "error": "사용자 중단", "interrupted": True}
+            }
+        except Exception as e:
+            logger.error(f"백그라운드 파이프라인 실패: {e}", exc_info=True)
+            self.result = {"success": False, "error": format_error(e, "pipeline")}
+        finally:
+            self.run_count += 1
+
+
 # ─────────────────────────────────────────
 # 음악 목록 핸들러
 # ─────────────────────────────────────────